@@ -10,6 +10,7 @@ from config import Settings, APIKeys
 from app_utils.text_processing import extract_text_from_file, clean_text, count_action_verbs
 from app_utils.analysis_utils import extract_top_keywords, match_skills, semantic_similarity, generate_recommendations
 from modules.skill_analyzer import skill_analyzer
+from modules.question_bank import question_bank  # builds the question index at startup
 from app_utils.ui import setup_page_styling, get_ai_animation, card
 from streamlit_lottie import st_lottie
 
@@ -0,0 +1,190 @@
+"""
+GitHub REST client
+Pooled requests session with ETag-validated response caching and X-RateLimit
+tracking. A cached response is revalidated with If-None-Match, and a 304 does
+not download the body again. When the quota is exhausted, calls are delayed
+until the reset (if it is close) or answered from the cache.
+"""
+
+import json
+import time
+import hashlib
+import threading
+from urllib.parse import urlencode
+import requests
+from requests.adapters import HTTPAdapter
+from app_utils.http_cache import DiskCache
+
+
+class GitHubError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class RateLimitExceeded(GitHubError):
+    def __init__(self, reset_at: float):
+        super().__init__(403, "GitHub API rate limit exceeded")
+        self.reset_at = reset_at
+
+
+class RateLimitTracker:
+    """Latest X-RateLimit-* values per resource ("core", "search", "graphql", ...)."""
+
+    def __init__(self):
+        self._limits = {}
+        self._lock = threading.Lock()
+
+    def update(self, headers):
+        if "X-RateLimit-Remaining" not in headers:
+            return
+        resource = headers.get("X-RateLimit-Resource", "core")
+        try:
+            entry = {
+                "limit": int(headers.get("X-RateLimit-Limit", 0)),
+                "remaining": int(headers["X-RateLimit-Remaining"]),
+                "reset": float(headers.get("X-RateLimit-Reset", 0)),
+            }
+        except ValueError:
+            return
+        with self._lock:
+            previous = self._limits.get(resource)
+            if previous is not None and previous["reset"] == entry["reset"]:
+                # Concurrent responses arrive out of order; within a window the lowest count is current
+                entry["remaining"] = min(entry["remaining"], previous["remaining"])
+            self._limits[resource] = entry
+
+    def exhaust(self, resource: str, reset_at: float):
+        """Record a rejection (403/429) so further calls wait instead of failing too."""
+        with self._lock:
+            entry = self._limits.setdefault(resource, {"limit": 0, "remaining": 0, "reset": reset_at})
+            entry["remaining"] = 0
+            entry["reset"] = max(entry["reset"], reset_at)
+
+    def wait_time(self, resource: str = "core") -> float:
+        """Seconds until a call may be made; 0 while quota remains or nothing is known."""
+        with self._lock:
+            entry = self._limits.get(resource)
+        if entry is None or entry["remaining"] > 0:
+            return 0.0
+        return max(0.0, entry["reset"] - time.time())
+
+    def reserve(self, resource: str = "core"):
+        """Count a request against the local view so parallel callers do not overshoot."""
+        with self._lock:
+            entry = self._limits.get(resource)
+            if entry is not None and entry["remaining"] > 0:
+                entry["remaining"] -= 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {name: dict(entry) for name, entry in self._limits.items()}
+
+
+class GitHubClient:
+    """
+    GET-only GitHub REST client.
+    Every 200 response is cached on disk with its ETag; later requests for the
+    same URL are conditional. `max_wait` is the longest the client will sleep
+    for a rate-limit reset; beyond that, the cached copy is returned or
+    RateLimitExceeded is raised.
+    """
+
+    def __init__(self, base_url: str, token: str = "", cache_dir: str = None,
+                 timeout=(5, 15), pool_size: int = 8, max_wait: float = 10):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.max_wait = max_wait
+        self.cache = DiskCache(cache_dir) if cache_dir else None
+        self.rate = RateLimitTracker()
+        self.session = requests.Session()
+        self.session.headers.update({
+            "Accept": "application/vnd.github+json",
+            "X-GitHub-Api-Version": "2022-11-28",
+            "User-Agent": "smart-resume-analyzer",
+        })
+        if token:
+            self.session.headers["Authorization"] = f"Bearer {token}"
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        # Cached responses are per identity: authenticated calls can see more
+        self._identity = hashlib.sha256(token.encode("utf-8")).hexdigest()[:12] if token else "anonymous"
+        self.stats = {"requests": 0, "not_modified": 0, "stale": 0}
+        self._lock = threading.Lock()
+
+    def _count(self, key):
+        with self._lock:
+            self.stats[key] += 1
+
+    def url(self, path: str, params: dict = None) -> str:
+        url = path if path.startswith("http") else f"{self.base_url}/{path.lstrip('/')}"
+        return f"{url}?{urlencode(params)}" if params else url
+
+    def get(self, path: str, params: dict = None):
+        """(parsed JSON, response headers dict) for a GET, served from cache on 304."""
+        url = self.url(path, params)
+        key = f"{self._identity} {url}"
+        entry = self.cache.get(key) if self.cache else None
+
+        wait = self.rate.wait_time()
+        if wait > 0:
+            if entry is not None:
+                self._count("stale")
+                return json.loads(entry[1]), entry[0].get("headers", {})
+            if wait > self.max_wait:
+                raise RateLimitExceeded(time.time() + wait)
+            time.sleep(wait)
+
+        headers = {}
+        if entry is not None and entry[0].get("etag"):
+            headers["If-None-Match"] = entry[0]["etag"]
+
+        self.rate.reserve()
+        response = self.session.get(url, headers=headers, timeout=self.timeout)
+        self._count("requests")
+        self.rate.update(response.headers)
+
+        if response.status_code == 304 and entry is not None:
+            self._count("not_modified")
+            return json.loads(entry[1]), entry[0].get("headers", {})
+
+        if response.status_code in (403, 429) and self._is_rate_limited(response):
+            reset_at = self._reset_time(response)
+            self.rate.exhaust(response.headers.get("X-RateLimit-Resource", "core"), reset_at)
+            if entry is not None:
+                self._count("stale")
+                return json.loads(entry[1]), entry[0].get("headers", {})
+            raise RateLimitExceeded(reset_at)
+
+        if response.status_code >= 400:
+            try:
+                message = response.json().get("message", response.reason)
+            except ValueError:
+                message = response.reason
+            raise GitHubError(response.status_code, message)
+
+        kept = {name: response.headers[name] for name in ("Link",) if name in response.headers}
+        if self.cache is not None and response.headers.get("ETag"):
+            self.cache.put(key, {"etag": response.headers["ETag"], "headers": kept}, response.content)
+        return response.json(), kept
+
+    @staticmethod
+    def _is_rate_limited(response) -> bool:
+        return (
+            response.headers.get("X-RateLimit-Remaining") == "0"
+            or "Retry-After" in response.headers
+            or "rate limit" in response.text.lower()
+        )
+
+    @staticmethod
+    def _reset_time(response) -> float:
+        if "Retry-After" in response.headers:
+            try:
+                return time.time() + float(response.headers["Retry-After"])
+            except ValueError:
+                pass
+        try:
+            return float(response.headers.get("X-RateLimit-Reset", 0)) or time.time() + 60
+        except ValueError:
+            return time.time() + 60
@@ -0,0 +1,126 @@
+"""
+Main-content extraction for arbitrary HTML pages
+Single-pass, streaming text-density heuristic: no DOM tree is built, so heavy
+pages cost one linear scan instead of a full BeautifulSoup parse.
+"""
+
+import re
+from html.parser import HTMLParser
+
+# Content inside these is never part of a job description. Wrappers such as
+# form or aside can hold the posting itself, so they are left to the scoring.
+SKIP_TAGS = {"script", "style", "nav", "footer", "header", "noscript", "svg", "iframe", "template"}
+# Elements that can "own" text and compete to be the main block
+BLOCK_TAGS = {"body", "main", "article", "section", "div", "td"}
+# Elements that end a line of text
+BREAK_TAGS = BLOCK_TAGS | {"p", "br", "li", "ul", "ol", "tr", "table", "h1", "h2", "h3", "h4", "h5", "h6", "dd", "dt"}
+
+POSITIVE_HINTS = re.compile(r"job|description|posting|content|details|vacancy|position|requirements", re.I)
+NEGATIVE_HINTS = re.compile(r"comment|sidebar|footer|nav|menu|cookie|related|share|social|banner|promo|modal", re.I)
+
+
+class _Block:
+    __slots__ = ("tag", "start", "end", "text", "links", "weight")
+
+    def __init__(self, tag, start, weight):
+        self.tag = tag
+        self.start = start  # index into the shared text pieces
+        self.end = None
+        self.text = 0.0  # characters credited to this block
+        self.links = 0.0  # of which inside <a>
+        self.weight = weight
+
+    def score(self) -> float:
+        if not self.text:
+            return 0.0
+        link_density = self.links / self.text
+        return self.text * (1 - link_density) * self.weight
+
+
+class DensityExtractor(HTMLParser):
+    """
+    Text of a node credits its nearest enclosing block in full and the block above
+    that by half (so a wrapper around several content sections can win). The block
+    with the best link-density-adjusted score is the main content.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.pieces = []
+        self._stack = []
+        self._closed = []
+        self._skip = 0
+        self._in_link = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in SKIP_TAGS:
+            self._skip += 1
+            return
+        if self._skip:
+            return
+        if tag == "a":
+            self._in_link += 1
+        if tag in BREAK_TAGS:
+            self.pieces.append("\n")
+        if tag in BLOCK_TAGS:
+            hints = " ".join(v for k, v in attrs if k in ("id", "class") and v)
+            weight = 1.0
+            if tag in ("main", "article"):
+                weight *= 1.5
+            if hints and POSITIVE_HINTS.search(hints):
+                weight *= 1.5
+            if hints and NEGATIVE_HINTS.search(hints):
+                weight *= 0.3
+            self._stack.append(_Block(tag, len(self.pieces), weight))
+
+    def handle_endtag(self, tag):
+        if tag in SKIP_TAGS:
+            self._skip = max(0, self._skip - 1)
+            return
+        if self._skip:
+            return
+        if tag == "a":
+            self._in_link = max(0, self._in_link - 1)
+        if tag in BREAK_TAGS:
+            self.pieces.append("\n")
+        if tag in BLOCK_TAGS:
+            # Tolerate unclosed children: pop until the matching block
+            for i in range(len(self._stack) - 1, -1, -1):
+                if self._stack[i].tag == tag:
+                    while len(self._stack) > i:
+                        self._close(self._stack.pop())
+                    break
+
+    def handle_data(self, data):
+        if self._skip:
+            return
+        text = data.strip()
+        if not text:
+            return
+        self.pieces.append(data)
+        size = len(text)
+        for share, block in zip((1.0, 0.5), reversed(self._stack)):
+            block.text += size * share
+            if self._in_link:
+                block.links += size * share
+
+    def _close(self, block):
+        block.end = len(self.pieces)
+        self._closed.append(block)
+
+    def main_text(self, min_chars: int = 200) -> str:
+        """Text of the best block, or of the whole page if no block stands out."""
+        self.close()
+        while self._stack:
+            self._close(self._stack.pop())
+        best = max(self._closed, key=lambda b: b.score(), default=None)
+        if best is None or best.text < min_chars:
+            return "".join(self.pieces)
+        return "".join(self.pieces[best.start:best.end])
+
+
+def extract_main_text(html: str, min_chars: int = 200) -> str:
+    """Main content block of an HTML page as text (newline-separated)."""
+    parser = DensityExtractor()
+    parser.feed(html)
+    return parser.main_text(min_chars)
@@ -0,0 +1,182 @@
+"""
+HTTP caching utilities
+A pooled requests session with timeouts, backed by an on-disk cache that stores
+compressed bodies and revalidates them with conditional GETs (ETag / Last-Modified).
+"""
+
+import os
+import json
+import time
+import zlib
+import hashlib
+import tempfile
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class DiskCache:
+    """
+    Key -> (metadata, bytes) store on disk. Bodies are zlib-compressed; writes go
+    through a temp file + rename so concurrent readers never see a partial entry.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, digest[:2], digest)
+
+    def get(self, key: str):
+        """Returns (meta, body) or None."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                header = f.readline()
+                data = f.read()
+            return json.loads(header), zlib.decompress(data)
+        except (OSError, ValueError, zlib.error):
+            return None
+
+    def put(self, key: str, meta: dict, body: bytes):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        meta = dict(meta, key=key, stored_at=time.time())
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path))
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(json.dumps(meta).encode("utf-8") + b"\n")
+                f.write(zlib.compress(body, 6))
+            os.replace(tmp, path)
+        except OSError:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+    def touch(self, key: str, meta: dict):
+        """Refresh an entry's timestamp (and validators) after a 304."""
+        entry = self.get(key)
+        if entry is not None:
+            self.put(key, dict(entry[0], **meta), entry[1])
+
+    def get_text(self, key: str, max_age: float = None):
+        """Convenience for caching plain text, e.g. extracted JDs. None if missing or stale."""
+        entry = self.get(key)
+        if entry is None:
+            return None
+        meta, body = entry
+        if max_age is not None and time.time() - meta.get("stored_at", 0) > max_age:
+            return None
+        return body.decode("utf-8")
+
+    def put_text(self, key: str, text: str):
+        self.put(key, {}, text.encode("utf-8"))
+
+
+class CachedResponse:
+    """Minimal response object shared by network and cache hits."""
+
+    def __init__(self, url, status_code, content, encoding, headers, from_cache, truncated=False):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.encoding = encoding or "utf-8"
+        self.headers = headers
+        self.from_cache = from_cache
+        self.truncated = truncated  # body cut at max_bytes
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding, errors="replace")
+
+
+class CachedSession:
+    """
+    Pooled, thread-safe GET client with an HTTP cache in front of it.
+
+    Entries younger than `max_age` are served straight from disk; older ones are
+    revalidated with If-None-Match / If-Modified-Since, and a 304 reuses the
+    stored body. Only complete 200 responses are cached. An optional `rate_limiter`
+    (anything with acquire(url)) is consulted before each network request.
+    """
+
+    def __init__(self, cache_dir: str, timeout=(5, 15), max_age: float = 600,
+                 headers: dict = None, pool_size: int = 16, rate_limiter=None):
+        self.cache = DiskCache(cache_dir)
+        self.rate_limiter = rate_limiter
+        self.timeout = timeout
+        self.max_age = max_age
+        self.session = requests.Session()
+        if headers:
+            self.session.headers.update(headers)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.stats = {"hits": 0, "revalidated": 0, "misses": 0}
+        self._lock = threading.Lock()
+
+    def _count(self, key):
+        with self._lock:
+            self.stats[key] += 1
+
+    def get(self, url: str, max_age: float = None, max_bytes: int = None) -> CachedResponse:
+        """
+        GET with caching; `max_age` overrides the session default for this call.
+        `max_bytes` stops reading an oversized body from the network after that many bytes;
+        such a response has truncated=True and is not cached.
+        """
+        max_age = self.max_age if max_age is None else max_age
+        entry = self.cache.get(url)
+
+        if entry is not None:
+            meta, body = entry
+            if time.time() - meta.get("stored_at", 0) < max_age:
+                self._count("hits")
+                return CachedResponse(url, 200, body, meta.get("encoding"), meta.get("headers", {}), True)
+
+        conditional = {}
+        if entry is not None:
+            if entry[0].get("etag"):
+                conditional["If-None-Match"] = entry[0]["etag"]
+            if entry[0].get("last_modified"):
+                conditional["If-Modified-Since"] = entry[0]["last_modified"]
+
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(url)
+        with self.session.get(url, headers=conditional, timeout=self.timeout, stream=True) as response:
+            if response.status_code == 304 and entry is not None:
+                self._count("revalidated")
+                meta, body = entry
+                self.cache.touch(url, self._validators(response, meta))
+                return CachedResponse(url, 200, body, meta.get("encoding"), meta.get("headers", {}), True)
+
+            content, truncated = self._read(response, max_bytes)
+            encoding = response.encoding or "utf-8"
+            headers = {"Content-Type": response.headers.get("Content-Type", "")}
+
+        self._count("misses")
+        if response.status_code == 200 and not truncated:
+            meta = dict(self._validators(response, {}), encoding=encoding, headers=headers)
+            self.cache.put(url, meta, content)
+        return CachedResponse(url, response.status_code, content, encoding, headers, False, truncated)
+
+    @staticmethod
+    def _validators(response, meta: dict) -> dict:
+        return {
+            "etag": response.headers.get("ETag", meta.get("etag")),
+            "last_modified": response.headers.get("Last-Modified", meta.get("last_modified")),
+        }
+
+    @staticmethod
+    def _read(response, max_bytes: int = None):
+        """(body, truncated). Reads past max_bytes only far enough to tell whether more follows."""
+        if max_bytes is None:
+            return response.content, False
+        chunks, size = [], 0
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size > max_bytes:
+                break
+        return b"".join(chunks)[:max_bytes], size > max_bytes
@@ -0,0 +1,127 @@
+"""
+Incremental JSON extraction for LLM output
+Pulls the items of the first top-level JSON list/object out of a (streamed) response,
+yielding each item as soon as it is complete and skipping items that fail to parse.
+"""
+
+import json
+
+
+class JSONStreamParser:
+    """
+    Feed text chunks as they arrive; completed top-level items come back from feed().
+
+    expect="list"   -> items are the list elements.
+    expect="object" -> items are (key, value) pairs of the object.
+
+    Text before the container (prose, ```json fences) is ignored. A malformed item is
+    dropped without losing its neighbours, and close() recovers whatever was complete
+    when the output was truncated.
+    """
+
+    OPENERS = {"list": "[", "object": "{"}
+
+    def __init__(self, expect: str = "list"):
+        if expect not in self.OPENERS:
+            raise ValueError(f"expect must be 'list' or 'object', not {expect!r}")
+        self.expect = expect
+        self._opener = self.OPENERS[expect]
+        self._buffer = ""
+        self._pos = 0
+        self._started = False  # inside the top-level container
+        self._finished = False
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._item_start = 0
+        self._yielded = 0  # good items taken from the current container
+
+    def feed(self, chunk: str) -> list:
+        """Consume a chunk and return the items completed by it."""
+        if self._finished or not chunk:
+            return []
+        self._buffer += chunk
+        items = []
+        buf = self._buffer
+
+        while self._pos < len(buf):
+            ch = buf[self._pos]
+
+            if not self._started:
+                if ch == self._opener:
+                    self._started = True
+                    self._depth = 1
+                    self._item_start = self._pos + 1
+                self._pos += 1
+                continue
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch in "[{":
+                self._depth += 1
+            elif ch in "]}":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._emit(buf[self._item_start:self._pos], items)
+                    if self._yielded:
+                        self._finished = True
+                        self._pos += 1
+                        break
+                    # An empty or junk container (e.g. "[see below]" in prose): keep looking
+                    self._started = False
+            elif ch == "," and self._depth == 1:
+                self._emit(buf[self._item_start:self._pos], items)
+                self._item_start = self._pos + 1
+
+            self._pos += 1
+
+        # Drop the consumed prefix so long streams do not grow the buffer unboundedly
+        if not self._started:
+            self._buffer = ""
+            self._pos = 0
+        elif self._item_start > 0:
+            self._buffer = self._buffer[self._item_start:]
+            self._pos -= self._item_start
+            self._item_start = 0
+        return items
+
+    def close(self) -> list:
+        """End of stream: try to salvage the last item of a truncated container."""
+        items = []
+        if self._started and not self._finished:
+            self._emit(self._buffer[self._item_start:], items)
+        self._finished = True
+        return items
+
+    def _emit(self, raw: str, items: list):
+        raw = raw.strip()
+        if not raw:
+            return
+        try:
+            if self.expect == "list":
+                items.append(json.loads(raw))
+            else:
+                items.extend(json.loads("{" + raw + "}").items())
+        except ValueError:
+            return
+        self._yielded += 1
+
+
+def iter_json_items(chunks, expect: str = "list"):
+    """Yield JSON items from an iterable of text chunks as each one completes."""
+    parser = JSONStreamParser(expect)
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
+
+
+def extract_json_items(text: str, expect: str = "list") -> list:
+    """One-shot variant for a complete (possibly messy or truncated) response."""
+    return list(iter_json_items([text], expect))
@@ -1,90 +1,629 @@
 """
 LLM Wrapper Module
 Centralizes AI calls. Uses OpenAI if available, otherwise defaults to Pollinations.ai (Free).
+Each backend sits behind a circuit breaker so a broken service is skipped instead of
+costing its full timeout on every call. Slow calls can optionally be hedged to the
+next backend to cap tail latency. Identical prompts in flight at the same time share
+a single upstream call. stream_text() yields the answer chunk by chunk for callers
+that render or parse output incrementally.
 """
 
 import os
+import time
+import hashlib
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 import requests
 import json
 from config import APIKeys, Settings
 
-# Pollinations AI Endpoint (Free, No Auth)
-POLLINATIONS_BASE_URL = "https://text.pollinations.ai/"
+# Pollinations AI Endpoint (Free, No Auth). Overridable to point at a local stub server.
+POLLINATIONS_BASE_URL = os.getenv("POLLINATIONS_BASE_URL", "https://text.pollinations.ai/")
 
-def generate_text(prompt: str, system_role: str = "You are a helpful career assistant.", model: str = "openai") -> str:
+UNAVAILABLE_MESSAGE = "AI Service Unavailable. Please check your internet or try again later."
+
+
+class BackendHealth:
+    """
+    Circuit breaker + latency tracker for a single AI backend.
+
+    closed    -> requests flow normally.
+    open      -> backend is skipped until its cool-down expires.
+    half_open -> cool-down expired; exactly one probe request is let through.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    # Weight of the newest sample in the latency moving average
+    EWMA_ALPHA = 0.3
+    # Recent successful latencies kept for quantile estimates
+    LATENCY_WINDOW = 200
+
+    def __init__(self, name: str):
+        self.name = name
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.trips = 0  # consecutive times the breaker opened, drives the back-off
+        self.retry_at = 0.0
+        self.ewma_latency = None
+        self.latencies = deque(maxlen=self.LATENCY_WINDOW)
+        self.last_error = None
+        self._probe_in_flight = False
+        self._sampled_at = 0.0  # last latency sample (or slow-backend re-probe)
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        """Whether a call may be sent to this backend right now."""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.monotonic() >= self.retry_at:
+                self.state = self.HALF_OPEN
+                self._probe_in_flight = False
+            if self.state == self.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            return False
+
+    def record_success(self, latency: float):
+        with self._lock:
+            self.state = self.CLOSED
+            self.consecutive_failures = 0
+            self.trips = 0
+            self.last_error = None
+            self._probe_in_flight = False
+            self.latencies.append(latency)
+            self._sampled_at = time.monotonic()
+            if self.ewma_latency is None:
+                self.ewma_latency = latency
+            else:
+                self.ewma_latency = self.EWMA_ALPHA * latency + (1 - self.EWMA_ALPHA) * self.ewma_latency
+
+    def record_failure(self, error: Exception):
+        with self._lock:
+            self.consecutive_failures += 1
+            self.last_error = str(error)
+            if self.state == self.HALF_OPEN or self.consecutive_failures >= Settings.LLM_BREAKER_FAILURE_THRESHOLD:
+                self._trip()
+
+    def _trip(self):
+        """Open the breaker with an exponentially growing cool-down."""
+        self.trips += 1
+        cooldown = min(
+            Settings.LLM_BREAKER_MAX_COOLDOWN,
+            Settings.LLM_BREAKER_BASE_COOLDOWN * (2 ** (self.trips - 1))
+        )
+        self.state = self.OPEN
+        self.retry_at = time.monotonic() + cooldown
+        self._probe_in_flight = False
+
+    def latency_quantile(self, q: float):
+        """q-quantile of recent successful latencies, or None without enough samples."""
+        with self._lock:
+            if len(self.latencies) < Settings.LLM_HEDGE_MIN_SAMPLES:
+                return None
+            ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def is_usable(self) -> bool:
+        """Cheap check used for ordering; does not claim the half-open probe."""
+        with self._lock:
+            return self.state == self.CLOSED or time.monotonic() >= self.retry_at
+
+    def is_slow(self) -> bool:
+        """
+        Average latency above LLM_SLOW_BACKEND_LATENCY. Once every
+        LLM_SLOW_BACKEND_REPROBE seconds this returns False for one caller, so
+        a demoted backend still gets a call and its average can recover.
+        """
+        with self._lock:
+            if self.ewma_latency is None or self.ewma_latency <= Settings.LLM_SLOW_BACKEND_LATENCY:
+                return False
+            now = time.monotonic()
+            if now - self._sampled_at >= Settings.LLM_SLOW_BACKEND_REPROBE:
+                self._sampled_at = now
+                return False
+            return True
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "backend": self.name,
+                "state": self.state,
+                "consecutive_failures": self.consecutive_failures,
+                "retry_in": max(0.0, round(self.retry_at - time.monotonic(), 1)) if self.state != self.CLOSED else 0.0,
+                "avg_latency": round(self.ewma_latency, 3) if self.ewma_latency is not None else None,
+                "last_error": self.last_error,
+            }
+
+
+def _call_openai(prompt: str, system_role: str) -> str:
+    from openai import OpenAI
+    client = OpenAI(api_key=APIKeys.OPENAI_API_KEY)
+
+    response = client.chat.completions.create(
+        model="gpt-4o-mini", # Fast & Accurate
+        messages=[
+            {"role": "system", "content": system_role},
+            {"role": "user", "content": prompt}
+        ],
+        temperature=0.7
+    )
+    return response.choices[0].message.content
+
+
+def _call_pollinations(prompt: str, system_role: str) -> str:
+    # Pollinations OpenAI-compatible endpoint
+    payload = {
+        "messages": [
+            {"role": "system", "content": system_role},
+            {"role": "user", "content": prompt}
+        ],
+        "model": "openai",
+        "jsonMode": False
+    }
+
+    response = requests.post(POLLINATIONS_BASE_URL, json=payload, timeout=10)
+
+    if response.status_code != 200:
+        raise Exception(f"Pollinations API Error: {response.status_code}")
+    return response.text
+
+
+def _stream_openai(prompt: str, system_role: str):
+    from openai import OpenAI
+    client = OpenAI(api_key=APIKeys.OPENAI_API_KEY)
+
+    stream = client.chat.completions.create(
+        model="gpt-4o-mini",
+        messages=[
+            {"role": "system", "content": system_role},
+            {"role": "user", "content": prompt}
+        ],
+        temperature=0.7,
+        stream=True
+    )
+    for event in stream:
+        if event.choices and event.choices[0].delta.content:
+            yield event.choices[0].delta.content
+
+
+def _stream_pollinations(prompt: str, system_role: str):
+    payload = {
+        "messages": [
+            {"role": "system", "content": system_role},
+            {"role": "user", "content": prompt}
+        ],
+        "model": "openai",
+        "jsonMode": False,
+        "stream": True
+    }
+
+    with requests.post(POLLINATIONS_BASE_URL, json=payload, timeout=10, stream=True) as response:
+        if response.status_code != 200:
+            raise Exception(f"Pollinations API Error: {response.status_code}")
+
+        if "text/event-stream" not in response.headers.get("Content-Type", ""):
+            # Plain-text answer; pass it through as it arrives
+            for chunk in response.iter_content(chunk_size=None, decode_unicode=True):
+                if chunk:
+                    yield chunk
+            return
+
+        # OpenAI-style server-sent events: "data: {json}" lines, ended by "data: [DONE]"
+        for line in response.iter_lines(decode_unicode=True):
+            if not line or not line.startswith("data:"):
+                continue
+            data = line[5:].strip()
+            if data == "[DONE]":
+                return
+            choices = json.loads(data).get("choices") or [{}]
+            content = (choices[0].get("delta") or {}).get("content")
+            if content:
+                yield content
+
+
+# Backends in order of preference: 'Precise' first, then 'Fast'
+_BACKENDS = {
+    "openai": _call_openai,
+    "pollinations": _call_pollinations,
+}
+
+_STREAMING_BACKENDS = {
+    "openai": _stream_openai,
+    "pollinations": _stream_pollinations,
+}
+
+_health = {name: BackendHealth(name) for name in _BACKENDS}
+
+
+class HedgeStats:
+    """
+    Hedging budget and counters.
+    Every request earns LLM_HEDGE_BUDGET_RATIO of a token; each hedge spends one,
+    so duplicated upstream traffic stays bounded even when a backend is slow.
+    """
+
+    def __init__(self):
+        self.requests = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self.primary_wins = 0
+        self.budget_denied = 0
+        self._tokens = float(Settings.LLM_HEDGE_BUDGET_BURST)
+        self._lock = threading.Lock()
+
+    def record_request(self):
+        with self._lock:
+            self.requests += 1
+            self._tokens = min(
+                float(Settings.LLM_HEDGE_BUDGET_BURST),
+                self._tokens + Settings.LLM_HEDGE_BUDGET_RATIO
+            )
+
+    def try_acquire(self) -> bool:
+        with self._lock:
+            if self._tokens >= 1:
+                self._tokens -= 1
+                self.hedged += 1
+                return True
+            self.budget_denied += 1
+            return False
+
+    def record_winner(self, hedge_won: bool):
+        with self._lock:
+            if hedge_won:
+                self.hedge_wins += 1
+            else:
+                self.primary_wins += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "hedged": self.hedged,
+                "hedge_wins": self.hedge_wins,
+                "primary_wins": self.primary_wins,
+                "budget_denied": self.budget_denied,
+                "hedge_rate": round(self.hedged / self.requests, 3) if self.requests else 0.0,
+            }
+
+
+_hedge_stats = HedgeStats()
+_hedge_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="llm-hedge")
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls with the same key: the first caller runs the
+    function, everyone arriving while it is in flight waits and gets its result
+    (or its exception). Nothing is cached once the call completes.
+    """
+
+    class _Call:
+        def __init__(self):
+            self.done = threading.Event()
+            self.result = None
+            self.error = None
+            self.waiters = 0
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+        self.leaders = 0
+        self.coalesced = 0
+
+    def do(self, key: str, fn):
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self.coalesced += 1
+                leader = False
+            else:
+                call = self._Call()
+                self._calls[key] = call
+                self.leaders += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def stream(self, key: str, make_stream):
+        """
+        Streaming variant: one producer thread drains the upstream generator into a
+        shared buffer and every concurrent caller replays it from the start, so a
+        caller that stops reading early never stalls the others.
+        """
+        with self._lock:
+            shared = self._calls.get(key)
+            if shared is not None:
+                self.coalesced += 1
+                return iter(shared)
+            shared = _SharedStream()
+            self._calls[key] = shared
+            self.leaders += 1
+
+        def produce():
+            try:
+                for chunk in make_stream():
+                    shared.append(chunk)
+            except Exception as e:
+                print(f"Stream producer error: {e}")
+            finally:
+                with self._lock:
+                    del self._calls[key]
+                shared.finish()
+
+        _stream_executor.submit(produce)
+        return iter(shared)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {"upstream_calls": self.leaders, "coalesced": self.coalesced, "in_flight": len(self._calls)}
+
+
+class _SharedStream:
+    """Append-only chunk buffer that any number of readers can iterate concurrently."""
+
+    def __init__(self):
+        self._chunks = []
+        self._done = False
+        self._cond = threading.Condition()
+
+    def append(self, chunk: str):
+        with self._cond:
+            self._chunks.append(chunk)
+            self._cond.notify_all()
+
+    def finish(self):
+        with self._cond:
+            self._done = True
+            self._cond.notify_all()
+
+    def __iter__(self):
+        i = 0
+        while True:
+            with self._cond:
+                while i >= len(self._chunks) and not self._done:
+                    self._cond.wait()
+                if i >= len(self._chunks):
+                    return
+                chunk = self._chunks[i]
+            i += 1
+            yield chunk
+
+
+_single_flight = SingleFlight()
+_stream_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="llm-stream")
+
+
+def _backend_enabled(name: str) -> bool:
+    if name == "openai":
+        return bool(APIKeys.OPENAI_API_KEY and APIKeys.OPENAI_API_KEY.startswith("sk-"))
+    return True
+
+
+def _ordered_backends() -> list:
+    """
+    Enabled backends in preference order. Backends cooling down after failures
+    go last, and ones averaging over LLM_SLOW_BACKEND_LATENCY go behind the
+    rest; latency never reorders healthy backends otherwise.
+    """
+    preference = list(_BACKENDS)
+
+    def sort_key(name):
+        health = _health[name]
+        usable = health.is_usable()
+        return (not usable, usable and health.is_slow(), preference.index(name))
+
+    return sorted((n for n in _BACKENDS if _backend_enabled(n)), key=sort_key)
+
+
+def get_backend_health() -> list:
+    """Current breaker state of every backend (for the Settings page / debugging)."""
+    return [_health[name].snapshot() for name in _BACKENDS]
+
+
+def get_hedge_stats() -> dict:
+    """How often hedging fired and which side won."""
+    return _hedge_stats.snapshot()
+
+
+def get_coalescing_stats() -> dict:
+    """How many generate_text calls piggy-backed on an identical in-flight call."""
+    return _single_flight.snapshot()
+
+
+def _attempt(name: str, prompt: str, system_role: str) -> str:
+    """Call one backend and feed the outcome into its circuit breaker."""
+    health = _health[name]
+    started = time.monotonic()
+    try:
+        text = _BACKENDS[name](prompt, system_role)
+    except Exception as e:
+        health.record_failure(e)
+        print(f"{name} backend error: {e}. Trying next backend.")
+        raise
+    health.record_success(time.monotonic() - started)
+    return text
+
+
+def _hedge_delay(name: str) -> float:
+    observed = _health[name].latency_quantile(Settings.LLM_HEDGE_QUANTILE)
+    if observed is None:
+        return Settings.LLM_HEDGE_DEFAULT_DELAY
+    return max(Settings.LLM_HEDGE_MIN_DELAY, observed)
+
+
+def _generate_hedged(primary: str, backups: list, prompt: str, system_role: str):
+    """
+    Send the request to `primary`; if it has not answered within its hedge delay,
+    duplicate it to the first available backup and return whichever succeeds first.
+    Returns (text, attempted_backends); text is None when every attempt failed.
+    The losing call cannot be interrupted mid-request, so it is abandoned and its
+    result only feeds the breaker statistics.
+    """
+    attempted = [primary]
+    futures = {_hedge_executor.submit(_attempt, primary, prompt, system_role): primary}
+    done, pending = wait(futures, timeout=_hedge_delay(primary))
+
+    if not done:
+        usable = [n for n in backups if _health[n].is_usable()]
+        if usable and _hedge_stats.try_acquire():
+            for name in usable:
+                if _health[name].allow_request():
+                    attempted.append(name)
+                    futures[_hedge_executor.submit(_attempt, name, prompt, system_role)] = name
+                    break
+
+    pending = set(futures)
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is None:
+                for other in pending:
+                    other.cancel()
+                if len(futures) > 1:
+                    _hedge_stats.record_winner(hedge_won=futures[future] != primary)
+                return future.result(), attempted
+    return None, attempted
+
+
+def generate_text(prompt: str, system_role: str = "You are a helpful career assistant.", model: str = "openai", hedge: bool = None) -> str:
     """
     Generates text using the best available AI backend.
     Priority:
     1. OpenAI API (if Key is set) - 'Precise'
     2. Pollinations.ai (Free/Fast) - 'Fast'
+    Backends are tried in that configured order. Ones cooling down after
+    failures (circuit breaker open) move to the end, and ones averaging over
+    LLM_SLOW_BACKEND_LATENCY move behind the other healthy backends.
+    With `hedge` (default: Settings.LLM_HEDGING_ENABLED) a slow primary call is
+    duplicated to the next backend and the first good answer wins.
+    Concurrent calls with an identical prompt share one upstream request.
     """
-    
-    # 1. Try OpenAI if Key exists
-    if APIKeys.OPENAI_API_KEY and APIKeys.OPENAI_API_KEY.startswith("sk-"):
+    if hedge is None:
+        hedge = Settings.LLM_HEDGING_ENABLED
+
+    key = hashlib.sha256(
+        json.dumps([prompt, system_role, model, bool(hedge)]).encode("utf-8")
+    ).hexdigest()
+    return _single_flight.do(key, lambda: _generate_uncoalesced(prompt, system_role, hedge))
+
+
+def _generate_uncoalesced(prompt: str, system_role: str, hedge: bool) -> str:
+    """Backend selection, breaker and hedging for a single upstream request."""
+
+    if hedge:
+        _hedge_stats.record_request()
+    remaining = _ordered_backends()
+
+    while remaining:
+        name = remaining.pop(0)
+        if not _health[name].allow_request():
+            continue
+
+        if hedge and remaining:
+            text, attempted = _generate_hedged(name, remaining, prompt, system_role)
+            if text is not None:
+                return text
+            remaining = [n for n in remaining if n not in attempted]
+            continue
+
         try:
-            from openai import OpenAI
-            client = OpenAI(api_key=APIKeys.OPENAI_API_KEY)
-            
-            response = client.chat.completions.create(
-                model="gpt-4o-mini", # Fast & Accurate
-                messages=[
-                    {"role": "system", "content": system_role},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7
-            )
-            return response.choices[0].message.content
-        except Exception as e:
-            print(f"OpenAI Error: {e}. Falling back to Pollinations.")
-    
-    # 2. Use Pollinations.ai (Free)
-    # Pollinations text API is very simple: GET /prompt or POST
-    # We will use the OpenAI-compatible endpoint logic or direct fetch.
-    # Direct fetch is often faster for Pollinations.
-    
-    try:
-        # Pollinations OpenAI-compatible endpoint
-        headers = {'Content-Type': 'application/json'}
-        payload = {
-            "messages": [
-                {"role": "system", "content": system_role},
-                {"role": "user", "content": prompt}
-            ],
-            "model": "openai",
-            "jsonMode": False
-        }
-        
-        response = requests.post("https://text.pollinations.ai/", json=payload, timeout=10)
-        
-        if response.status_code == 200:
-            return response.text
-        else:
-            print(f"Pollinations API Error: {response.status_code}")
-            
-    except Exception as e:
-        print(f"Pollinations Connection Error: {e}")
+            return _attempt(name, prompt, system_role)
+        except Exception:
+            continue
 
-    # Fallback to Mock/Offline Data logic moved out of except block to handle both network error and status error
+    # Fallback to Mock/Offline Data when every backend failed or is cooling down
     if Settings.ENABLE_MOCK_DATA:
         return _get_mock_response(prompt)
-        
-    return "AI Service Unavailable. Please check your internet or try again later."
-    
+
+    return UNAVAILABLE_MESSAGE
+
+def stream_text(prompt: str, system_role: str = "You are a helpful career assistant."):
+    """
+    Like generate_text, but yields the answer in chunks as the backend produces it.
+    A backend that fails before its first chunk is skipped for the next one; once
+    output has started, a failure ends the stream (callers keep what they got).
+    Streams are not hedged, but concurrent identical prompts share one upstream stream.
+    """
+    key = hashlib.sha256(json.dumps(["stream", prompt, system_role]).encode("utf-8")).hexdigest()
+    return _single_flight.stream(key, lambda: _stream_uncoalesced(prompt, system_role))
+
+
+def _stream_uncoalesced(prompt: str, system_role: str):
+    """Backend selection and breaker bookkeeping for a single upstream stream."""
+    for name in _ordered_backends():
+        health = _health[name]
+        if not health.allow_request():
+            continue
+
+        started = time.monotonic()
+        produced = False
+        try:
+            for chunk in _STREAMING_BACKENDS[name](prompt, system_role):
+                produced = True
+                yield chunk
+        except Exception as e:
+            health.record_failure(e)
+            print(f"{name} stream error: {e}.")
+            if produced:
+                return
+            continue
+
+        if produced:
+            health.record_success(time.monotonic() - started)
+            return
+        health.record_failure(Exception("Empty response"))
+
+    if Settings.ENABLE_MOCK_DATA:
+        yield _get_mock_response(prompt)
+    else:
+        yield UNAVAILABLE_MESSAGE
+
+
+def is_fallback_response(prompt: str, text: str) -> bool:
+    """True when `text` is the offline/mock answer for `prompt`, i.e. not worth caching."""
+    return text == UNAVAILABLE_MESSAGE or text == _get_mock_response(prompt)
+
 def _get_mock_response(prompt: str) -> str:
     """Returns safe fallback responses when AI is down."""
     prompt_lower = prompt.lower()
-    
+
     if "interview question" in prompt_lower or "model answer" in prompt_lower:
         return "Here is a model answer using the STAR method:\n\n**Situation:** In my previous role, we faced a similar challenge where legacy code was slowing down deployment.\n**Task:** I was tasked with optimizing the build pipeline.\n**Action:** I implemented caching and parallelized tests using Docker.\n**Result:** This reduced build time by 40%."
-        
+
     if "json" in prompt_lower:
         return '["Tell me about yourself.", "What is your biggest weakness?", "Describe a difficult bug you fixed.", "How do you prioritize tasks?", "Why do you want to work here?"]'
-        
+
     return "This is a simulated AI response. The external AI service is currently unavailable or busy. Please try again later or configure an OpenAI Key in settings."
 
 class AIEngine:
     @staticmethod
-    def chat(prompt, system="You are an expert career coach."):
-        return generate_text(prompt, system)
+    def chat(prompt, system="You are an expert career coach.", hedge=None):
+        return generate_text(prompt, system, hedge=hedge)
+
+    @staticmethod
+    def stream(prompt, system="You are an expert career coach."):
+        return stream_text(prompt, system)
 
 ai_engine = AIEngine()
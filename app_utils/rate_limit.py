@@ -0,0 +1,59 @@
+"""
+Rate limiting utilities
+Thread-safe token buckets, one per host, so bulk fetches stay polite to job boards.
+"""
+
+import time
+import threading
+from urllib.parse import urlparse
+
+
+class TokenBucket:
+    """Classic token bucket: `rate` tokens per second, at most `burst` stored."""
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then take it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class HostRateLimiter:
+    """
+    Token buckets per site. `limits` maps a domain suffix (e.g. "indeed.com") to
+    (rate, burst), and every host under that suffix (www., in., uk. ...) shares
+    one bucket. Other hosts get a bucket each, with the `default` limit.
+    """
+
+    def __init__(self, limits: dict, default: tuple):
+        self.limits = limits
+        self.default = default
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, host: str) -> TokenBucket:
+        key = next((suffix for suffix in self.limits if host == suffix or host.endswith("." + suffix)), host)
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                rate, burst = self.limits.get(key, self.default)
+                bucket = self._buckets[key] = TokenBucket(rate, burst)
+            return bucket
+
+    def acquire(self, url: str):
+        host = (urlparse(url).hostname or "").lower()
+        self._bucket(host).acquire()
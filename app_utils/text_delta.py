@@ -0,0 +1,42 @@
+"""
+Line-based text deltas
+A delta is a list of operations against a base text: [start, end] copies base
+lines start..end, a string inserts new text. Deltas are stored zlib-compressed
+JSON, so a small edit to a long document costs a few dozen bytes.
+"""
+
+import json
+import zlib
+from difflib import SequenceMatcher
+
+
+def make_delta(base: str, target: str) -> list:
+    """Operations that turn `base` into `target` (line granularity, exact round trip)."""
+    a = base.splitlines(keepends=True)
+    b = target.splitlines(keepends=True)
+    ops = []
+    for tag, i1, i2, j1, j2 in SequenceMatcher(None, a, b, autojunk=False).get_opcodes():
+        if tag == "equal":
+            ops.append([i1, i2])
+        elif j2 > j1:  # replace / insert; deletes simply copy nothing
+            ops.append("".join(b[j1:j2]))
+    return ops
+
+
+def apply_delta(base: str, ops: list) -> str:
+    lines = base.splitlines(keepends=True)
+    out = []
+    for op in ops:
+        if isinstance(op, str):
+            out.append(op)
+        else:
+            out.extend(lines[op[0]:op[1]])
+    return "".join(out)
+
+
+def encode(ops: list) -> bytes:
+    return zlib.compress(json.dumps(ops, separators=(",", ":")).encode("utf-8"), 9)
+
+
+def decode(data: bytes) -> list:
+    return json.loads(zlib.decompress(data).decode("utf-8"))
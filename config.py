@@ -44,6 +44,26 @@ class Settings:
     
     # Database
     DB_PATH = "database/resume_analyzer.db"
+    DB_BUSY_TIMEOUT = 10  # seconds a writer waits for the lock before "database is locked"
+    DB_MMAP_SIZE = 64 * 1024 * 1024  # bytes of the file read through mmap
+    DB_CACHED_STATEMENTS = 256  # prepared statements kept per connection
+    
+    # Job Tracker
+    JOB_TRACKER_PAGE_SIZE = 50  # applications per page
+    JOB_TRACKER_FOLLOW_UP_DAYS = 14  # "Applied" this long ago without an update -> follow-up alert
+    JOB_STATUSES = ["Applied", "Screening", "Interview", "Offer", "Rejected"]
+    JOB_STATUS_ALIASES = {"Interviewing": "Interview"}  # older status names -> current status, for analytics
+    JOB_IMPORT_CHUNK_SIZE = 5000  # rows per transaction when importing CSV/JSONL
+    JOB_IMPORT_MAX_ERRORS = 100  # rejected rows reported back (all are counted)
+    
+    # Resume Versions
+    VERSION_SNAPSHOT_INTERVAL = 10  # at most this many deltas are applied to rebuild a version
+    VERSION_CONTENT_CACHE_SIZE = 64  # rebuilt texts kept in memory
+    VERSION_PAGE_SIZE = 20  # versions listed per vault page
+    VERSION_DIFF_CACHE_SIZE = 64  # version pairs whose diff is kept in memory
+    
+    # Analysis Results (stored in the analysis_results table)
+    ANALYSIS_MEMORY_CACHE_SIZE = 256  # most recently used results also kept in memory, per process
     
     # File Upload Limits
     MAX_FILE_SIZE_MB = 10
@@ -58,6 +78,80 @@ class Settings:
     ENABLE_MOCK_DATA = True  # Use mock data when APIs not available
     ENABLE_CACHING = True
     
+    # AI Backend Circuit Breaker
+    LLM_BREAKER_FAILURE_THRESHOLD = 3  # consecutive failures before a backend is skipped
+    LLM_BREAKER_BASE_COOLDOWN = 15  # seconds; doubles on every consecutive trip
+    LLM_BREAKER_MAX_COOLDOWN = 600  # seconds
+    LLM_SLOW_BACKEND_LATENCY = 20.0  # seconds; a backend averaging slower drops behind the others
+    LLM_SLOW_BACKEND_REPROBE = 60  # seconds between calls that let a slow backend refresh its average
+    
+    # AI Request Hedging (duplicate a slow request to the next backend)
+    LLM_HEDGING_ENABLED = False  # pages can opt in per call with hedge=True
+    LLM_HEDGE_QUANTILE = 0.9  # hedge once the primary is slower than its p90
+    LLM_HEDGE_DEFAULT_DELAY = 3.0  # seconds, used until enough latency samples exist
+    LLM_HEDGE_MIN_DELAY = 0.5  # seconds
+    LLM_HEDGE_MIN_SAMPLES = 20
+    LLM_HEDGE_BUDGET_RATIO = 0.1  # at most ~10% extra upstream requests
+    LLM_HEDGE_BUDGET_BURST = 5
+    
+    # Mock Interview Context (rough estimate: 1 token ~ 4 characters)
+    INTERVIEW_CONTEXT_TOKEN_BUDGET = 1200  # summary + verbatim turns in the prompt
+    INTERVIEW_SUMMARY_MAX_TOKENS = 250
+    INTERVIEW_MESSAGE_MAX_TOKENS = 300  # longer answers are clipped in the prompt
+    INTERVIEW_RECENT_MESSAGES = 6  # always kept verbatim
+    INTERVIEW_SUMMARIZE_EVERY = 4  # older messages folded into the summary per refresh
+    
+    # Interview Question Bank
+    QUESTION_BANK_USE_EMBEDDINGS = False  # rank technical questions semantically (loads the sentence transformer)
+    QUESTION_BANK_TECHNICAL = 2  # questions per generated set, by category
+    QUESTION_BANK_BEHAVIORAL = 2
+    QUESTION_BANK_CULTURE = 1
+    
+    # Learning Path Cache (per skill)
+    LEARNING_PATH_CACHE_TTL = 24 * 3600  # seconds
+    LEARNING_PATH_CACHE_SIZE = 500  # skills kept in memory
+    LEARNING_PATH_MAX_PARALLEL = 4  # concurrent AI calls for uncached skills
+    
+    # Project Idea Catalog
+    PROJECT_CATALOG_PATH = "data/project_ideas.jsonl"  # optional extra ideas (JSON list or JSONL)
+    PROJECT_CATALOG_EMBEDDINGS_PATH = "data/project_ideas.npy"  # optional, row-aligned with the catalog
+    PROJECT_RECOMMENDATIONS = 5  # ideas per request
+    PROJECT_MATCH_MIN_SCORE = 0.3  # catalog matches below this are topped up by the AI
+    
+    # JD Fetcher HTTP
+    HTTP_CACHE_DIR = ".cache/http"  # compressed page bodies + ETag/Last-Modified
+    JD_TEXT_CACHE_DIR = ".cache/jd_text"  # extracted JD text by URL
+    HTTP_CACHE_MAX_AGE = 600  # seconds a cached page is served without revalidation
+    JD_TEXT_CACHE_TTL = 24 * 3600  # seconds
+    JD_FETCH_TIMEOUT = (5, 20)  # (connect, read) seconds
+    JD_MAX_PAGE_BYTES = 2 * 1024 * 1024  # generic pages are truncated beyond this
+    JD_BULK_CONCURRENCY = 8  # global cap on simultaneous fetches
+    JD_BULK_MAX_URLS = 100
+    JD_HOST_RATE_LIMITS = {  # domain suffix -> (requests per second, burst)
+        "linkedin.com": (0.5, 2),
+        "indeed.com": (0.5, 2),
+        "glassdoor.com": (0.5, 2),
+        "naukri.com": (1, 3),
+    }
+    JD_DEFAULT_RATE_LIMIT = (2, 4)
+    
+    # JD Near-Duplicate Detection (MinHash / LSH)
+    JD_MINHASH_PERMUTATIONS = 128
+    JD_MINHASH_SHINGLE_SIZE = 5  # words per shingle
+    JD_LSH_BANDS = 16  # 8 rows per band
+    JD_DUPLICATE_THRESHOLD = 0.8  # estimated Jaccard similarity to count as the same job
+    
+    # GitHub API
+    GITHUB_API_URL = os.getenv("GITHUB_API_URL", "https://api.github.com")  # point at tools/stub_github_server.py for testing
+    GITHUB_CACHE_DIR = ".cache/github"  # ETag-validated API responses
+    GITHUB_TIMEOUT = (5, 15)  # (connect, read) seconds
+    GITHUB_PROFILE_CACHE_TTL = 3600  # seconds an analyzed profile is reused
+    GITHUB_PROFILE_CACHE_SIZE = 200  # profiles kept in memory
+    GITHUB_MAX_REPOS = 1000  # most recently pushed repos crawled per profile
+    GITHUB_MAX_PARALLEL = 8  # concurrent API calls while crawling one profile
+    GITHUB_RATE_LIMIT_MAX_WAIT = 10  # seconds worth waiting for a quota reset before deferring
+    GITHUB_QUOTA_RESERVE = 10  # API calls left untouched by language crawling (uncached repos use their primary language)
+    
     # Skill Confidence Thresholds
     SKILL_BEGINNER_THRESHOLD = 1  # years
     SKILL_INTERMEDIATE_THRESHOLD = 2
@@ -198,6 +292,70 @@ PROJECT_IDEAS = {
     ]
 }
 
+# ============= Curated Interview Questions =============
+# Seeds the question bank; generated questions are added as they are produced.
+CURATED_INTERVIEW_QUESTIONS = {
+    "Technical": {
+        "python": [
+            "How does Python's GIL affect multi-threaded programs, and how do you work around it?",
+            "Explain the difference between a list, a tuple and a generator, and when you would use each.",
+            "How would you profile and speed up a slow Python function?"
+        ],
+        "javascript": [
+            "Explain the JavaScript event loop and how promises are scheduled.",
+            "What is the difference between var, let and const?"
+        ],
+        "react": [
+            "How does React decide when to re-render a component, and how do you prevent unnecessary renders?",
+            "When would you reach for useReducer or a state library instead of useState?"
+        ],
+        "java": [
+            "How does garbage collection work in the JVM, and how would you tune it?",
+            "Explain the difference between an interface and an abstract class in Java."
+        ],
+        "sql": [
+            "How do indexes speed up queries, and when can they hurt performance?",
+            "Explain the difference between INNER, LEFT and FULL OUTER joins with an example."
+        ],
+        "docker": [
+            "How would you reduce the size and build time of a Docker image?",
+            "What is the difference between a container and a virtual machine?"
+        ],
+        "kubernetes": [
+            "How does a Kubernetes Deployment perform a rolling update?",
+            "How would you debug a pod stuck in CrashLoopBackOff?"
+        ],
+        "aws": [
+            "How would you design a highly available web application on AWS?",
+            "When would you choose Lambda over ECS or EC2?"
+        ],
+        "machine learning": [
+            "How do you detect and handle overfitting?",
+            "Walk me through how you would evaluate a classification model on imbalanced data."
+        ],
+        "git": [
+            "When would you use rebase instead of merge?",
+            "How would you recover a commit that was lost after a hard reset?"
+        ],
+        "rest api": [
+            "How do you design a REST API for backward compatibility and versioning?",
+            "What makes an API endpoint idempotent, and why does it matter?"
+        ]
+    },
+    "Behavioral": [
+        "Tell me about a time you had to deliver under a tight deadline.",
+        "Describe a situation where you disagreed with a teammate. How did you resolve it?",
+        "Tell me about a project that failed. What did you learn?",
+        "Describe a time you took ownership of a problem outside your responsibilities.",
+        "Tell me about a time you had to learn a new technology quickly."
+    ],
+    "Culture": [
+        "What kind of team environment helps you do your best work?",
+        "How do you give and receive feedback?",
+        "Why are you interested in this role and our company?"
+    ]
+}
+
 # ============= Learning Resources =============
 FREE_LEARNING_PLATFORMS = [
     "YouTube",
@@ -3,88 +3,669 @@ Database Manager
 Handles SQLite operations for Job Tracker and Version Control
 """
 
+import hashlib
 import sqlite3
 import os
+import re
+import threading
+import zlib
+from collections import OrderedDict
+from contextlib import contextmanager
+from itertools import islice
 from datetime import datetime
+from app_utils import text_delta
 from config import Settings
 
+# Full-text index over the JD library. Kept out of schema.sql so a SQLite build
+# without FTS5 still gets every other table (search then falls back to LIKE).
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS job_descriptions_fts USING fts5(
+    title, content, keywords,
+    content='job_descriptions', content_rowid='id', tokenize='porter unicode61'
+);
+CREATE TRIGGER IF NOT EXISTS job_descriptions_ai AFTER INSERT ON job_descriptions BEGIN
+    INSERT INTO job_descriptions_fts(rowid, title, content, keywords)
+    VALUES (new.id, new.title, new.content, new.keywords);
+END;
+CREATE TRIGGER IF NOT EXISTS job_descriptions_ad AFTER DELETE ON job_descriptions BEGIN
+    INSERT INTO job_descriptions_fts(job_descriptions_fts, rowid, title, content, keywords)
+    VALUES ('delete', old.id, old.title, old.content, old.keywords);
+END;
+CREATE TRIGGER IF NOT EXISTS job_descriptions_au AFTER UPDATE ON job_descriptions BEGIN
+    INSERT INTO job_descriptions_fts(job_descriptions_fts, rowid, title, content, keywords)
+    VALUES ('delete', old.id, old.title, old.content, old.keywords);
+    INSERT INTO job_descriptions_fts(rowid, title, content, keywords)
+    VALUES (new.id, new.title, new.content, new.keywords);
+END;
+"""
+
 class DBManager:
+    """
+    One SQLite connection per thread, opened lazily and reused for every call,
+    so statements stay in the connection's prepared-statement cache. The
+    database runs in WAL mode: readers never block the writer, and writers
+    wait up to DB_BUSY_TIMEOUT seconds for each other instead of failing.
+    """
+
     def __init__(self):
         self.db_path = Settings.DB_PATH
+        self._local = threading.local()
+        self._content_cache = OrderedDict()  # blob hash -> rebuilt text, LRU order
+        self._content_lock = threading.Lock()
         self._init_db()
 
+    def _conn(self) -> sqlite3.Connection:
+        """This thread's connection. Writes go through `with self._write(table) as conn:`."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.db_path,
+                timeout=Settings.DB_BUSY_TIMEOUT,
+                isolation_level="IMMEDIATE",  # take the write lock up front, never mid-transaction
+                cached_statements=Settings.DB_CACHED_STATEMENTS,
+            )
+            conn.execute("PRAGMA synchronous=NORMAL")  # durable at checkpoints; safe with WAL
+            conn.execute(f"PRAGMA mmap_size={int(Settings.DB_MMAP_SIZE)}")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            self._local.conn = conn
+        return conn
+
+    def _rows(self, sql, params=()):
+        """Run a query and return its rows as dicts."""
+        cur = self._conn().cursor()
+        cur.row_factory = sqlite3.Row
+        rows = cur.execute(sql, params).fetchall()
+        cur.close()
+        return [dict(r) for r in rows]
+
+    @contextmanager
+    def _write(self, *tables):
+        """
+        Transaction (commit/rollback) that bumps the data_versions counter of
+        `tables` when it changed any rows, so caches keyed on data_version()
+        notice the write, in this process and any other sharing the file.
+        """
+        conn = self._conn()
+        with conn:
+            before = conn.total_changes
+            yield conn
+            if conn.total_changes != before:
+                conn.executemany("""
+                    INSERT INTO data_versions (table_name, version) VALUES (?, 1)
+                    ON CONFLICT(table_name) DO UPDATE SET version = version + 1
+                """, [(t,) for t in tables])
+
+    def data_version(self, *tables):
+        """
+        Write counters of `tables`, as a tuple in the same order. Use them in
+        cache keys: they change exactly when one of those tables is written.
+        """
+        found = dict(self._conn().execute(
+            f"SELECT table_name, version FROM data_versions WHERE table_name IN ({','.join('?' * len(tables))})",
+            tables,
+        ).fetchall())
+        return tuple(found.get(t, 0) for t in tables)
+
+    def close(self):
+        """Close the calling thread's connection (a new one opens on next use)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
     def _init_db(self):
         """Initialize DB with schema."""
         # Ensure dir exists
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
         
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn()
         cursor = conn.cursor()
+
+        # Persistent: stored in the database file, so every later connection uses WAL
+        cursor.execute("PRAGMA journal_mode=WAL")
         
         # Read schema
         schema_path = os.path.join(os.path.dirname(__file__), 'schema.sql')
+        # Analytics triggers from before NULL statuses were handled: let schema.sql recreate them
+        trigger = cursor.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = 'job_applications_stats_ai'"
+        ).fetchone()
+        if trigger and "COALESCE(new.status" not in trigger[0]:
+            for name in ("job_applications_stats_ai", "job_applications_stats_ad", "job_applications_stats_au"):
+                cursor.execute(f"DROP TRIGGER IF EXISTS {name}")
         if os.path.exists(schema_path):
             with open(schema_path, 'r') as f:
                 cursor.executescript(f.read())
+
+        # Columns added after the first release
+        columns = {row[1] for row in cursor.execute("PRAGMA table_info(job_applications)")}
+        if "jd_id" not in columns:
+            cursor.execute("ALTER TABLE job_applications ADD COLUMN jd_id INTEGER REFERENCES job_descriptions(id)")
+        columns = {row[1] for row in cursor.execute("PRAGMA table_info(resume_versions)")}
+        if "content_hash" not in columns:
+            cursor.execute("ALTER TABLE resume_versions ADD COLUMN content_hash TEXT REFERENCES resume_blobs(hash)")
+        # Blob reference checks when a version is deleted
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_resume_versions_hash ON resume_versions(content_hash)")
+
+        # Versions saved before blob storage: move their text into blobs, each a delta on the previous one
+        legacy = cursor.execute(
+            "SELECT id, content FROM resume_versions WHERE content_hash IS NULL AND content IS NOT NULL ORDER BY id"
+        ).fetchall()
+        base_hash = None
+        for v_id, content in legacy:
+            base_hash = self._store_blob(conn, content, base_hash)
+            cursor.execute("UPDATE resume_versions SET content_hash = ?, content = NULL WHERE id = ?", (base_hash, v_id))
+
+        try:
+            cursor.executescript(FTS_SCHEMA)
+            self.fts_enabled = True
+        except sqlite3.OperationalError as e:
+            print(f"FTS5 unavailable, JD search will use LIKE: {e}")
+            self.fts_enabled = False
+
+        # NULL statuses (possible before the column default was relied on) are 'Applied'
+        cursor.execute("UPDATE job_applications SET status = 'Applied' WHERE status IS NULL")
+
+        # Analytics tables are trigger-maintained; fill them for applications tracked before they existed
+        tracked = cursor.execute("SELECT COUNT(*) FROM job_applications").fetchone()[0]
+        counted = cursor.execute("SELECT COALESCE(SUM(count), 0) FROM application_status_stats").fetchone()[0]
+        if tracked != counted:
+            self._fill_application_stats(conn)
         
         conn.commit()
-        conn.close()
-
-    def add_application(self, company, role, status, date, score, notes):
-        conn = sqlite3.connect(self.db_path)
-        cur = conn.cursor()
-        cur.execute("""
-            INSERT INTO job_applications (company, role, status, date_applied, ats_score, notes)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (company, role, status, date, score, notes))
-        conn.commit()
-        conn.close()
+
+    def add_application(self, company, role, status, date, score, notes, jd_id=None):
+        with self._write("job_applications") as conn:
+            conn.execute("""
+                INSERT INTO job_applications (company, role, status, date_applied, ats_score, notes, jd_id)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, (company, role, status, date, score, notes, jd_id))
+
+    def import_applications(self, rows, chunk_size=5000, progress=None):
+        """
+        Bulk insert from an iterable of (company, role, status, date_applied,
+        ats_score, notes) tuples, consumed lazily. Each chunk is one executemany
+        in its own transaction, so memory stays bounded and readers see progress.
+        progress(total) is called after every committed chunk. Returns the row count.
+        """
+        rows = iter(rows)
+        total = 0
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                return total
+            with self._write("job_applications") as conn:
+                conn.executemany("""
+                    INSERT INTO job_applications (company, role, status, date_applied, ats_score, notes)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                """, chunk)
+            total += len(chunk)
+            if progress:
+                progress(total)
+
+    def iter_applications(self, batch_size=1000):
+        """Every application as a tuple, fetched batch_size rows at a time; first yields the column names."""
+        cur = self._conn().execute("SELECT * FROM job_applications ORDER BY id")
+        try:
+            yield tuple(d[0] for d in cur.description)
+            while True:
+                batch = cur.fetchmany(batch_size)
+                if not batch:
+                    return
+                yield from batch
+        finally:
+            cur.close()
 
     def get_applications(self):
-        conn = sqlite3.connect(self.db_path)
         # return pandas compatible list
         import pandas as pd
-        df = pd.read_sql_query("SELECT * FROM job_applications ORDER BY date_applied DESC", conn)
-        conn.close()
-        return df
+        return pd.read_sql_query("SELECT * FROM job_applications ORDER BY date_applied DESC", self._conn())
+
+    # Columns the Job Tracker may sort by (never interpolate user input into ORDER BY)
+    APPLICATION_SORT_COLUMNS = ("date_applied", "company", "role", "status", "ats_score", "id")
+
+    @staticmethod
+    def _application_filters(status=None, search=None, date_from=None, date_to=None):
+        """WHERE clause + params shared by query_applications and count_applications."""
+        clauses, params = [], []
+        if status:
+            statuses = [status] if isinstance(status, str) else list(status)
+            clauses.append(f"status IN ({','.join('?' * len(statuses))})")
+            params += statuses
+        if search:
+            clauses.append("(company LIKE ? OR role LIKE ?)")
+            params += [f"%{search}%"] * 2
+        if date_from:
+            clauses.append("date_applied >= ?")
+            params.append(str(date_from))
+        if date_to:
+            clauses.append("date_applied <= ?")
+            params.append(str(date_to))
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def query_applications(self, status=None, search=None, date_from=None, date_to=None,
+                           sort="date_applied", descending=True, limit=50, offset=0):
+        """
+        One page of applications as a DataFrame, filtered and sorted in SQL.
+        status: one status or a list; search: substring of company or role;
+        date_from / date_to: inclusive YYYY-MM-DD bounds.
+        """
+        import pandas as pd
+        if sort not in self.APPLICATION_SORT_COLUMNS:
+            sort = "date_applied"
+        where, params = self._application_filters(status, search, date_from, date_to)
+        direction = "DESC" if descending else "ASC"
+        return pd.read_sql_query(
+            f"SELECT * FROM job_applications{where} ORDER BY {sort} {direction}, id {direction} LIMIT ? OFFSET ?",
+            self._conn(), params=params + [int(limit), int(offset)],
+        )
+
+    def count_applications(self, status=None, search=None, date_from=None, date_to=None):
+        where, params = self._application_filters(status, search, date_from, date_to)
+        return self._conn().execute(f"SELECT COUNT(*) FROM job_applications{where}", params).fetchone()[0]
+
+    def status_counts(self):
+        """{status: number of applications}, from the trigger-maintained summary table."""
+        return dict(self._conn().execute(
+            "SELECT status, count FROM application_status_stats WHERE count > 0"
+        ).fetchall())
+
+    def application_funnel(self, statuses=None):
+        """
+        Status funnel of the current pipeline, read from the summary tables:
+        {"total", "by_status", "avg_score", "response_rate", "stages", "other"}.
+        `statuses` is the pipeline in order (Settings.JOB_STATUSES by default);
+        "Rejected" is treated as an outcome, not a stage. Older names are folded
+        in through Settings.JOB_STATUS_ALIASES (e.g. "Interviewing" counts as
+        "Interview"); any other status is left out of every figure, total
+        included, and only counted in "other". Each stage lists how many
+        applications reached it (currently there or further along) and the
+        conversion from the previous stage.
+        """
+        statuses = list(statuses or Settings.JOB_STATUSES)
+        by_status, scored, score_sum, other = {}, {}, {}, {}
+        for r in self._rows("SELECT status, count, scored, score_sum FROM application_status_stats WHERE count > 0"):
+            status = Settings.JOB_STATUS_ALIASES.get(r["status"], r["status"])
+            if status not in statuses:
+                other[r["status"]] = r["count"]
+                continue
+            by_status[status] = by_status.get(status, 0) + r["count"]
+            scored[status] = scored.get(status, 0) + r["scored"]
+            score_sum[status] = score_sum.get(status, 0) + r["score_sum"]
+        total = sum(by_status.values())
+
+        stages = [s for s in statuses if s != "Rejected"]
+        funnel, previous = [], None
+        for i, stage in enumerate(stages):
+            reached = total if i == 0 else sum(by_status.get(s, 0) for s in stages[i:])
+            funnel.append({"stage": stage, "reached": reached,
+                           "conversion": reached / previous if previous else None})
+            previous = reached
+
+        return {
+            "total": total,
+            "by_status": by_status,
+            "avg_score": {s: score_sum[s] / n for s, n in scored.items() if n},
+            # Anything that moved past the first stage, rejections included, got a response
+            "response_rate": (total - by_status.get(stages[0], 0)) / total if total and stages else 0.0,
+            "stages": funnel,
+            "other": other,
+        }
+
+    def weekly_status_counts(self, weeks=12):
+        """
+        [{"week", "status", "count"}] for the last `weeks` weeks that have
+        applications, oldest first; week is the Monday of the week applied.
+        """
+        return self._rows("""
+            SELECT week, status, count FROM application_weekly_stats
+            WHERE count > 0 AND week >= (
+                SELECT MIN(week) FROM (SELECT DISTINCT week FROM application_weekly_stats
+                                       WHERE count > 0 AND week != '' ORDER BY week DESC LIMIT ?))
+            ORDER BY week, status
+        """, (int(weeks),))
+
+    def score_outcomes(self):
+        """
+        [{"bucket", "status", "count"}] of ATS score buckets per status; bucket
+        is the score's tens (0 for 0-9 ... 9 for 90-100), -1 for unscored.
+        """
+        return self._rows(
+            "SELECT bucket, status, count FROM application_score_stats WHERE count > 0 ORDER BY bucket, status"
+        )
+
+    def rebuild_application_stats(self):
+        """Recompute the analytics tables from job_applications (repair only; triggers keep them current)."""
+        with self._write("job_applications") as conn:
+            self._fill_application_stats(conn)
+
+    @staticmethod
+    def _fill_application_stats(conn):
+        # Same week / bucket expressions as the triggers in schema.sql
+        conn.execute("DELETE FROM application_status_stats")
+        conn.execute("DELETE FROM application_weekly_stats")
+        conn.execute("DELETE FROM application_score_stats")
+        conn.execute("""
+            INSERT INTO application_status_stats (status, count, scored, score_sum)
+            SELECT COALESCE(status, 'Applied') AS state, COUNT(*), COUNT(ats_score), COALESCE(SUM(ats_score), 0)
+            FROM job_applications GROUP BY state
+        """)
+        conn.execute("""
+            INSERT INTO application_weekly_stats (week, status, count)
+            SELECT COALESCE(date(date_applied, 'weekday 0', '-6 days'), '') AS week,
+                   COALESCE(status, 'Applied') AS state, COUNT(*)
+            FROM job_applications GROUP BY week, state
+        """)
+        conn.execute("""
+            INSERT INTO application_score_stats (bucket, status, count)
+            SELECT COALESCE(MAX(MIN(CAST(ats_score AS INTEGER) / 10, 9), 0), -1) AS bucket,
+                   COALESCE(status, 'Applied') AS state, COUNT(*)
+            FROM job_applications GROUP BY bucket, state
+        """)
+
+    def get_stale_applications(self, days=14, limit=None):
+        """
+        Applications still 'Applied' `days` or more days after date_applied,
+        oldest first (served by the status/date index).
+        """
+        sql = """
+            SELECT id, company, role, date_applied FROM job_applications
+            WHERE status = 'Applied' AND date_applied <= date('now', 'localtime', ?)
+              AND date(date_applied) IS NOT NULL
+            ORDER BY date_applied
+        """
+        params = [f"-{int(days)} days"]
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+        return self._rows(sql, params)
+
+    def count_stale_applications(self, days=14):
+        return self._conn().execute("""
+            SELECT COUNT(*) FROM job_applications
+            WHERE status = 'Applied' AND date_applied <= date('now', 'localtime', ?)
+              AND date(date_applied) IS NOT NULL
+        """, (f"-{int(days)} days",)).fetchone()[0]
 
     def update_status(self, app_id, new_status):
-        conn = sqlite3.connect(self.db_path)
-        cur = conn.cursor()
-        cur.execute("UPDATE job_applications SET status = ? WHERE id = ?", (new_status, app_id))
-        conn.commit()
-        conn.close()
+        with self._write("job_applications") as conn:
+            conn.execute("UPDATE job_applications SET status = ? WHERE id = ?", (new_status, app_id))
         
+    def link_jd(self, app_id, jd_id):
+        """Attach a saved JD to an application (None to unlink)."""
+        with self._write("job_applications") as conn:
+            conn.execute("UPDATE job_applications SET jd_id = ? WHERE id = ?", (jd_id, app_id))
+
     def delete_application(self, app_id):
-        conn = sqlite3.connect(self.db_path)
-        cur = conn.cursor()
-        cur.execute("DELETE FROM job_applications WHERE id = ?", (app_id,))
-        conn.commit()
-        conn.close()
+        with self._write("job_applications") as conn:
+            conn.execute("DELETE FROM job_applications WHERE id = ?", (app_id,))
 
     def save_version(self, name, content, parent_id=None):
-        conn = sqlite3.connect(self.db_path)
-        cur = conn.cursor()
+        """
+        Store a resume version and return its id. The text goes into a
+        content-addressed blob (identical texts are stored once), as a line delta
+        against the parent version, or the latest one, when that is smaller.
+        """
         created_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        cur.execute("""
-            INSERT INTO resume_versions (version_name, content, created_at, parent_version_id)
-            VALUES (?, ?, ?, ?)
-        """, (name, content, created_at, parent_id))
-        conn.commit()
-        conn.close()
+        with self._write("resume_versions", "resume_blobs") as conn:
+            base = None
+            if parent_id is not None:
+                base = conn.execute("SELECT content_hash FROM resume_versions WHERE id = ?", (parent_id,)).fetchone()
+            if base is None:
+                base = conn.execute("SELECT content_hash FROM resume_versions ORDER BY id DESC LIMIT 1").fetchone()
+            content_hash = self._store_blob(conn, content, base[0] if base else None)
+            cur = conn.execute("""
+                INSERT INTO resume_versions (version_name, created_at, parent_version_id, content_hash)
+                VALUES (?, ?, ?, ?)
+            """, (name, created_at, parent_id, content_hash))
+            return cur.lastrowid
+
+    def _store_blob(self, conn, content, base_hash=None):
+        """Write `content` as a blob (inside the caller's transaction) and return its hash."""
+        content_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        if conn.execute("SELECT 1 FROM resume_blobs WHERE hash = ?", (content_hash,)).fetchone():
+            return content_hash
+
+        kind, depth, data = "full", 0, zlib.compress(content.encode("utf-8"), 9)
+        base = conn.execute("SELECT depth FROM resume_blobs WHERE hash = ?", (base_hash,)).fetchone() if base_hash else None
+        # Past the snapshot interval a full copy is stored, so rebuilding never applies more deltas than that
+        if base is not None and base[0] < Settings.VERSION_SNAPSHOT_INTERVAL:
+            delta = text_delta.encode(text_delta.make_delta(self._blob_text(base_hash, conn), content))
+            if len(delta) < len(data):
+                kind, depth, data = "delta", base[0] + 1, delta
+        conn.execute(
+            "INSERT INTO resume_blobs (hash, kind, base_hash, depth, size, data) VALUES (?, ?, ?, ?, ?, ?)",
+            (content_hash, kind, base_hash if kind == "delta" else None, depth, len(content), data),
+        )
+        return content_hash
+
+    def _blob_text(self, content_hash, conn=None):
+        """Rebuild a blob's text: walk deltas down to a full snapshot (or cached text), then apply them."""
+        with self._content_lock:
+            if content_hash in self._content_cache:
+                self._content_cache.move_to_end(content_hash)
+                return self._content_cache[content_hash]
+
+        conn = conn or self._conn()
+        deltas = []
+        h = content_hash
+        while True:
+            with self._content_lock:
+                text = self._content_cache.get(h)
+            if text is not None:
+                break
+            kind, base_hash, data = conn.execute(
+                "SELECT kind, base_hash, data FROM resume_blobs WHERE hash = ?", (h,)
+            ).fetchone()
+            if kind == "full":
+                text = zlib.decompress(data).decode("utf-8")
+                break
+            deltas.append(text_delta.decode(data))
+            h = base_hash
+        for ops in reversed(deltas):
+            text = text_delta.apply_delta(text, ops)
 
-    def get_versions(self):
-        conn = sqlite3.connect(self.db_path)
+        with self._content_lock:
+            self._content_cache[content_hash] = text
+            self._content_cache.move_to_end(content_hash)
+            while len(self._content_cache) > Settings.VERSION_CONTENT_CACHE_SIZE:
+                self._content_cache.popitem(last=False)
+        return text
+
+    def get_version(self, v_id):
+        """One version's metadata (as listed by get_versions) as a dict, or None."""
+        rows = self._rows("""
+            SELECT v.id, v.version_name, v.created_at, v.parent_version_id, v.content_hash,
+                   COALESCE(b.size, length(v.content)) AS size
+            FROM resume_versions v LEFT JOIN resume_blobs b ON b.hash = v.content_hash
+            WHERE v.id = ?
+        """, (v_id,))
+        return rows[0] if rows else None
+
+    def get_version_content(self, v_id):
+        """Full text of one version, or None."""
+        row = self._conn().execute("SELECT content, content_hash FROM resume_versions WHERE id = ?", (v_id,)).fetchone()
+        if row is None:
+            return None
+        return self._blob_text(row[1]) if row[1] else row[0]
+
+    def get_versions(self, limit=None, offset=0):
+        """
+        Version metadata, newest first: id, version_name, created_at,
+        parent_version_id, content_hash and size (characters). Text is not
+        loaded; use get_version_content for the versions actually opened.
+        """
         import pandas as pd
-        df = pd.read_sql_query("SELECT * FROM resume_versions ORDER BY created_at DESC", conn)
-        conn.close()
-        return df
-        
+        sql = """
+            SELECT v.id, v.version_name, v.created_at, v.parent_version_id, v.content_hash,
+                   COALESCE(b.size, length(v.content)) AS size
+            FROM resume_versions v LEFT JOIN resume_blobs b ON b.hash = v.content_hash
+            ORDER BY v.created_at DESC, v.id DESC
+        """
+        params = []
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params += [int(limit), int(offset)]
+        return pd.read_sql_query(sql, self._conn(), params=params)
+
+    def count_versions(self):
+        return self._conn().execute("SELECT COUNT(*) FROM resume_versions").fetchone()[0]
+
+    def version_storage_stats(self):
+        """Bytes stored for resume text versus the total size of every version."""
+        row = self._conn().execute("""
+            SELECT (SELECT COUNT(*) FROM resume_versions),
+                   (SELECT COALESCE(SUM(b.size), 0) FROM resume_versions v JOIN resume_blobs b ON b.hash = v.content_hash),
+                   (SELECT COUNT(*) FROM resume_blobs),
+                   (SELECT COALESCE(SUM(length(data)), 0) FROM resume_blobs)
+        """).fetchone()
+        return {"versions": row[0], "text_bytes": row[1], "blobs": row[2], "stored_bytes": row[3]}
+
     def delete_version(self, v_id):
-        conn = sqlite3.connect(self.db_path)
-        cur = conn.cursor()
-        cur.execute("DELETE FROM resume_versions WHERE id = ?", (v_id,))
-        conn.commit()
-        conn.close()
+        with self._write("resume_versions", "resume_blobs") as conn:
+            row = conn.execute("SELECT content_hash FROM resume_versions WHERE id = ?", (v_id,)).fetchone()
+            conn.execute("DELETE FROM resume_versions WHERE id = ?", (v_id,))
+            # Drop blobs nothing points at any more, walking down the delta chain
+            h = row[0] if row else None
+            while h and not conn.execute("""
+                SELECT 1 FROM resume_versions WHERE content_hash = ?
+                UNION ALL SELECT 1 FROM resume_blobs WHERE base_hash = ? LIMIT 1
+            """, (h, h)).fetchone():
+                base = conn.execute("SELECT base_hash FROM resume_blobs WHERE hash = ?", (h,)).fetchone()
+                conn.execute("DELETE FROM resume_blobs WHERE hash = ?", (h,))
+                h = base[0] if base else None
+
+    def get_analysis(self, analyzer, version, resume_hash, jd_hash=""):
+        """Stored JSON result of one analyzer run, or None."""
+        row = self._conn().execute("""
+            SELECT result FROM analysis_results
+            WHERE analyzer = ? AND resume_hash = ? AND jd_hash = ? AND analyzer_version = ?
+        """, (analyzer, resume_hash, jd_hash, version)).fetchone()
+        return row[0] if row else None
+
+    def save_analysis(self, analyzer, version, resume_hash, result, jd_hash=""):
+        created_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with self._write("analysis_results") as conn:
+            conn.execute("""
+                INSERT OR REPLACE INTO analysis_results (analyzer, resume_hash, jd_hash, analyzer_version, result, created_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, (analyzer, resume_hash, jd_hash, version, result, created_at))
+
+    def delete_analyses(self, analyzer, keep_version=None):
+        """Drop an analyzer's stored results, except those of keep_version. Returns the number removed."""
+        with self._write("analysis_results") as conn:
+            if keep_version is None:
+                cur = conn.execute("DELETE FROM analysis_results WHERE analyzer = ?", (analyzer,))
+            else:
+                cur = conn.execute("DELETE FROM analysis_results WHERE analyzer = ? AND analyzer_version != ?",
+                                   (analyzer, keep_version))
+            return cur.rowcount
+
+    def add_questions(self, rows):
+        """
+        Store interview questions for the question bank.
+        rows: iterable of (role, skill, level, category, question, source).
+        Questions already in the bank are ignored.
+        """
+        created_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with self._write("interview_questions") as conn:
+            conn.executemany("""
+                INSERT OR IGNORE INTO interview_questions (role, skill, level, category, question, source, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, [tuple(r) + (created_at,) for r in rows])
+
+    def get_questions(self, questions=None, after_id=0):
+        """
+        Bank questions as plain dicts (used to build the in-memory index).
+        Pass `questions` to fetch only those texts, e.g. rows that were just added,
+        or `after_id` for rows added since the index was built (by any process).
+        """
+        sql = "SELECT id, role, skill, level, category, question, source FROM interview_questions"
+        if questions is None:
+            return self._rows(f"{sql} WHERE id > ? ORDER BY id", (after_id,))
+        questions = list(questions)
+        rows = []
+        # Stay under SQLite's bound-parameter limit
+        for i in range(0, len(questions), 500):
+            chunk = questions[i:i + 500]
+            rows += self._rows(f"{sql} WHERE question IN ({','.join('?' * len(chunk))})", chunk)
+        return rows
+
+    def add_jd_signature(self, content_hash, canonical_hash, similarity, signature, source=""):
+        """Store the MinHash signature of a JD. Already-known texts are ignored."""
+        created_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with self._write("jd_signatures") as conn:
+            conn.execute("""
+                INSERT OR IGNORE INTO jd_signatures (content_hash, canonical_hash, similarity, signature, source, created_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, (content_hash, canonical_hash, similarity, signature, source, created_at))
+
+    def get_jd_signatures(self, after_id=0):
+        """Stored signatures as (id, content_hash, canonical_hash, signature) tuples, optionally only newer rows."""
+        return self._conn().execute(
+            "SELECT id, content_hash, canonical_hash, signature FROM jd_signatures WHERE id > ? ORDER BY id", (after_id,)
+        ).fetchall()
+
+    def save_jd(self, content_hash, content, title="", source_url="", platform="", keywords=(), canonical_hash=None):
+        """
+        Store a JD in the library and return its id.
+        A JD with the same content_hash is stored once; its existing id is returned.
+        """
+        fetched_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with self._write("job_descriptions") as conn:
+            conn.execute("""
+                INSERT OR IGNORE INTO job_descriptions
+                    (content_hash, canonical_hash, title, source_url, platform, content, keywords, fetched_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, (content_hash, canonical_hash or content_hash, title, source_url, platform, content,
+                  ", ".join(keywords), fetched_at))
+            return conn.execute("SELECT id FROM job_descriptions WHERE content_hash = ?", (content_hash,)).fetchone()[0]
+
+    def get_jd(self, jd_id):
+        """One library JD as a dict, or None."""
+        rows = self._rows("SELECT * FROM job_descriptions WHERE id = ?", (jd_id,))
+        return rows[0] if rows else None
+
+    def list_jds(self, limit=50):
+        """Most recently saved JDs (without their text), newest first."""
+        return self._rows("""
+            SELECT id, title, source_url, platform, keywords, fetched_at
+            FROM job_descriptions ORDER BY id DESC LIMIT ?
+        """, (limit,))
+
+    def count_jds(self):
+        return self._conn().execute("SELECT COUNT(*) FROM job_descriptions").fetchone()[0]
+
+    def search_jds(self, query, limit=20):
+        """
+        Ranked full-text search over title, text and keywords (BM25, title and
+        keywords weighted higher). Every word must match; the last one as a prefix,
+        so results update while typing. Returns dicts with a highlighted `snippet`.
+        """
+        words = re.findall(r"\w+", query.lower())
+        if not words:
+            return []
+        if self.fts_enabled:
+            match = " ".join(f'"{w}"' for w in words[:-1]) + f' "{words[-1]}"*'
+            return self._rows("""
+                SELECT jd.id, jd.title, jd.source_url, jd.platform, jd.keywords, jd.fetched_at,
+                       snippet(job_descriptions_fts, 1, '**', '**', ' … ', 16) AS snippet
+                FROM job_descriptions_fts
+                JOIN job_descriptions jd ON jd.id = job_descriptions_fts.rowid
+                WHERE job_descriptions_fts MATCH ?
+                ORDER BY bm25(job_descriptions_fts, 3.0, 1.0, 2.0)
+                LIMIT ?
+            """, (match.strip(), limit))
+        where = " AND ".join("(content LIKE ? OR title LIKE ? OR keywords LIKE ?)" for _ in words)
+        params = [p for w in words for p in (f"%{w}%",) * 3]
+        return self._rows(f"""
+            SELECT id, title, source_url, platform, keywords, fetched_at, substr(content, 1, 200) AS snippet
+            FROM job_descriptions WHERE {where} ORDER BY id DESC LIMIT ?
+        """, params + [limit])
+
+    def delete_jd(self, jd_id):
+        with self._write("job_descriptions", "job_applications") as conn:
+            conn.execute("UPDATE job_applications SET jd_id = NULL WHERE jd_id = ?", (jd_id,))
+            conn.execute("DELETE FROM job_descriptions WHERE id = ?", (jd_id,))
 
 db_manager = DBManager()
@@ -6,13 +6,159 @@ CREATE TABLE IF NOT EXISTS job_applications (
     date_applied TEXT,
     ats_score INTEGER,
     resume_version_id INTEGER,
-    notes TEXT
+    notes TEXT,
+    jd_id INTEGER REFERENCES job_descriptions(id) -- saved JD this application is for
 );
 
+-- Status filters, the stale follow-up check (status + date range) and date sorting
+CREATE INDEX IF NOT EXISTS idx_applications_status_date ON job_applications(status, date_applied);
+CREATE INDEX IF NOT EXISTS idx_applications_date ON job_applications(date_applied);
+
 CREATE TABLE IF NOT EXISTS resume_versions (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     version_name TEXT,
-    content TEXT,
+    content TEXT, -- legacy inline text; new versions keep only content_hash
     created_at TEXT,
-    parent_version_id INTEGER
+    parent_version_id INTEGER,
+    content_hash TEXT REFERENCES resume_blobs(hash)
+);
+
+-- Newest-first vault pages (the content_hash index is created with that column's migration)
+CREATE INDEX IF NOT EXISTS idx_resume_versions_created ON resume_versions(created_at, id);
+
+-- Content-addressed resume text: identical versions share one blob. A 'delta'
+-- blob holds line operations against base_hash; depth counts the deltas down to
+-- the nearest 'full' snapshot, bounding how many must be applied to rebuild it.
+CREATE TABLE IF NOT EXISTS resume_blobs (
+    hash TEXT PRIMARY KEY, -- sha256 of the full text
+    kind TEXT NOT NULL, -- full, delta
+    base_hash TEXT REFERENCES resume_blobs(hash),
+    depth INTEGER DEFAULT 0,
+    size INTEGER, -- length of the full text
+    data BLOB NOT NULL -- zlib: the text, or the encoded delta
+);
+CREATE INDEX IF NOT EXISTS idx_resume_blobs_base ON resume_blobs(base_hash);
+
+CREATE TABLE IF NOT EXISTS interview_questions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    role TEXT DEFAULT '',
+    skill TEXT DEFAULT '', -- normalized skill, '' for general questions
+    level TEXT DEFAULT '', -- '' matches any level
+    category TEXT, -- Technical, Behavioral, Culture
+    question TEXT NOT NULL UNIQUE,
+    source TEXT DEFAULT 'generated', -- curated, generated
+    created_at TEXT
+);
+
+CREATE TABLE IF NOT EXISTS jd_signatures (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    content_hash TEXT NOT NULL UNIQUE, -- sha256 of the normalized JD text
+    canonical_hash TEXT NOT NULL, -- content_hash of the first JD in its near-duplicate group
+    similarity REAL DEFAULT 1.0, -- estimated Jaccard similarity to the canonical JD
+    signature BLOB NOT NULL, -- MinHash signature, little-endian uint32
+    source TEXT DEFAULT '', -- URL or 'pasted'
+    created_at TEXT
+);
+
+CREATE TABLE IF NOT EXISTS job_descriptions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    content_hash TEXT NOT NULL UNIQUE, -- same key as jd_signatures.content_hash
+    canonical_hash TEXT, -- near-duplicate group (see jd_signatures)
+    title TEXT DEFAULT '',
+    source_url TEXT DEFAULT '',
+    platform TEXT DEFAULT '',
+    content TEXT NOT NULL,
+    keywords TEXT DEFAULT '', -- comma-separated
+    fetched_at TEXT
 );
+
+-- Serialized analyzer outputs, shared across sessions and processes. A new
+-- analyzer_version never matches old rows, so bumping it invalidates only that analyzer.
+CREATE TABLE IF NOT EXISTS analysis_results (
+    analyzer TEXT NOT NULL,
+    resume_hash TEXT NOT NULL, -- sha256 of the resume text (same as resume_blobs.hash)
+    jd_hash TEXT NOT NULL DEFAULT '', -- canonical JD hash (jd_signatures), '' for resume-only analyzers
+    analyzer_version TEXT NOT NULL,
+    result TEXT NOT NULL, -- JSON
+    created_at TEXT,
+    PRIMARY KEY (analyzer, resume_hash, jd_hash, analyzer_version)
+) WITHOUT ROWID;
+
+-- Write counters per table, bumped by DBManager in the same transaction as the
+-- write. Pages and in-process indexes key their caches on them.
+CREATE TABLE IF NOT EXISTS data_versions (
+    table_name TEXT PRIMARY KEY,
+    version INTEGER NOT NULL DEFAULT 0
+) WITHOUT ROWID;
+
+-- Job Tracker analytics, kept current by the triggers below so the dashboard
+-- reads a handful of rows however many applications are tracked.
+-- Totals and ATS score sums per current status (a NULL status counts as 'Applied', the column default)
+CREATE TABLE IF NOT EXISTS application_status_stats (
+    status TEXT PRIMARY KEY,
+    count INTEGER NOT NULL DEFAULT 0,
+    scored INTEGER NOT NULL DEFAULT 0, -- applications with an ats_score
+    score_sum REAL NOT NULL DEFAULT 0
+) WITHOUT ROWID;
+
+-- Applications per week applied (Monday, '' when the date is missing) and current status
+CREATE TABLE IF NOT EXISTS application_weekly_stats (
+    week TEXT NOT NULL,
+    status TEXT NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (week, status)
+) WITHOUT ROWID;
+
+-- Applications per ATS score bucket (0-9 for 0-9 ... 90-100, -1 unscored) and current status
+CREATE TABLE IF NOT EXISTS application_score_stats (
+    bucket INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (bucket, status)
+) WITHOUT ROWID;
+
+CREATE TRIGGER IF NOT EXISTS job_applications_stats_ai AFTER INSERT ON job_applications BEGIN
+    INSERT INTO application_status_stats (status, count, scored, score_sum)
+    VALUES (COALESCE(new.status, 'Applied'), 1, new.ats_score IS NOT NULL, COALESCE(new.ats_score, 0))
+    ON CONFLICT(status) DO UPDATE SET count = count + 1, scored = scored + excluded.scored,
+                                      score_sum = score_sum + excluded.score_sum;
+    INSERT INTO application_weekly_stats (week, status, count)
+    VALUES (COALESCE(date(new.date_applied, 'weekday 0', '-6 days'), ''), COALESCE(new.status, 'Applied'), 1)
+    ON CONFLICT(week, status) DO UPDATE SET count = count + 1;
+    INSERT INTO application_score_stats (bucket, status, count)
+    VALUES (COALESCE(MAX(MIN(CAST(new.ats_score AS INTEGER) / 10, 9), 0), -1), COALESCE(new.status, 'Applied'), 1)
+    ON CONFLICT(bucket, status) DO UPDATE SET count = count + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS job_applications_stats_ad AFTER DELETE ON job_applications BEGIN
+    UPDATE application_status_stats
+    SET count = count - 1, scored = scored - (old.ats_score IS NOT NULL), score_sum = score_sum - COALESCE(old.ats_score, 0)
+    WHERE status = COALESCE(old.status, 'Applied');
+    UPDATE application_weekly_stats SET count = count - 1
+    WHERE week = COALESCE(date(old.date_applied, 'weekday 0', '-6 days'), '') AND status = COALESCE(old.status, 'Applied');
+    UPDATE application_score_stats SET count = count - 1
+    WHERE bucket = COALESCE(MAX(MIN(CAST(old.ats_score AS INTEGER) / 10, 9), 0), -1) AND status = COALESCE(old.status, 'Applied');
+END;
+
+-- Same as a delete of the old row plus an insert of the new one
+CREATE TRIGGER IF NOT EXISTS job_applications_stats_au AFTER UPDATE OF status, date_applied, ats_score ON job_applications
+WHEN COALESCE(old.status, 'Applied') IS NOT COALESCE(new.status, 'Applied') OR old.date_applied IS NOT new.date_applied OR old.ats_score IS NOT new.ats_score
+BEGIN
+    UPDATE application_status_stats
+    SET count = count - 1, scored = scored - (old.ats_score IS NOT NULL), score_sum = score_sum - COALESCE(old.ats_score, 0)
+    WHERE status = COALESCE(old.status, 'Applied');
+    UPDATE application_weekly_stats SET count = count - 1
+    WHERE week = COALESCE(date(old.date_applied, 'weekday 0', '-6 days'), '') AND status = COALESCE(old.status, 'Applied');
+    UPDATE application_score_stats SET count = count - 1
+    WHERE bucket = COALESCE(MAX(MIN(CAST(old.ats_score AS INTEGER) / 10, 9), 0), -1) AND status = COALESCE(old.status, 'Applied');
+    INSERT INTO application_status_stats (status, count, scored, score_sum)
+    VALUES (COALESCE(new.status, 'Applied'), 1, new.ats_score IS NOT NULL, COALESCE(new.ats_score, 0))
+    ON CONFLICT(status) DO UPDATE SET count = count + 1, scored = scored + excluded.scored,
+                                      score_sum = score_sum + excluded.score_sum;
+    INSERT INTO application_weekly_stats (week, status, count)
+    VALUES (COALESCE(date(new.date_applied, 'weekday 0', '-6 days'), ''), COALESCE(new.status, 'Applied'), 1)
+    ON CONFLICT(week, status) DO UPDATE SET count = count + 1;
+    INSERT INTO application_score_stats (bucket, status, count)
+    VALUES (COALESCE(MAX(MIN(CAST(new.ats_score AS INTEGER) / 10, 9), 0), -1), COALESCE(new.status, 'Applied'), 1)
+    ON CONFLICT(bucket, status) DO UPDATE SET count = count + 1;
+END;
@@ -0,0 +1,90 @@
+"""
+Analysis Store
+Read-through cache for analyzer outputs, persisted in the `analysis_results`
+table so a resume analyzed once is not re-analyzed by the next rerun, session
+or server process.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Callable
+from config import Settings
+from database.db_manager import db_manager
+from modules.jd_dedup import jd_dedup
+
+
+class AnalysisStore:
+    """
+    Results are keyed by analyzer name, resume hash, JD hash and analyzer
+    version. Bump an analyzer's version string whenever its output changes;
+    its older rows are then never read, and are purged the first time the new
+    version stores a result. The most recently used results are also kept in
+    memory as JSON, so every read hands out a fresh copy callers may mutate.
+    """
+
+    def __init__(self):
+        self._memory = OrderedDict()  # (analyzer, version, resume_hash, jd_hash) -> JSON, LRU order
+        self._purged = set()  # (analyzer, version) whose older rows were removed by this process
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def resume_key(text: str) -> str:
+        """sha256 of the exact resume text (matches the version vault's content hash)."""
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def jd_key(text: str) -> str:
+        """Canonical hash of a JD, so a reposted job shares its original's results."""
+        return jd_dedup.check(text)["canonical_hash"]
+
+    def analyze(self, analyzer: str, version: str, resume_text: str, compute: Callable, jd_text: str = None):
+        """Result of compute() for this resume (and JD), computed at most once per key."""
+        jd_hash = self.jd_key(jd_text) if jd_text else ""
+        return self.get_or_compute(analyzer, version, self.resume_key(resume_text), compute, jd_hash)
+
+    def get_or_compute(self, analyzer: str, version: str, resume_hash: str, compute: Callable, jd_hash: str = ""):
+        """Like analyze() for callers that already know the hashes; compute() runs only on a miss."""
+        key = (analyzer, version, resume_hash, jd_hash)
+        with self._lock:
+            stored = self._memory.get(key)
+            if stored is not None:
+                self._memory.move_to_end(key)
+        if stored is None:
+            stored = db_manager.get_analysis(analyzer, version, resume_hash, jd_hash)
+            if stored is not None:
+                self._remember(key, stored)
+        if stored is not None:
+            return json.loads(stored)
+
+        result = compute()
+        try:
+            stored = json.dumps(result)
+        except (TypeError, ValueError) as e:
+            print(f"Analysis result of {analyzer} is not JSON serializable, not stored: {e}")
+            return result
+        db_manager.save_analysis(analyzer, version, resume_hash, stored, jd_hash)
+        self._remember(key, stored)
+        if (analyzer, version) not in self._purged:
+            self._purged.add((analyzer, version))
+            db_manager.delete_analyses(analyzer, keep_version=version)
+        # Same shape as a cached read (tuples become lists)
+        return json.loads(stored)
+
+    def invalidate(self, analyzer: str):
+        """Forget every stored result of one analyzer."""
+        with self._lock:
+            for key in [k for k in self._memory if k[0] == analyzer]:
+                del self._memory[key]
+            self._purged = {p for p in self._purged if p[0] != analyzer}
+        db_manager.delete_analyses(analyzer)
+
+    def _remember(self, key, stored: str):
+        with self._lock:
+            self._memory[key] = stored
+            self._memory.move_to_end(key)
+            while len(self._memory) > Settings.ANALYSIS_MEMORY_CACHE_SIZE:
+                self._memory.popitem(last=False)
+
+analysis_store = AnalysisStore()
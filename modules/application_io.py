@@ -0,0 +1,179 @@
+"""
+Job Application Import / Export
+Streams CSV and JSONL files into and out of the job tracker. Rows are parsed,
+validated and inserted chunk by chunk, and exports are written straight from
+a database cursor, so memory stays flat however large the file is.
+"""
+
+import csv
+import json
+from datetime import datetime
+from typing import Callable, Dict, Iterator, Optional
+from config import Settings
+from database.db_manager import db_manager
+
+# Spreadsheet header (lowercased, spaces as underscores) -> column
+COLUMN_ALIASES = {
+    "company": "company", "company_name": "company", "employer": "company",
+    "role": "role", "role_title": "role", "title": "role", "position": "role", "job_title": "role",
+    "status": "status", "stage": "status",
+    "date_applied": "date_applied", "date": "date_applied", "applied": "date_applied", "applied_on": "date_applied",
+    "ats_score": "ats_score", "score": "ats_score",
+    "notes": "notes", "note": "notes", "comments": "notes",
+}
+DATE_FORMATS = ("%Y/%m/%d", "%m/%d/%Y", "%d.%m.%Y", "%d %b %Y", "%b %d, %Y")
+MAX_TEXT_LENGTH = 200  # company / role
+
+
+def _column(header: str):
+    return COLUMN_ALIASES.get(str(header).strip().lower().replace(" ", "_"))
+
+
+class ApplicationIO:
+    """CSV / JSONL import with per-row validation, and streaming export."""
+
+    def __init__(self):
+        self._statuses = {s.lower(): s for s in Settings.JOB_STATUSES}
+
+    def import_file(self, file, fmt: str, progress: Optional[Callable[[int], None]] = None) -> Dict:
+        """
+        Import a binary file object in "csv" or "jsonl" format.
+        Returns {"imported", "rejected", "errors": [(line, message), ...], "complete"};
+        rows that fail validation are skipped and only the first JOB_IMPORT_MAX_ERRORS
+        are listed. A file that cannot be read to the end (bad encoding, broken CSV)
+        stops the import at that line: the rows before it are imported, complete is
+        False and the reason is the last entry in errors.
+        """
+        report = {"imported": 0, "rejected": 0, "errors": [], "complete": True}
+        position = {"line": 0}
+        lines = self._lines(file, position)
+        records = self._csv_records(lines) if fmt == "csv" else self._jsonl_records(lines)
+        report["imported"] = db_manager.import_applications(
+            self._validated(records, report, position), Settings.JOB_IMPORT_CHUNK_SIZE, progress
+        )
+        return report
+
+    def export(self, out, fmt: str) -> int:
+        """Write every application to a text file object as "csv" or "jsonl"; returns the row count."""
+        rows = db_manager.iter_applications()
+        columns = next(rows)
+        count = 0
+        if fmt == "csv":
+            writer = csv.writer(out)
+            writer.writerow(columns)
+            for row in rows:
+                writer.writerow(row)
+                count += 1
+        else:
+            for row in rows:
+                out.write(json.dumps(dict(zip(columns, row)), ensure_ascii=False) + "\n")
+                count += 1
+        return count
+
+    @staticmethod
+    def _lines(file, position: Dict) -> Iterator[str]:
+        """
+        Lines of a binary file, decoded one at a time (BOM stripped), so a bad
+        byte is reported on its own line; position["line"] is the last line read.
+        """
+        for number, raw in enumerate(file, 1):
+            position["line"] = number
+            yield raw.decode("utf-8-sig" if number == 1 else "utf-8")
+
+    @staticmethod
+    def _csv_records(text) -> Iterator[tuple]:
+        """(line number, {column: value}) per data row; unknown headers are ignored."""
+        reader = csv.reader(text)
+        header = next(reader, None)
+        if header is None:
+            return
+        columns = [_column(h) for h in header]
+        for row in reader:
+            if not any(cell.strip() for cell in row):
+                continue
+            yield reader.line_num, {c: v for c, v in zip(columns, row) if c}
+
+    @staticmethod
+    def _jsonl_records(text) -> Iterator[tuple]:
+        for line_num, line in enumerate(text, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield line_num, ValueError(f"invalid JSON ({e.msg})")
+                continue
+            if not isinstance(record, dict):
+                yield line_num, ValueError("expected a JSON object")
+                continue
+            yield line_num, {_column(k): v for k, v in record.items() if _column(k)}
+
+    def _validated(self, records, report: Dict, position: Dict) -> Iterator[tuple]:
+        """
+        Insert-ready tuples; rejected rows are counted in `report` instead. An
+        unreadable line ends the stream, so the rows before it are still inserted.
+        """
+        try:
+            for line_num, record in records:
+                try:
+                    if isinstance(record, Exception):
+                        raise record
+                    yield self._row(record)
+                except ValueError as e:
+                    report["rejected"] += 1
+                    if len(report["errors"]) < Settings.JOB_IMPORT_MAX_ERRORS:
+                        report["errors"].append((line_num, str(e)))
+        except (UnicodeDecodeError, csv.Error) as e:
+            report["complete"] = False
+            reason = "not UTF-8 text" if isinstance(e, UnicodeDecodeError) else f"invalid CSV ({e})"
+            report["errors"].append((position["line"], f"{reason}, import stopped here"))
+
+    def _row(self, record: Dict) -> tuple:
+        company = self._text(record.get("company"))
+        role = self._text(record.get("role"))
+        if not company or not role:
+            raise ValueError("company and role are required")
+        if len(company) > MAX_TEXT_LENGTH or len(role) > MAX_TEXT_LENGTH:
+            raise ValueError(f"company and role must be at most {MAX_TEXT_LENGTH} characters")
+
+        status = self._text(record.get("status")) or "Applied"
+        if status.lower() not in self._statuses:
+            raise ValueError(f"unknown status '{status}' (expected one of {', '.join(Settings.JOB_STATUSES)})")
+
+        return (company, role, self._statuses[status.lower()], self._date(record.get("date_applied")),
+                self._score(record.get("ats_score")), self._text(record.get("notes")))
+
+    @staticmethod
+    def _text(value) -> str:
+        return "" if value is None else str(value).strip()
+
+    @staticmethod
+    def _date(value):
+        value = "" if value is None else str(value).strip()
+        if not value:
+            return None
+        try:
+            # ISO dates and timestamps ("2026-03-01", "2026-03-01T09:30:00"): the common, fast case
+            return datetime.fromisoformat(value).date().isoformat()
+        except ValueError:
+            pass
+        for fmt in DATE_FORMATS:
+            try:
+                return datetime.strptime(value, fmt).strftime("%Y-%m-%d")
+            except ValueError:
+                continue
+        raise ValueError(f"unrecognized date '{value}'")
+
+    @staticmethod
+    def _score(value):
+        if value is None or str(value).strip() == "":
+            return None
+        try:
+            score = float(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"ats_score '{value}' is not a number")
+        if not 0 <= score <= 100:
+            raise ValueError(f"ats_score {value} is outside 0-100")
+        return int(round(score))
+
+application_io = ApplicationIO()
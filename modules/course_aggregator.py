@@ -1,35 +1,88 @@
 """
 Course Aggregator Module
 Uses AI to curate specific high-quality learning resources with robust error handling.
+Resources are cached per skill, so changing one skill only regenerates that skill.
 """
 
-import streamlit as st
-import json
+import time
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from app_utils.llm_wrapper import ai_engine
+from app_utils.json_stream import extract_json_items
+from config import Settings
+
+_skill_executor = ThreadPoolExecutor(max_workers=Settings.LEARNING_PATH_MAX_PARALLEL, thread_name_prefix="learning-path")
+
+
+def normalize_skill(skill: str) -> str:
+    return " ".join(str(skill).lower().split())
+
 
 class CourseAggregator:
     """
     AI-powered Learning Roadmap Curator.
     """
+
+    def __init__(self):
+        self._cache = OrderedDict()  # normalized skill -> (stored_at, resources), LRU order
+        self._lock = threading.Lock()
     
     def get_learning_path(self, skills: list) -> dict:
         """
         Generates a roadmap for specific skills using AI.
         """
-        if not skills:
-            return {}
-            
-        skills_str = ", ".join(skills)
+        return dict(self.stream_learning_path(skills))
+
+    def stream_learning_path(self, skills: list):
+        """
+        Yields (skill, resources) pairs.
+        Cached skills are served immediately; the remaining skills are requested
+        in parallel, one prompt each, and yielded as they complete. A bad answer
+        only falls back for its own skill.
+        """
+        missing = []
+        seen = set()
+        for skill in skills:
+            key = normalize_skill(skill)
+            if not key or key in seen:
+                continue
+            seen.add(key)
+            cached = self._get_cached(key)
+            if cached is not None:
+                yield skill, cached
+            else:
+                missing.append(skill)
+
+        if not missing:
+            return
+
+        futures = {_skill_executor.submit(self._generate_for_skill, skill): skill for skill in missing}
+        for future in as_completed(futures):
+            skill = futures[future]
+            try:
+                resources = future.result()
+            except Exception as e:
+                print(f"Learning path error for {skill}: {e}")
+                resources = None
+
+            if resources:
+                self._put_cached(normalize_skill(skill), resources)
+                yield skill, resources
+            else:
+                # Not cached, so the next request retries the AI for this skill
+                yield skill, self._fallback([skill])[skill]
+
+    def _generate_for_skill(self, skill: str):
+        """Ask the AI for one skill; returns validated resources or None."""
         prompt = f"""
-        For each of these skills: {skills_str}, provide exactly 2 high-quality FREE learning resources.
+        Provide exactly 2 high-quality FREE learning resources for this skill: {skill}.
         
-        Output Format (STRICT JSON):
-        {{
-            "SkillName": [
-                {{"title": "Resource Title", "url": "https://www.youtube.com/results?search_query=...", "platform": "YouTube", "type": "Video"}},
-                {{"title": "Resource Title", "url": "https://www.google.com/search?q=...", "platform": "Google", "type": "Article"}}
-            ]
-        }}
+        Output Format (STRICT JSON list):
+        [
+            {{"title": "Resource Title", "url": "https://www.youtube.com/results?search_query=...", "platform": "YouTube", "type": "Video"}},
+            {{"title": "Resource Title", "url": "https://www.google.com/search?q=...", "platform": "Google", "type": "Article"}}
+        ]
         
         IMPORTANT:
         1. For YouTube: ALWAYS return a search URL (e.g., https://www.youtube.com/results?search_query=Learn+Python) instead of a specific video ID.
@@ -38,24 +91,31 @@ class CourseAggregator:
         
         response = ai_engine.chat(prompt, system="You are an expert technical mentor. Return ONLY clean JSON.")
         
-        try:
-            start = response.find("{")
-            end = response.rfind("}") + 1
-            if start != -1 and end != -1:
-                data = json.loads(response[start:end])
-                
-                # Validation: Ensure values are lists
-                validated_data = {}
-                for k, v in data.items():
-                    if isinstance(v, list):
-                        validated_data[k] = v
-                    elif isinstance(v, dict):
-                        validated_data[k] = [v] # Wrap single dict in list
-                return validated_data
-                
-            return self._fallback(skills)
-        except:
-            return self._fallback(skills)
+        # Validation: keep only resources with a title and a usable link
+        resources = [
+            r for r in extract_json_items(response, expect="list")
+            if isinstance(r, dict) and r.get("title") and str(r.get("url", "")).startswith("http")
+        ]
+        return resources or None
+
+    def _get_cached(self, key: str):
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            stored_at, resources = entry
+            if time.time() - stored_at > Settings.LEARNING_PATH_CACHE_TTL:
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+            return resources
+
+    def _put_cached(self, key: str, resources: list):
+        with self._lock:
+            self._cache[key] = (time.time(), resources)
+            self._cache.move_to_end(key)
+            while len(self._cache) > Settings.LEARNING_PATH_CACHE_SIZE:
+                self._cache.popitem(last=False)
 
     def _fallback(self, skills) -> dict:
         roadmap = {}
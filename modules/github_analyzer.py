@@ -3,92 +3,260 @@ GitHub Analyzer Module
 Analyzes GitHub profiles to extract skills and project stats
 """
 
-import streamlit as st
-import pandas as pd
-from github import Github, GithubException
-from config import APIKeys
-from collections import Counter
+import json
+import os
+import time
+import threading
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.utils import parse_header_links
+from urllib.parse import urlparse, parse_qs
+from app_utils.github_api import GitHubClient, GitHubError, RateLimitExceeded
+from app_utils.http_cache import DiskCache
+from config import APIKeys, Settings
+
+_github_executor = ThreadPoolExecutor(max_workers=Settings.GITHUB_MAX_PARALLEL, thread_name_prefix="github")
 
 class GitHubAnalyzer:
     """
     Analyzes a GitHub profile for tech stack and activity.
+    Crawls every repository page concurrently, weights languages by the bytes
+    GitHub reports per repo (cached by pushed_at, so unchanged repos are never
+    refetched) and reuses finished profiles for GITHUB_PROFILE_CACHE_TTL.
     """
-    
+
+    # Partial results are emitted at most this often while language data arrives
+    STREAM_INTERVAL = 0.3
+
     def __init__(self):
-        self.g = None
         # Use token if available to avoid rate limits
-        token = APIKeys.GITHUB_TOKEN
-        if token:
-            self.g = Github(token)
-        else:
-            self.g = Github()
+        self.client = GitHubClient(
+            Settings.GITHUB_API_URL,
+            token=APIKeys.GITHUB_TOKEN,
+            cache_dir=Settings.GITHUB_CACHE_DIR,
+            timeout=Settings.GITHUB_TIMEOUT,
+            pool_size=Settings.GITHUB_MAX_PARALLEL,
+            max_wait=Settings.GITHUB_RATE_LIMIT_MAX_WAIT,
+        )
+        self.language_cache = DiskCache(os.path.join(Settings.GITHUB_CACHE_DIR, "languages"))
+        self._cache = OrderedDict()  # lowercased username -> (stored_at, result), LRU order
+        self._lock = threading.Lock()
 
-    def analyze_profile(self, username: str) -> dict:
+    def analyze_profile(self, username: str, refresh: bool = False) -> dict:
         """
         Fetch and analyze user data.
         """
+        result = {"error": "No data"}
+        for result in self.stream_profile(username, refresh):
+            pass
+        return result
+
+    def stream_profile(self, username: str, refresh: bool = False):
+        """
+        Yields progressively more complete analyses (same shape as analyze_profile)
+        as repository pages and language data arrive. The last one has
+        complete=True, or carries an error.
+        """
+        key = username.strip().lower()
+        if not refresh:
+            cached = self._get_cached(key)
+            if cached is not None:
+                yield cached
+                return
+
+        result = None
         try:
-            user = self.g.get_user(username)
-            
-            # Basic Stats
-            stats = {
-                "name": user.name or username,
-                "bio": user.bio,
-                "repos": user.public_repos,
-                "followers": user.followers,
-                "avatar": user.avatar_url,
-                "url": user.html_url,
-                "created_at": user.created_at.year
-            }
-            
-            # Analyze Repos
-            repos = user.get_repos()
-            languages = []
-            topics = []
-            top_projects = []
-            
-            # Limit to last 30 updated repos to be fast
-            for repo in repos.get_page(0):
-                if not repo.fork:
-                    if repo.language:
-                        languages.append(repo.language)
-                    topics.extend(repo.get_topics())
-                    
-                    # Score repo based on stars + forks
-                    score = repo.stargazers_count * 2 + repo.forks_count
-                    if score > 0 or (repo.description and len(repo.description) > 50):
-                        top_projects.append({
-                            "name": repo.name,
-                            "stars": repo.stargazers_count,
-                            "language": repo.language,
-                            "desc": repo.description,
-                            "url": repo.html_url,
-                            "score": score
-                        })
-            
-            # Sort projects
-            top_projects.sort(key=lambda x: x['score'], reverse=True)
-            
-            # Language Stats
-            lang_counts = Counter(languages)
-            total_langs = sum(lang_counts.values())
-            lang_stats = {k: round((v/total_langs)*100, 1) for k, v in lang_counts.most_common(5)}
-            
-            return {
-                "stats": stats,
-                "languages": lang_stats,
-                "topics": Counter(topics).most_common(10),
-                "top_projects": top_projects[:5],
-                "error": None
-            }
-            
-        except GithubException as e:
-            if e.status == 404:
-                return {"error": "User not found"}
-            elif e.status == 403:
-                return {"error": "API Rate Limit Exceeded. Add GITHUB_TOKEN to .env"}
-            return {"error": str(e)}
+            for result in self._crawl(username.strip()):
+                yield result
+        except RateLimitExceeded as e:
+            minutes = max(1, int((e.reset_at - time.time()) // 60) + 1)
+            yield {"error": f"API Rate Limit Exceeded (resets in ~{minutes} min). Add GITHUB_TOKEN to .env"}
+            return
+        except GitHubError as e:
+            yield {"error": "User not found" if e.status == 404 else str(e)}
+            return
         except Exception as e:
-            return {"error": str(e)}
+            yield {"error": str(e)}
+            return
+
+        if result is not None and result.get("complete"):
+            self._put_cached(key, result)
+
+    def rate_limit(self) -> dict:
+        """Remaining API quota as last reported by GitHub, per resource."""
+        return self.client.rate.snapshot()
+
+    def _crawl(self, username: str):
+        user, _ = self.client.get(f"/users/{username}")
+
+        # 1. Repository pages: the first one tells us how many there are
+        per_page = min(100, Settings.GITHUB_MAX_REPOS)
+        params = {"type": "owner", "sort": "pushed", "per_page": per_page}
+        first, headers = self.client.get(f"/users/{username}/repos", dict(params, page=1))
+        pages = {1: first}
+        last_page = min(self._last_page(headers.get("Link")), -(-Settings.GITHUB_MAX_REPOS // per_page))
+        yield self._summarize(user, first, {}, complete=False)
+
+        futures = {
+            _github_executor.submit(self.client.get, f"/users/{username}/repos", dict(params, page=n)): n
+            for n in range(2, last_page + 1)
+        }
+        for future in as_completed(futures):
+            pages[futures[future]] = future.result()[0]
+            repos = [r for n in sorted(pages) for r in pages[n]]
+            yield self._summarize(user, repos, {}, complete=False)
+
+        seen = set()
+        repos = []
+        for n in sorted(pages):
+            for repo in pages[n]:
+                # Pages can shift while a user pushes; keep the first copy
+                if repo["id"] not in seen:
+                    seen.add(repo["id"])
+                    repos.append(repo)
+        repos = repos[:Settings.GITHUB_MAX_REPOS]
+
+        # 2. Language bytes per own repo, from cache when pushed_at is unchanged
+        language_bytes = {}
+        missing = []
+        for repo in repos:
+            if repo.get("fork"):
+                continue
+            cached = self._cached_languages(repo)
+            if cached is not None:
+                language_bytes[repo["full_name"]] = cached
+            else:
+                missing.append(repo)
+
+        # Keep some quota for other lookups; the rest fall back to primary language
+        quota = self.client.rate.snapshot().get("core")
+        if quota is not None:
+            missing = missing[:max(0, quota["remaining"] - Settings.GITHUB_QUOTA_RESERVE)]
+
+        futures = {_github_executor.submit(self._fetch_languages, repo): repo for repo in missing}
+        last_yield = time.monotonic()
+        for future in as_completed(futures):
+            repo = futures[future]
+            try:
+                language_bytes[repo["full_name"]] = future.result()
+            except Exception as e:
+                # e.g. quota exhausted: this repo falls back to its primary language
+                print(f"GitHub languages error for {repo['full_name']}: {e}")
+            if time.monotonic() - last_yield >= self.STREAM_INTERVAL:
+                last_yield = time.monotonic()
+                yield self._summarize(user, repos, language_bytes, complete=False)
+
+        yield self._summarize(user, repos, language_bytes, complete=True)
+
+    @staticmethod
+    def _last_page(link_header: str) -> int:
+        if not link_header:
+            return 1
+        for link in parse_header_links(link_header):
+            if link.get("rel") == "last":
+                page = parse_qs(urlparse(link["url"]).query).get("page", ["1"])[0]
+                return int(page) if page.isdigit() else 1
+        return 1
+
+    @staticmethod
+    def _language_key(repo: dict) -> str:
+        return f"{repo['full_name']}@{repo.get('pushed_at')}"
+
+    def _cached_languages(self, repo: dict):
+        entry = self.language_cache.get(self._language_key(repo))
+        return json.loads(entry[1]) if entry is not None else None
+
+    def _fetch_languages(self, repo: dict) -> dict:
+        languages, _ = self.client.get(f"/repos/{repo['full_name']}/languages")
+        self.language_cache.put(self._language_key(repo), {}, json.dumps(languages).encode("utf-8"))
+        return languages
+
+    def _summarize(self, user: dict, repos: list, language_bytes: dict, complete: bool) -> dict:
+        username = user.get("login", "")
+
+        # Basic Stats
+        stats = {
+            "name": user.get("name") or username,
+            "bio": user.get("bio"),
+            "repos": user.get("public_repos", 0),
+            "followers": user.get("followers", 0),
+            "avatar": user.get("avatar_url"),
+            "url": user.get("html_url"),
+            "created_at": int((user.get("created_at") or "1970")[:4])
+        }
+
+        byte_counts = Counter()
+        topics = []
+        top_projects = []
+        own = 0
+
+        for repo in repos:
+            if repo.get("fork"):
+                continue
+            own += 1
+            measured = language_bytes.get(repo["full_name"])
+            if measured:
+                byte_counts.update(measured)
+            elif repo.get("language"):
+                # Not measured (yet): approximate with the repo size in the primary language
+                byte_counts[repo["language"]] += max(1, repo.get("size", 1)) * 1024
+            topics.extend(repo.get("topics") or [])
+
+            # Score repo based on stars + forks
+            stars = repo.get("stargazers_count", 0)
+            description = repo.get("description")
+            score = stars * 2 + repo.get("forks_count", 0)
+            if score > 0 or (description and len(description) > 50):
+                top_projects.append({
+                    "name": repo["name"],
+                    "stars": stars,
+                    "language": repo.get("language"),
+                    "desc": description,
+                    "url": repo.get("html_url"),
+                    "score": score
+                })
+
+        # Sort projects
+        top_projects.sort(key=lambda x: x['score'], reverse=True)
+
+        # Language Stats (share of code bytes)
+        total_bytes = sum(byte_counts.values())
+        lang_stats = {k: round((v/total_bytes)*100, 1) for k, v in byte_counts.most_common(5)} if total_bytes else {}
+
+        return {
+            "stats": stats,
+            "languages": lang_stats,
+            "language_bytes": dict(byte_counts),
+            "topics": Counter(topics).most_common(10),
+            "top_projects": top_projects[:5],
+            "progress": {
+                "repos_loaded": len(repos),
+                "repos_total": min(stats["repos"], Settings.GITHUB_MAX_REPOS),
+                "languages_measured": len(language_bytes),
+                "own_repos": own,
+            },
+            "complete": complete,
+            "fetched_at": time.time(),
+            "error": None
+        }
+
+    def _get_cached(self, key: str):
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            stored_at, result = entry
+            if time.time() - stored_at > Settings.GITHUB_PROFILE_CACHE_TTL:
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+            return result
+
+    def _put_cached(self, key: str, result: dict):
+        with self._lock:
+            self._cache[key] = (time.time(), result)
+            self._cache.move_to_end(key)
+            while len(self._cache) > Settings.GITHUB_PROFILE_CACHE_SIZE:
+                self._cache.popitem(last=False)
 
 github_analyzer = GitHubAnalyzer()
@@ -4,46 +4,99 @@ Features: Question Generator, Model Answers
 """
 
 from app_utils.llm_wrapper import ai_engine
-import json
+from app_utils.json_stream import iter_json_items
+from modules.question_bank import question_bank
+from config import Settings
 
 class InterviewCoach:
     
-    def generate_questions(self, role: str, skills: list, level: str = "Intermediate") -> list:
+    def generate_questions(self, role: str, skills: list, level: str = "Intermediate", use_bank: bool = True) -> list:
         """
         Generates interview questions based on role and skills.
         """
+        return list(self.stream_questions(role, skills, level, use_bank))
+
+    def stream_questions(self, role: str, skills: list, level: str = "Intermediate", use_bank: bool = True):
+        """
+        Yields interview questions one by one.
+        Stored questions from the question bank come first and instantly; the AI is
+        only asked for the categories the bank cannot cover, and its answers are
+        added to the bank for next time. use_bank=False skips the bank both ways
+        and asks the AI for the whole set (the load test uses it).
+        """
+        quota = {
+            "Technical": Settings.QUESTION_BANK_TECHNICAL,
+            "Behavioral": Settings.QUESTION_BANK_BEHAVIORAL,
+            "Culture": Settings.QUESTION_BANK_CULTURE,
+        }
+        target = sum(quota.values())
+        if use_bank:
+            stored = question_bank.find(role, skills, level)
+        else:
+            stored = {category: [] for category in quota}
+
+        served = []
+        gaps = {}
+        for category, wanted in quota.items():
+            picks = stored[category][:wanted]
+            served.extend(picks)
+            if len(picks) < wanted:
+                gaps[category] = wanted - len(picks)
+        yield from served
+
+        if gaps:
+            generated = []
+            for item in self._generate_missing(role, skills, level, gaps):
+                if item["question"] in served:
+                    continue
+                generated.append(item)
+                # Extra questions beyond the set size are still worth caching
+                if len(served) < target:
+                    served.append(item["question"])
+                    yield item["question"]
+            if use_bank:
+                question_bank.add(role, level, generated, skills)
+
+        if len(served) < target:
+            skill_str = ", ".join(skills)
+            for q in [
+                f"Can you explain your experience with {skill_str}?",
+                f"Tell me about a challenge you faced as a {role}.",
+                "Where do you see yourself in 5 years?",
+                "What is your greatest technical strength?",
+                "How do you handle conflict in a team?"
+            ][:target - len(served)]:
+                yield q
+
+    def _generate_missing(self, role: str, skills: list, level: str, gaps: dict):
+        """Stream only the questions the bank is missing, as dicts with question/category/skill."""
         skill_str = ", ".join(skills)
+        breakdown = "\n".join(
+            f"        - {count} {category} question{'s' if count > 1 else ''}"
+            + (" specific to the skills." if category == "Technical" else ".")
+            for category, count in gaps.items()
+        )
         prompt = f"""
-        Generate 5 interview questions for a {level} {role} position.
+        Generate {sum(gaps.values())} interview questions for a {level} {role} position.
         The candidate has these skills: {skill_str}.
         
         Include:
-        - 2 Technical questions specific to the skills.
-        - 2 Behavioral/Scenario questions.
-        - 1 "Culture Fit" or Soft Skill question.
+{breakdown}
         
-        Output format: Return ONLY a JSON list of strings.
-        Example: ["Question 1", "Question 2"]
+        Output format: Return ONLY a JSON list of objects with keys "question",
+        "category" (Technical, Behavioral or Culture) and "skill" (the skill a Technical question targets, else "").
+        Example: [{{"question": "Question 1", "category": "Technical", "skill": "python"}}]
         """
         
-        response = ai_engine.chat(prompt, system="You are a hiring manager. Output JSON only.")
+        chunks = ai_engine.stream(prompt, system="You are a hiring manager. Output JSON only.")
         
-        # Clean response to ensure list
-        try:
-            # Simple heuristic to extract list if wrapped in text
-            if "[" in response and "]" in response:
-                start = response.find("[")
-                end = response.rfind("]") + 1
-                return json.loads(response[start:end])
-            return json.loads(response)
-        except:
-            return [
-                f"Can you explain your experience with {skill_str}?",
-                f"Tell me about a challenge you faced as a {role}.",
-                "Where do you see yourself in 5 years?",
-                "What is your greatest technical strength?",
-                "How do you handle conflict in a team?"
-            ]
+        for item in iter_json_items(chunks, expect="list"):
+            # Plain strings are accepted too; they are cached untagged
+            if isinstance(item, str):
+                item = {"question": item}
+            if isinstance(item, dict) and isinstance(item.get("question"), str) and item["question"].strip():
+                item["question"] = item["question"].strip()
+                yield item
 
     def get_model_answer(self, question: str) -> str:
         """
@@ -0,0 +1,120 @@
+"""
+JD Near-Duplicate Detection
+The same job is often reposted across boards with small edits. Every fetched or
+pasted JD is fingerprinted with MinHash and looked up in an LSH index, so a
+repost maps to the canonical JD seen first and its analysis can be reused.
+"""
+
+import hashlib
+import threading
+from typing import Dict
+from config import Settings
+from app_utils.minhash import MinHasher, LSHIndex, normalize_text
+from database.db_manager import db_manager
+
+
+def content_hash(text: str) -> str:
+    """Exact-match key: sha256 of the normalized text."""
+    return hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+
+
+class JDDeduplicator:
+    """
+    LSH index over the `jd_signatures` table, loaded once at startup and
+    topped up with rows other processes add (seen through data_version).
+    Lookups hash the text, probe JD_LSH_BANDS buckets and compare only the
+    candidates found there, so cost does not grow with the size of the library.
+    """
+
+    def __init__(self):
+        self.hasher = MinHasher(Settings.JD_MINHASH_PERMUTATIONS, Settings.JD_MINHASH_SHINGLE_SIZE)
+        self.index = LSHIndex(Settings.JD_MINHASH_PERMUTATIONS, Settings.JD_LSH_BANDS)
+        self._canonical = {}  # content_hash -> canonical content_hash
+        self._lock = threading.Lock()
+        self._last_id = 0  # newest jd_signatures row in the index
+        self._data_version = None
+        self._load()
+
+    def _load(self):
+        """Index signature rows not seen yet; a no-op while jd_signatures is unchanged."""
+        try:
+            version = db_manager.data_version("jd_signatures")
+            if version == self._data_version:
+                return
+            rows = db_manager.get_jd_signatures(after_id=self._last_id)
+        except Exception as e:
+            print(f"JD signature load error: {e}")
+            return
+        with self._lock:
+            for row_id, key, canonical, blob in rows:
+                self._last_id = max(self._last_id, row_id)
+                if key in self._canonical:
+                    continue
+                self._canonical[key] = canonical
+                self.index.add(key, MinHasher.from_bytes(blob))
+            self._data_version = version
+
+    def size(self) -> int:
+        return len(self._canonical)
+
+    def check(self, text: str) -> Dict:
+        """
+        Look a JD up without storing it. Returns content_hash, canonical_hash
+        (the key later caches should use), similarity to that canonical JD and
+        is_duplicate (True for exact or near-duplicates of a stored JD).
+        """
+        return self._lookup(text)[0]
+
+    def register(self, text: str, source: str = "") -> Dict:
+        """check() and remember the JD so later reposts are recognized."""
+        result, signature = self._lookup(text)
+        key = result["content_hash"]
+        if signature is None or key in self.index:
+            return result
+        with self._lock:
+            self._canonical[key] = result["canonical_hash"]
+        self.index.add(key, signature)
+        try:
+            db_manager.add_jd_signature(
+                key, result["canonical_hash"], result["similarity"] if result["is_duplicate"] else 1.0,
+                MinHasher.to_bytes(signature), source
+            )
+        except Exception as e:
+            print(f"JD signature save error: {e}")
+        return result
+
+    def canonical_key(self, text: str, source: str = "") -> str:
+        """Stable key for caching anything derived from this JD; shared by its reposts."""
+        return self.register(text, source)["canonical_hash"]
+
+    def _lookup(self, text: str):
+        """(result, signature); signature is None when the text is already stored or has no words."""
+        self._load()
+        key = content_hash(text)
+        with self._lock:
+            canonical = self._canonical.get(key)
+        if canonical is not None:
+            return self._result(key, canonical, 1.0), None
+        signature = self.hasher.signature(text)
+        if signature is None:
+            return self._result(key, key, 0.0), None
+        matches = self.index.query(signature, Settings.JD_DUPLICATE_THRESHOLD)
+        if matches:
+            best, similarity = matches[0]
+            with self._lock:
+                canonical = self._canonical.get(best, best)
+            return self._result(key, canonical, similarity), signature
+        return self._result(key, key, 0.0), signature
+
+    @staticmethod
+    def _result(key, canonical, similarity) -> Dict:
+        return {
+            "content_hash": key,
+            "canonical_hash": canonical,
+            "similarity": round(similarity, 3),
+            "is_duplicate": similarity > 0,
+        }
+
+
+# Built at import so the index is ready before the first lookup
+jd_dedup = JDDeduplicator()
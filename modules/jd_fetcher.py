@@ -3,11 +3,15 @@ JD Auto-Fetcher Module
 Extracts job descriptions from URLs (LinkedIn, Indeed, Naukri, etc.)
 """
 
-import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import re
 import streamlit as st
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from app_utils.http_cache import CachedSession, DiskCache
+from app_utils.rate_limit import HostRateLimiter
+from app_utils.html_extract import extract_main_text
+from config import Settings
 
 class JDFetcher:
     """
@@ -28,6 +32,33 @@ class JDFetcher:
         "Cache-Control": "max-age=0",
     }
 
+    def __init__(self):
+        # One pooled session for all fetches; pages are cached on disk and revalidated.
+        # Per-host token buckets (applied only to real network requests) keep bulk
+        # fetches from hammering job boards.
+        self.http = CachedSession(
+            Settings.HTTP_CACHE_DIR,
+            timeout=Settings.JD_FETCH_TIMEOUT,
+            max_age=Settings.HTTP_CACHE_MAX_AGE,
+            headers=self.HEADERS,
+            rate_limiter=HostRateLimiter(Settings.JD_HOST_RATE_LIMITS, Settings.JD_DEFAULT_RATE_LIMIT),
+        )
+        self.text_cache = DiskCache(Settings.JD_TEXT_CACHE_DIR)
+
+    # Only these containers are materialized when parsing platform pages
+    LINKEDIN_SELECTORS = [
+        'div.description__text', 
+        'div.show-more-less-html__markup',
+        'div.job-description'
+    ]
+    LINKEDIN_CLASSES = {"description__text", "show-more-less-html__markup", "job-description"}
+    # Containers carry several classes ("description__text description__text--rich"); while
+    # straining, bs4 may hand over the whole class string or one token, so match any token
+    LINKEDIN_STRAINER = SoupStrainer(
+        "div", class_=lambda c: bool(c) and not JDFetcher.LINKEDIN_CLASSES.isdisjoint(c.split())
+    )
+    INDEED_STRAINER = SoupStrainer(id="jobDescriptionText")
+
     @staticmethod
     def identify_platform(url: str) -> str:
         """Identify the job platform from the URL."""
@@ -42,6 +73,14 @@ class JDFetcher:
         else:
             return "Generic"
 
+    @staticmethod
+    def normalize_url(url: str) -> str:
+        """Automatic URL correction: Add https:// if missing"""
+        url = url.strip()
+        if not url.startswith(('http://', 'https://')):
+            url = 'https://' + url
+        return url
+
     def fetch_from_url(self, url: str) -> str:
         """
         Main method to fetch JD text from a URL.
@@ -49,10 +88,7 @@ class JDFetcher:
         if not url:
             return ""
             
-        # Automatic URL correction: Add https:// if missing
-        if not url.startswith(('http://', 'https://')):
-            url = 'https://' + url
-            
+        url = self.normalize_url(url)
         platform = self.identify_platform(url)
         
         # Warning for LinkedIn Profiles (common user error)
@@ -62,12 +98,7 @@ class JDFetcher:
             return ""
         
         try:
-            if platform == "LinkedIn":
-                return self._scrape_linkedin(url)
-            elif platform == "Indeed":
-                return self._scrape_indeed(url)
-            else:
-                return self._scrape_generic(url)
+            return self._fetch(url, platform)
         except Exception as e:
             if "999" in str(e):
                 st.error("⚠️ LinkedIn blocked the request (Status 999). This is common with automated tools.")
@@ -76,6 +107,66 @@ class JDFetcher:
                 st.error(f"Error fetching JD from {platform}: {str(e)}")
             return ""
 
+    def fetch_many(self, urls: list, max_workers: int = None):
+        """
+        Fetch many postings concurrently (at most JD_BULK_CONCURRENCY at once,
+        rate-limited per host). Yields one dict per URL as soon as it completes:
+        {"url", "platform", "text", "error"} - error is None on success.
+        """
+        unique = []
+        for url in urls:
+            if url and url.strip():
+                url = self.normalize_url(url)
+                if url not in unique:
+                    unique.append(url)
+        if not unique:
+            return
+
+        workers = max_workers or Settings.JD_BULK_CONCURRENCY
+        pool = ThreadPoolExecutor(max_workers=min(workers, len(unique)), thread_name_prefix="jd-fetch")
+        try:
+            futures = {pool.submit(self._fetch_result, url): url for url in unique}
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            # A consumer that stops early (rerun, closed generator) must not wait for queued fetches
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _fetch_result(self, url: str) -> dict:
+        """Non-UI variant of fetch_from_url: errors are returned, not rendered."""
+        platform = self.identify_platform(url)
+        result = {"url": url, "platform": platform, "text": "", "error": None}
+        if platform == "LinkedIn" and "/in/" in url:
+            result["error"] = "LinkedIn profile URL, not a job posting."
+            return result
+        try:
+            result["text"] = self._fetch(url, platform)
+            if not result["text"]:
+                result["error"] = "No job description found on the page."
+        except Exception as e:
+            if "999" in str(e):
+                result["error"] = "LinkedIn blocked the request (Status 999). Paste the text manually."
+            else:
+                result["error"] = str(e)
+        return result
+
+    def _fetch(self, url: str, platform: str) -> str:
+        """Scrape one posting, using the extracted-text cache; raises on failure."""
+        # Previously extracted text for this URL is served instantly
+        cached = self.text_cache.get_text(url, max_age=Settings.JD_TEXT_CACHE_TTL)
+        if cached:
+            return cached
+        
+        if platform == "LinkedIn":
+            text = self._scrape_linkedin(url)
+        elif platform == "Indeed":
+            text = self._scrape_indeed(url)
+        else:
+            text = self._scrape_generic(url)
+        if text:
+            self.text_cache.put_text(url, text)
+        return text
+
     def _scrape_linkedin(self, url: str) -> str:
         """
         Scrape public LinkedIn job posting.
@@ -85,26 +176,22 @@ class JDFetcher:
         # Real scraping often requires Selenium/Playwright for heavy JS sites like LinkedIn, 
         # but the request method works for public-facing job pages sometimes.
         
-        response = requests.get(url, headers=self.HEADERS)
+        response = self.http.get(url)
         if response.status_code != 200:
             raise Exception(f"Status code {response.status_code}")
+        html = response.text
             
-        soup = BeautifulSoup(response.text, 'html.parser')
+        # Restricted parse: only the description containers become tags
+        soup = BeautifulSoup(html, 'html.parser', parse_only=self.LINKEDIN_STRAINER)
         
         # Try different common selectors for LinkedIn public jobs
-        selectors = [
-            'div.description__text', 
-            'div.show-more-less-html__markup',
-            'div.job-description'
-        ]
-        
-        for selector in selectors:
+        for selector in self.LINKEDIN_SELECTORS:
             element = soup.select_one(selector)
             if element:
                 return self._clean_html(element.get_text(separator="\n"))
                 
         # Fallback: getting all text from main
-        main = soup.find('main')
+        main = BeautifulSoup(html, 'html.parser', parse_only=SoupStrainer("main")).find('main')
         if main:
             return self._clean_html(main.get_text(separator="\n"))
             
@@ -112,8 +199,10 @@ class JDFetcher:
 
     def _scrape_indeed(self, url: str) -> str:
         """Scrape Indeed job posting."""
-        response = requests.get(url, headers=self.HEADERS)
-        soup = BeautifulSoup(response.text, 'html.parser')
+        response = self.http.get(url)
+        if response.status_code != 200:
+            raise Exception(f"Status code {response.status_code}")
+        soup = BeautifulSoup(response.text, 'html.parser', parse_only=self.INDEED_STRAINER)
         
         # Indeed usually uses 'jobDescriptionText' id
         element = soup.find(id="jobDescriptionText")
@@ -124,19 +213,16 @@ class JDFetcher:
 
     def _scrape_generic(self, url: str) -> str:
         """Generic fallback scraper for other sites."""
-        response = requests.get(url, headers=self.HEADERS)
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # Remove script and style elements
-        for script in soup(["script", "style", "nav", "footer", "header"]):
-            script.decompose()
-            
-        # Get text
-        text = soup.get_text(separator="\n")
+        # Oversized pages are truncated; the description is almost always near the top
+        response = self.http.get(url, max_bytes=Settings.JD_MAX_PAGE_BYTES)
+        if response.status_code != 200:
+            # Error and block pages are not job descriptions (and must not reach the text cache)
+            raise Exception(f"Status code {response.status_code}")
         
-        # Simple heuristic: The JD is usually the largest block of text
-        # or we return the whole body cleaned
-        return self._clean_html(text)
+        # One streaming pass (no DOM tree): script/style/nav/footer/header are skipped
+        # and the block with the highest link-adjusted text density is the JD.
+        # Falls back to the whole page text if no block stands out.
+        return self._clean_html(extract_main_text(response.text))
 
     def _clean_html(self, text: str) -> str:
         """Clean up extracted text."""
@@ -0,0 +1,49 @@
+"""
+JD Library
+Persists fetched and pasted job descriptions in SQLite (full-text searchable)
+so they outlive the session and can be linked to tracked applications.
+"""
+
+from typing import List
+from database.db_manager import db_manager
+from modules.jd_dedup import jd_dedup
+
+
+class JDLibrary:
+    """Thin layer over DBManager that fills in hashes, title and keywords on save."""
+
+    KEYWORDS_PER_JD = 15
+
+    def save(self, text: str, source_url: str = "", platform: str = "") -> int:
+        """Store a JD (once per distinct text) and return its library id."""
+        dup = jd_dedup.register(text, source_url or "pasted")
+        return db_manager.save_jd(
+            dup["content_hash"], text,
+            title=self._title(text),
+            source_url=source_url,
+            platform=platform or ("Pasted" if not source_url else ""),
+            keywords=self._keywords(text),
+            canonical_hash=dup["canonical_hash"],
+        )
+
+    def search(self, query: str, limit: int = 20) -> List[dict]:
+        return db_manager.search_jds(query, limit)
+
+    def get(self, jd_id: int):
+        return db_manager.get_jd(jd_id)
+
+    @staticmethod
+    def _title(text: str) -> str:
+        first_line = next((line.strip() for line in text.splitlines() if line.strip()), "")
+        return first_line[:120]
+
+    def _keywords(self, text: str) -> List[str]:
+        try:
+            from app_utils.analysis_utils import extract_top_keywords
+            return extract_top_keywords(text, top_k=self.KEYWORDS_PER_JD)
+        except Exception as e:
+            print(f"JD keyword extraction error: {e}")
+            return []
+
+
+jd_library = JDLibrary()
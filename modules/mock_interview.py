@@ -2,29 +2,147 @@
 Mock Interview Module
 """
 
-from app_utils.llm_wrapper import ai_engine
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from app_utils.llm_wrapper import ai_engine, is_fallback_response
+from config import Settings
+
+# Background summarization keeps the live chat path free of extra LLM calls
+_summary_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="interview-summary")
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate (~4 characters per token), good enough for budgeting."""
+    return len(text) // 4 + 1
+
+
+def _clip(text: str, max_tokens: int) -> str:
+    max_chars = max_tokens * 4
+    if len(text) <= max_chars:
+        return text
+    return text[:max_chars].rstrip() + " …"
+
+
+class InterviewContext:
+    """
+    Incremental context for one interview session.
+    Older turns are folded into a compact running summary in the background;
+    the turns after it are sent verbatim, newest first, until the token budget is spent.
+    Keep one instance per chat (e.g. in st.session_state) so the summary survives reruns.
+    """
+
+    def __init__(self):
+        self.summary = ""
+        self.summarized_upto = 0  # number of history messages folded into the summary
+        self._pending = None
+        self._lock = threading.Lock()
+
+    def build(self, history: list) -> str:
+        """Prompt-ready context: running summary plus as many recent turns as fit."""
+        self._collect_summary()
+        with self._lock:
+            summary = self.summary
+            start = min(self.summarized_upto, len(history))
+
+        budget = Settings.INTERVIEW_CONTEXT_TOKEN_BUDGET
+        parts = []
+        if summary:
+            summary = _clip(summary, Settings.INTERVIEW_SUMMARY_MAX_TOKENS)
+            budget -= estimate_tokens(summary)
+
+        lines = []
+        for msg in reversed(history[start:]):
+            line = f"{msg['role'].upper()}: {_clip(msg['content'], Settings.INTERVIEW_MESSAGE_MAX_TOKENS)}"
+            cost = estimate_tokens(line)
+            if cost > budget:
+                break
+            budget -= cost
+            lines.append(line)
+        lines.reverse()
+
+        if summary:
+            parts.append(f"Summary of the interview so far:\n{summary}\n")
+        parts.append("\n".join(lines))
+        return "\n".join(parts)
+
+    def refresh(self, history: list):
+        """
+        Schedule a background summary update once enough turns have aged out of
+        the verbatim window. Returns immediately; the next build() picks it up.
+        """
+        with self._lock:
+            if self._pending is not None:
+                return
+            end = len(history) - Settings.INTERVIEW_RECENT_MESSAGES
+            if end - self.summarized_upto < Settings.INTERVIEW_SUMMARIZE_EVERY:
+                return
+            previous = self.summary
+            turns = history[self.summarized_upto:end]
+            self._pending = (_summary_executor.submit(self._summarize, previous, turns), end)
+
+    def _collect_summary(self):
+        with self._lock:
+            if self._pending is None or not self._pending[0].done():
+                return
+            future, end = self._pending
+            self._pending = None
+            try:
+                self.summary = future.result()
+                self.summarized_upto = end
+            except Exception as e:
+                # Keep the old summary; the turns stay verbatim and are retried next refresh
+                print(f"Interview summary error: {e}")
+
+    @staticmethod
+    def _summarize(previous: str, turns: list) -> str:
+        transcript = "\n".join(
+            f"{msg['role'].upper()}: {_clip(msg['content'], Settings.INTERVIEW_MESSAGE_MAX_TOKENS)}"
+            for msg in turns
+        )
+        prompt = f"""
+        Running summary of a job interview:
+        {previous or "(empty)"}
+
+        New turns:
+        {transcript}
+
+        Update the summary to include the new turns. Keep the questions asked, the key
+        facts, skills and examples the candidate gave, and any weak spots to follow up on.
+        Use under {Settings.INTERVIEW_SUMMARY_MAX_TOKENS * 3 // 4} words. Output the summary only.
+        """
+        summary = ai_engine.chat(prompt, system="You summarize interview transcripts concisely.")
+        if is_fallback_response(prompt, summary):
+            # The offline answer is not a summary; fail so the turns stay verbatim
+            raise RuntimeError("AI unavailable, summary not updated")
+        return summary.strip()
+
 
 class MockInterviewer:
-    def get_response(self, history: list, user_input: str) -> str:
+    def get_response(self, history: list, user_input: str, context: InterviewContext = None) -> str:
         """
         Chat with the user acting as an interviewer.
         """
-        # Format history for prompt
         # History is likely `[{"role": "user", "content": ...}, ...]`
-        
-        conversation_text = ""
-        for msg in history[-5:]: # Keep last 5 turns for context window
-            conversation_text += f"{msg['role'].upper()}: {msg['content']}\n"
-            
+        # Without a session context only the token budget is applied to the raw history.
+        if context is None:
+            context = InterviewContext()
+
+        conversation_text = context.build(history)
+
         prompt = f"""
         Current Conversation:
         {conversation_text}
-        USER: {user_input}
-        
+        USER: {_clip(user_input, Settings.INTERVIEW_MESSAGE_MAX_TOKENS)}
+
         Respond as the Interviewer. Be professional but conversational. Ask a follow-up question.
         Stay in character. Do not repeat "User:" or "Interviewer:" prefixes in your output.
         """
-        
-        return ai_engine.chat(prompt, system="You are a professional hiring manager conducting an interview.")
+
+        # Live chat: hedge slow calls to the next backend to keep p99 latency bounded
+        response = ai_engine.chat(prompt, system="You are a professional hiring manager conducting an interview.", hedge=True)
+
+        # Fold aged-out turns into the summary while the user reads the reply
+        context.refresh(history + [{"role": "user", "content": user_input}, {"role": "assistant", "content": response}])
+        return response
 
 mock_interviewer = MockInterviewer()
@@ -0,0 +1,163 @@
+"""
+Project Idea Catalog
+Ranks curated project ideas against a set of missing skills using IDF-weighted
+skill overlap (plus optional precomputed embeddings), so good matches are
+returned in milliseconds without an AI call.
+"""
+
+import os
+import json
+import math
+from collections import defaultdict
+from typing import Dict, List
+from config import Settings, PROJECT_IDEAS
+
+
+def normalize_skill(skill: str) -> str:
+    return " ".join(str(skill).lower().split())
+
+
+class ProjectCatalog:
+    """
+    Inverted index (skill -> ideas) over config.PROJECT_IDEAS plus an optional
+    data file. Only ideas sharing at least one skill with the query are scored,
+    so lookups stay fast with thousands of ideas.
+    """
+
+    def __init__(self, data_path: str = None, embeddings_path: str = None):
+        self.ideas = []
+        self._index = defaultdict(list)  # normalized skill -> idea positions
+        self._idf = {}
+        self._embeddings = None  # numpy matrix, row i belongs to self.ideas[i]
+
+        for category, ideas in PROJECT_IDEAS.items():
+            for idea in ideas:
+                self._add(dict(idea, category=category))
+        self._load_file(data_path or Settings.PROJECT_CATALOG_PATH)
+        self._build_weights()
+        self._load_embeddings(embeddings_path or Settings.PROJECT_CATALOG_EMBEDDINGS_PATH)
+
+    def _add(self, idea: dict) -> bool:
+        """Index one idea; False (and nothing added) if it is unusable."""
+        if (not isinstance(idea, dict) or not isinstance(idea.get("name"), str) or not idea["name"].strip()
+                or not isinstance(idea.get("skills"), list)):
+            return False
+        idea["name"] = idea["name"].strip()
+        idea.setdefault("description", "")
+        idea.setdefault("difficulty", "Intermediate")
+        pos = len(self.ideas)
+        idea["_skills"] = {normalize_skill(s) for s in idea["skills"] if s}
+        self.ideas.append(idea)
+        for skill in idea["_skills"]:
+            self._index[skill].append(pos)
+        return True
+
+    def _load_file(self, path: str):
+        """Accepts a JSON list of ideas or one JSON idea per line. Bad entries are skipped."""
+        if not path or not os.path.exists(path):
+            return
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                if path.endswith(".jsonl"):
+                    for line_no, line in enumerate(f, 1):
+                        if not line.strip():
+                            continue
+                        try:
+                            idea = json.loads(line)
+                        except ValueError as e:
+                            print(f"Project catalog: skipped line {line_no} of {path}: {e}")
+                            continue
+                        if not self._add(idea):
+                            print(f"Project catalog: skipped line {line_no} of {path}: needs a name and a skills list")
+                else:
+                    for i, idea in enumerate(json.load(f)):
+                        if not self._add(idea):
+                            print(f"Project catalog: skipped idea {i} of {path}: needs a name and a skills list")
+        except Exception as e:
+            print(f"Project catalog load error ({path}): {e}")
+
+    def _build_weights(self):
+        # Rare skills say more about a match than ubiquitous ones (e.g. "python")
+        total = max(1, len(self.ideas))
+        self._idf = {skill: math.log(1 + total / len(ids)) for skill, ids in self._index.items()}
+
+    def _load_embeddings(self, path: str):
+        if not path or not os.path.exists(path):
+            return
+        try:
+            import numpy as np
+            matrix = np.load(path)
+            if matrix.shape[0] != len(self.ideas):
+                print(f"Project catalog embeddings ignored: {matrix.shape[0]} rows for {len(self.ideas)} ideas")
+                return
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            self._embeddings = matrix / np.maximum(norms, 1e-9)
+        except Exception as e:
+            print(f"Project catalog embeddings error: {e}")
+
+    def precompute_embeddings(self, path: str = None):
+        """Encode every idea with the sentence transformer and save the matrix for startup."""
+        import numpy as np
+        from app_utils.analysis_utils import load_sentence_transformer
+        model = load_sentence_transformer()
+        texts = [f"{i['name']}. {i['description']} Skills: {', '.join(i['skills'])}" for i in self.ideas]
+        matrix = model.encode(texts, batch_size=64, show_progress_bar=False)
+        path = path or Settings.PROJECT_CATALOG_EMBEDDINGS_PATH
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        np.save(path, matrix)
+        self._load_embeddings(path)
+
+    def match(self, missing_skills: List[str], k: int = 5, min_score: float = 0.0) -> List[Dict]:
+        """
+        Top-k ideas for these skills, best first.
+        score = 0.8 * share of the (IDF-weighted) missing skills the idea covers
+              + 0.2 * share of the idea's own stack that is relevant,
+        blended 70/30 with embedding similarity when embeddings are available.
+        """
+        wanted = {normalize_skill(s) for s in missing_skills if s}
+        if not wanted:
+            return []
+        weight = lambda skills: sum(self._idf.get(s, 1.0) for s in skills)
+        wanted_weight = weight(wanted)
+
+        candidates = set()
+        for skill in wanted:
+            candidates.update(self._index.get(skill, ()))
+
+        similarity = self._similarity(missing_skills) if candidates else None
+
+        scored = []
+        for pos in candidates:
+            idea = self.ideas[pos]
+            overlap = idea["_skills"] & wanted
+            coverage = weight(overlap) / wanted_weight
+            focus = weight(overlap) / max(weight(idea["_skills"]), 1e-9)
+            score = 0.8 * coverage + 0.2 * focus
+            if similarity is not None:
+                score = 0.7 * score + 0.3 * max(0.0, float(similarity[pos]))
+            if score >= min_score:
+                scored.append((score, pos, overlap))
+
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        results = []
+        for score, pos, overlap in scored[:k]:
+            idea = {key: value for key, value in self.ideas[pos].items() if not key.startswith("_")}
+            idea["score"] = round(score, 3)
+            idea["reason"] = f"Covers {', '.join(sorted(overlap))} from your skill gaps."
+            results.append(idea)
+        return results
+
+    def _similarity(self, missing_skills: List[str]):
+        if self._embeddings is None:
+            return None
+        try:
+            from app_utils.analysis_utils import load_sentence_transformer
+            query = load_sentence_transformer().encode(f"Project using {', '.join(missing_skills)}")
+            query = query / max(float((query ** 2).sum()) ** 0.5, 1e-9)
+            return self._embeddings @ query
+        except Exception as e:
+            print(f"Project catalog similarity error: {e}")
+            return None
+
+
+project_catalog = ProjectCatalog()
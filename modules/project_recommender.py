@@ -1,11 +1,14 @@
 """
 Smart Project Recommendation Engine
-Uses AI to generate unique, tailored project ideas based on missing skills.
+Ranks curated catalog ideas against missing skills first, and uses AI to generate
+unique, tailored project ideas only when the catalog has too few good matches.
 """
 
 from typing import List, Dict
-import json
 from app_utils.llm_wrapper import ai_engine
+from app_utils.json_stream import iter_json_items
+from modules.project_catalog import project_catalog
+from config import Settings
 
 class ProjectRecommender:
     """
@@ -16,15 +19,49 @@ class ProjectRecommender:
         """
         Ask AI for project ideas that incorporate these skills.
         """
+        return list(self.stream_recommendations(missing_skills))
+
+    def stream_recommendations(self, missing_skills: List[str]):
+        """
+        Yields project ideas one by one: catalog matches instantly, then AI ideas
+        (as the response streams in) to top up to PROJECT_RECOMMENDATIONS.
+        Falls back to static ideas if nothing usable was found.
+        """
+        wanted = Settings.PROJECT_RECOMMENDATIONS
+        matches = project_catalog.match(missing_skills, k=wanted, min_score=Settings.PROJECT_MATCH_MIN_SCORE)
+        yield from matches
+
+        needed = wanted - len(matches)
+        if needed <= 0:
+            return
+
+        seen = {m["name"].lower() for m in matches}
+        count = 0
+        for project in self._generate(missing_skills, needed, [m["name"] for m in matches]):
+            if project["name"].lower() in seen:
+                continue
+            seen.add(project["name"].lower())
+            count += 1
+            yield project
+            if count >= needed:
+                break
+
+        if not matches and not count:
+            yield from self._fallback_ideas(missing_skills)
+
+    def _generate(self, missing_skills: List[str], count: int, exclude: List[str]):
+        """Stream `count` AI-generated ideas, skipping the ones already suggested."""
         skills_str = ", ".join(missing_skills)
+        avoid = f"4. Do not suggest these (already recommended): {', '.join(exclude)}." if exclude else ""
         
         prompt = f"""
-        Generate 5 unique and impressive portfolio project ideas that would help a developer learn these specific skills: {skills_str}.
+        Generate {count} unique and impressive portfolio project ideas that would help a developer learn these specific skills: {skills_str}.
         
         Requirements:
         1. Projects should be non-trivial (Intermediate to Advanced).
         2. Must include the specific missing skills in the tech stack.
         3. Avoid generic to-do lists. Suggest things like "Real-time Dashboard", "AI-powered CRM", "Decentralized Voting App", etc.
+        {avoid}
         
         Output Format:
         Return ONLY a JSON list of objects with these keys: "name", "description", "difficulty", "skills" (list of strings).
@@ -35,21 +72,25 @@ class ProjectRecommender:
         ]
         """
         
-        response = ai_engine.chat(prompt, system="You are a Senior Engineering Manager mentoring a junior. Return JSON only.")
+        chunks = ai_engine.stream(prompt, system="You are a Senior Engineering Manager mentoring a junior. Return JSON only.")
         
-        # Robust JSON Parsing
-        try:
-            # Find JSON brackets in case of extra text
-            start = response.find("[")
-            end = response.rfind("]") + 1
-            if start != -1 and end != -1:
-                json_str = response[start:end]
-                return json.loads(json_str)
-            else:
-                return self._fallback_ideas(missing_skills)
-        except Exception as e:
-            print(f"Project Gen Error: {e}")
-            return self._fallback_ideas(missing_skills)
+        for item in iter_json_items(chunks, expect="list"):
+            project = self._validate(item)
+            if project:
+                yield project
+
+    def _validate(self, item):
+        """Normalize one parsed idea; None if it is unusable."""
+        if not isinstance(item, dict) or not isinstance(item.get("name"), str) or not item["name"].strip():
+            return None
+        item["name"] = item["name"].strip()
+        skills = item.get("skills")
+        if isinstance(skills, str):
+            skills = [s.strip() for s in skills.split(",") if s.strip()]
+        item["skills"] = [str(s) for s in skills] if isinstance(skills, list) else []
+        item.setdefault("description", "")
+        item.setdefault("difficulty", "Intermediate")
+        return item
             
     def _fallback_ideas(self, skills) -> List[Dict]:
         """Return static ideas if AI fails."""
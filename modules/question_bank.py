@@ -0,0 +1,190 @@
+"""
+Interview Question Bank
+Local, retrieval-first store of interview questions indexed by role, skill and level.
+Seeded from a curated set and grown with every LLM generation, so common
+role/skill/level combinations are answered instantly without an AI call.
+"""
+
+import re
+import random
+import threading
+from collections import defaultdict
+from typing import Dict, List
+from config import Settings, CURATED_INTERVIEW_QUESTIONS
+from database.db_manager import db_manager
+
+CATEGORIES = ("Technical", "Behavioral", "Culture")
+
+_TOKEN_RE = re.compile(r"[a-z0-9+#.]+")
+
+
+def normalize_skill(skill: str) -> str:
+    return " ".join(str(skill).lower().split())
+
+
+def _tokens(text: str) -> set:
+    return set(_TOKEN_RE.findall(str(text).lower()))
+
+
+class QuestionBank:
+    """
+    In-memory index over the `interview_questions` table.
+    Built once at startup; new questions are written through to SQLite and the
+    index, and questions other processes add are picked up when the table's
+    data_version moves.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._questions = {}  # id -> row dict
+        self._by_skill = defaultdict(set)  # normalized skill -> ids
+        self._by_category = defaultdict(set)  # category -> ids
+        self._seen = set()  # lowercased question text, for dedup before hitting the DB
+        self._embeddings = {}  # id -> vector, only when QUESTION_BANK_USE_EMBEDDINGS
+        self._last_id = 0  # newest row read by _refresh
+        self._data_version = None
+        self._load()
+
+    def _load(self):
+        self._refresh()
+        if not self._questions:
+            db_manager.add_questions(self._curated_rows())
+            self._refresh()
+
+    def _refresh(self):
+        """Index rows added since the last look; a no-op while the table is unchanged."""
+        version = db_manager.data_version("interview_questions")
+        if version == self._data_version:
+            return
+        rows = db_manager.get_questions(after_id=self._last_id)
+        with self._lock:
+            for row in rows:
+                # Advanced only here: rows add() indexed itself may sit above ones other processes wrote
+                self._last_id = max(self._last_id, row["id"])
+                if row["id"] not in self._questions:
+                    self._index(row)
+            self._data_version = version
+
+    @staticmethod
+    def _curated_rows():
+        for skill, questions in CURATED_INTERVIEW_QUESTIONS["Technical"].items():
+            for q in questions:
+                yield ("", normalize_skill(skill), "", "Technical", q, "curated")
+        for category in ("Behavioral", "Culture"):
+            for q in CURATED_INTERVIEW_QUESTIONS[category]:
+                yield ("", "", "", category, q, "curated")
+
+    def _index(self, row: dict):
+        self._questions[row["id"]] = row
+        self._seen.add(row["question"].lower())
+        if row["skill"]:
+            self._by_skill[row["skill"]].add(row["id"])
+        self._by_category[row["category"] or "Technical"].add(row["id"])
+
+    def size(self) -> int:
+        return len(self._questions)
+
+    def find(self, role: str, skills: List[str], level: str) -> Dict[str, List[str]]:
+        """
+        Best stored questions per category for this role/skills/level.
+        Technical questions must match one of the skills; a question tagged with a
+        level only matches that level; sharing words with the role ranks higher.
+        """
+        self._refresh()
+        wanted = [normalize_skill(s) for s in skills if s]
+        role_tokens = _tokens(role)
+
+        with self._lock:
+            technical_ids = set()
+            for skill in wanted:
+                technical_ids |= self._by_skill.get(skill, set())
+            candidates = {
+                "Technical": [self._questions[i] for i in technical_ids],
+                "Behavioral": [self._questions[i] for i in self._by_category["Behavioral"]],
+                "Culture": [self._questions[i] for i in self._by_category["Culture"]],
+            }
+
+        def score(row):
+            if row["level"] and row["level"] != level:
+                return None
+            value = len(role_tokens & _tokens(row["role"])) * 2
+            if row["level"] == level:
+                value += 1
+            return value
+
+        results = {}
+        for category, rows in candidates.items():
+            scored = [(score(r), random.random(), r) for r in rows]
+            scored = [item for item in scored if item[0] is not None]
+            scored.sort(key=lambda item: (-item[0], item[1]))
+            ranked = [r for _, _, r in scored]
+            if category == "Technical":
+                ranked = self._spread_skills(self._semantic_rank(role, wanted, level, ranked), wanted)
+            results[category] = [r["question"] for r in ranked]
+        return results
+
+    @staticmethod
+    def _spread_skills(rows: list, skills: list) -> list:
+        """Round-robin across skills so one well-covered skill does not take every slot."""
+        buckets = defaultdict(list)
+        for r in rows:
+            buckets[r["skill"]].append(r)
+        ordered = []
+        while any(buckets.values()):
+            for skill in skills:
+                if buckets.get(skill):
+                    ordered.append(buckets[skill].pop(0))
+        return ordered
+
+    def _semantic_rank(self, role: str, skills: list, level: str, rows: list) -> list:
+        """Optional embedding re-rank of technical candidates against the request."""
+        if not Settings.QUESTION_BANK_USE_EMBEDDINGS or len(rows) < 2:
+            return rows
+        try:
+            from sentence_transformers import util
+            from app_utils.analysis_utils import load_sentence_transformer
+            model = load_sentence_transformer()
+            missing = [r for r in rows if r["id"] not in self._embeddings]
+            if missing:
+                vectors = model.encode([r["question"] for r in missing], convert_to_tensor=True)
+                for r, vec in zip(missing, vectors):
+                    self._embeddings[r["id"]] = vec
+            query = model.encode(f"{level} {role} interview: {', '.join(skills)}", convert_to_tensor=True)
+            sims = {r["id"]: float(util.cos_sim(query, self._embeddings[r["id"]])) for r in rows}
+            return sorted(rows, key=lambda r: -sims[r["id"]])
+        except Exception as e:
+            print(f"Question bank embedding error: {e}")
+            return rows
+
+    def add(self, role: str, level: str, items: List[dict], skills: List[str] = (), source: str = "generated"):
+        """
+        Cache generated questions. items: dicts with "question", optional "category"
+        and "skill"; untagged technical questions get the first requested skill they mention.
+        """
+        wanted = [normalize_skill(s) for s in skills if s]
+        rows = []
+        with self._lock:
+            for item in items:
+                question = item["question"].strip()
+                if not question or question.lower() in self._seen:
+                    continue
+                category = item.get("category") if item.get("category") in CATEGORIES else "Technical"
+                skill = ""
+                if category == "Technical":
+                    skill = normalize_skill(item.get("skill") or "")
+                    if not skill:
+                        text = question.lower()
+                        skill = next((s for s in wanted if s in text), "")
+                rows.append((role, skill, level, category, question, source))
+        if not rows:
+            return
+        db_manager.add_questions(rows)
+        fresh = db_manager.get_questions(questions=[r[4] for r in rows])
+        with self._lock:
+            for row in fresh:
+                if row["id"] not in self._questions:
+                    self._index(row)
+
+
+# Built at import so the index is ready before the first request
+question_bank = QuestionBank()
@@ -3,12 +3,21 @@ Resume Rewrite Engine Module
 Uses LLMs via Central AI Engine to rewrite resume content
 """
 
-from app_utils.llm_wrapper import ai_engine
+import hashlib
+import threading
+from collections import OrderedDict
+from app_utils.llm_wrapper import ai_engine, is_fallback_response
 
 class ResumeRewriter:
     """
     AI-powered resume rewriter using Central AI Engine.
     """
+
+    SUMMARY_CACHE_SIZE = 200
+
+    def __init__(self):
+        self._summaries = OrderedDict()  # (resume hash, canonical JD key) -> summary
+        self._lock = threading.Lock()
     
     def rewrite_section(self, section_text: str, target_role: str, tone: str = "Professional") -> str:
         """
@@ -30,10 +39,20 @@ class ResumeRewriter:
         
         return ai_engine.chat(prompt, system="You are a professional resume writer.")
 
-    def generate_tailored_summary(self, resume_text: str, jd_text: str) -> str:
+    def generate_tailored_summary(self, resume_text: str, jd_text: str, jd_key: str = None) -> str:
         """
         Generate a summary tailored to a JD.
+        Pass the JD's canonical key (see jd_dedup) to reuse the summary written
+        for an earlier posting of the same job.
         """
+        cache_key = None
+        if jd_key is not None:
+            cache_key = (hashlib.sha256(resume_text.encode("utf-8")).hexdigest(), jd_key)
+            with self._lock:
+                if cache_key in self._summaries:
+                    self._summaries.move_to_end(cache_key)
+                    return self._summaries[cache_key]
+
         prompt = f"""
         Draft a compelling Professional Summary (3-4 sentences) for a resume.
         
@@ -46,6 +65,12 @@ class ResumeRewriter:
         - Use specific keywords from the JD.
         """
         
-        return ai_engine.chat(prompt, system="You are a clear and persuasive career coach.")
+        summary = ai_engine.chat(prompt, system="You are a clear and persuasive career coach.")
+        if cache_key is not None and not is_fallback_response(prompt, summary):
+            with self._lock:
+                self._summaries[cache_key] = summary
+                while len(self._summaries) > self.SUMMARY_CACHE_SIZE:
+                    self._summaries.popitem(last=False)
+        return summary
 
 resume_rewriter = ResumeRewriter()
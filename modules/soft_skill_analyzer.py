@@ -6,6 +6,7 @@ Detects evidence of soft skills through language analysis
 import re
 from textblob import TextBlob
 from typing import Dict, List
+from modules.analysis_store import analysis_store
 
 class SoftSkillAnalyzer:
     """
@@ -20,10 +21,17 @@ class SoftSkillAnalyzer:
         "Adaptability": ["learned", "adapted", "pivoted", "flexible", "adjusted", "transitioned"]
     }
     
+    # Bump when the analysis changes, so stored results are recomputed
+    ANALYSIS_VERSION = "1"
+    
     def analyze(self, text: str) -> Dict:
         """
         Analyze resume for soft skills and tone.
+        Computed once per distinct text; later calls read the stored result.
         """
+        return analysis_store.analyze("soft_skills", self.ANALYSIS_VERSION, text, lambda: self._analyze(text))
+    
+    def _analyze(self, text: str) -> Dict:
         text_lower = text.lower()
         results = {}
         
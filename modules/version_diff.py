@@ -0,0 +1,222 @@
+"""
+Version Diff Module
+Compares two resume versions: line diff with word-level detail for changed
+lines, plus how their scores moved. Diffs are cached by content hash pair and
+scores go through the analysis store, so versions and pairs that were already
+compared cost nothing.
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from difflib import SequenceMatcher
+from typing import Dict, List, Optional
+from config import COMPANY_ATS_KEYWORDS, Settings
+from database.db_manager import db_manager
+from modules.analysis_store import analysis_store
+from modules.ats_emulator import ats_emulator
+
+_WORD = re.compile(r"\s+|\w+|[^\w\s]")
+
+
+def line_opcodes(a: List[str], b: List[str]) -> list:
+    """
+    difflib opcodes for two line lists. The common head and tail are matched
+    directly, so SequenceMatcher only sees the region that actually changed.
+    """
+    head = 0
+    limit = min(len(a), len(b))
+    while head < limit and a[head] == b[head]:
+        head += 1
+    tail = 0
+    while tail < limit - head and a[len(a) - 1 - tail] == b[len(b) - 1 - tail]:
+        tail += 1
+
+    ops = [("equal", 0, head, 0, head)] if head else []
+    middle = SequenceMatcher(None, a[head:len(a) - tail], b[head:len(b) - tail], autojunk=False)
+    for tag, i1, i2, j1, j2 in middle.get_opcodes():
+        ops.append((tag, i1 + head, i2 + head, j1 + head, j2 + head))
+    if tail:
+        ops.append(("equal", len(a) - tail, len(a), len(b) - tail, len(b)))
+    return ops
+
+
+def word_diff(old: str, new: str) -> List[tuple]:
+    """[(op, text)] with op in '=', '-', '+' for two short texts."""
+    a, b = _WORD.findall(old), _WORD.findall(new)
+    parts = []
+    for tag, i1, i2, j1, j2 in SequenceMatcher(None, a, b, autojunk=False).get_opcodes():
+        if tag == "equal":
+            parts.append(("=", "".join(a[i1:i2])))
+            continue
+        if i2 > i1:
+            parts.append(("-", "".join(a[i1:i2])))
+        if j2 > j1:
+            parts.append(("+", "".join(b[j1:j2])))
+    return parts
+
+
+class VersionDiff:
+    """
+    Diff and score-delta service for the version vault.
+    Diffs are cached per (hash_a, hash_b) pair, scores per content hash.
+    """
+
+    # Bump when score_text changes, so stored scores are recomputed
+    SCORES_VERSION = "1"
+    CONTEXT_LINES = 3
+    # Word-level detail is only computed for changed blocks up to this many lines
+    MAX_WORD_DIFF_LINES = 40
+
+    def __init__(self):
+        self._diffs = OrderedDict()
+        self._lock = threading.Lock()
+
+    def diff(self, a_id: int, b_id: int) -> dict:
+        """
+        Changes from version a to version b:
+        {"stats": {...}, "similarity": 0..1, "hunks": [...], "unified": str}
+        """
+        a_meta, b_meta = db_manager.get_version(a_id), db_manager.get_version(b_id)
+        if a_meta is None or b_meta is None:
+            return {"error": "Version not found"}
+        key = (a_meta["content_hash"], b_meta["content_hash"])
+        cached = self._cache_get(self._diffs, key)
+        if cached is not None:
+            return cached
+
+        a_text, b_text = db_manager.get_version_content(a_id), db_manager.get_version_content(b_id)
+        if a_text is None or b_text is None:
+            return {"error": "Version not found"}
+        result = self.diff_texts(a_text, b_text, a_meta["version_name"], b_meta["version_name"])
+        self._cache_put(self._diffs, key, result, Settings.VERSION_DIFF_CACHE_SIZE)
+        return result
+
+    def diff_texts(self, old: str, new: str, old_name: str = "a", new_name: str = "b") -> dict:
+        a, b = old.splitlines(), new.splitlines()
+        ops = line_opcodes(a, b)
+
+        added = removed = changed = 0
+        for tag, i1, i2, j1, j2 in ops:
+            if tag == "insert":
+                added += j2 - j1
+            elif tag == "delete":
+                removed += i2 - i1
+            elif tag == "replace":
+                changed += max(i2 - i1, j2 - j1)
+        same = sum(i2 - i1 for tag, i1, i2, _, _ in ops if tag == "equal")
+
+        hunks = []
+        unified = [f"--- {old_name}", f"+++ {new_name}"]
+        for group in self._group(ops):
+            first, last = group[0], group[-1]
+            unified.append(f"@@ -{first[1] + 1},{last[2] - first[1]} +{first[3] + 1},{last[4] - first[3]} @@")
+            for tag, i1, i2, j1, j2 in group:
+                if tag == "equal":
+                    unified += [" " + line for line in a[i1:i2]]
+                    continue
+                unified += ["-" + line for line in a[i1:i2]]
+                unified += ["+" + line for line in b[j1:j2]]
+                hunk = {"tag": tag, "old_start": i1 + 1, "new_start": j1 + 1,
+                        "removed": a[i1:i2], "added": b[j1:j2], "words": None}
+                if tag == "replace" and max(i2 - i1, j2 - j1) <= self.MAX_WORD_DIFF_LINES:
+                    hunk["words"] = word_diff("\n".join(a[i1:i2]), "\n".join(b[j1:j2]))
+                hunks.append(hunk)
+
+        return {
+            "stats": {"added": added, "removed": removed, "changed": changed, "unchanged": same},
+            "similarity": 2 * same / (len(a) + len(b)) if a or b else 1.0,
+            "hunks": hunks,
+            "unified": "\n".join(unified) if hunks else "",
+        }
+
+    def _group(self, ops: list) -> List[list]:
+        """Hunks with CONTEXT_LINES of unchanged lines around each change (as difflib.get_grouped_opcodes)."""
+        if not ops:
+            return []
+        n = self.CONTEXT_LINES
+        ops = list(ops)
+        if ops[0][0] == "equal":
+            tag, i1, i2, j1, j2 = ops[0]
+            ops[0] = (tag, max(i1, i2 - n), i2, max(j1, j2 - n), j2)
+        if ops[-1][0] == "equal":
+            tag, i1, i2, j1, j2 = ops[-1]
+            ops[-1] = (tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n))
+
+        groups, group = [], []
+        for tag, i1, i2, j1, j2 in ops:
+            if tag == "equal" and i2 - i1 > 2 * n:
+                # Long unchanged run: close this hunk and start the next n lines before the run ends
+                group.append((tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n)))
+                groups.append(group)
+                group = []
+                i1, j1 = max(i1, i2 - n), max(j1, j2 - n)
+            group.append((tag, i1, i2, j1, j2))
+        if group and not (len(group) == 1 and group[0][0] == "equal"):
+            groups.append(group)
+        return [g for g in groups if any(op[0] != "equal" for op in g)]
+
+    def scores(self, v_id: int) -> Optional[Dict[str, float]]:
+        """Resume scores of one version, computed once per distinct text; None if the version is gone."""
+        meta = db_manager.get_version(v_id)
+        if meta is None:
+            return None
+        # The vault's content hash is the analysis store's resume key, so the text is only rebuilt on a miss
+        try:
+            return analysis_store.get_or_compute("version_scores", self.SCORES_VERSION, meta["content_hash"],
+                                                 lambda: self._score_version(v_id))
+        except LookupError:
+            # Deleted between the metadata and the text lookup
+            return None
+
+    def _score_version(self, v_id: int) -> Dict[str, float]:
+        text = db_manager.get_version_content(v_id)
+        if text is None:
+            raise LookupError(f"Version {v_id} not found")
+        return self.score_text(text)
+
+    @staticmethod
+    def score_text(text: str) -> Dict[str, float]:
+        # Heavy NLP imports only when a version is actually scored
+        from app_utils.analysis_utils import match_skills
+        from app_utils.text_processing import count_action_verbs
+
+        found_skills, _ = match_skills(text)
+        result = {
+            "Skills Found": len(found_skills),
+            "Action Verbs": count_action_verbs(text),
+            "Word Count": len(text.split()),
+        }
+        for company in COMPANY_ATS_KEYWORDS:
+            result[f"ATS: {company}"] = ats_emulator.simulate_scan(text, company)["score"]
+        return result
+
+    def score_delta(self, a_id: int, b_id: int) -> List[dict]:
+        """
+        [{"metric", "old", "new", "delta"}] for two versions. A side whose
+        version no longer exists has None values (and so does the delta).
+        """
+        old, new = self.scores(a_id), self.scores(b_id)
+        rows = []
+        for k in (old or new or {}):
+            before = old.get(k) if old is not None else None
+            after = new.get(k, 0) if new is not None else None
+            delta = after - before if before is not None and after is not None else None
+            rows.append({"metric": k, "old": before, "new": after, "delta": delta})
+        return rows
+
+    def _cache_get(self, cache: OrderedDict, key):
+        with self._lock:
+            if key not in cache:
+                return None
+            cache.move_to_end(key)
+            return cache[key]
+
+    def _cache_put(self, cache: OrderedDict, key, value, size: int):
+        with self._lock:
+            cache[key] = value
+            cache.move_to_end(key)
+            while len(cache) > size:
+                cache.popitem(last=False)
+
+version_diff = VersionDiff()
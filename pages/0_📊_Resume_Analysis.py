@@ -10,6 +10,8 @@ from config import Settings
 from app_utils.text_processing import count_action_verbs, clean_text
 from app_utils.analysis_utils import extract_top_keywords, match_skills, semantic_similarity, generate_recommendations
 from modules.skill_analyzer import skill_analyzer
+from modules.jd_dedup import jd_dedup
+from modules.analysis_store import analysis_store
 from app_utils.ui import setup_page_styling
 
 st.set_page_config(page_title="Deep Resume Analysis", page_icon="📊", layout="wide")
@@ -17,6 +19,32 @@ setup_page_styling()
 
 st.markdown("# 📊 Deep Resume Analysis")
 
+
+# Bump when compare_with_jd changes, so stored results are recomputed
+JD_MATCH_VERSION = "1"
+
+
+def compare_with_jd(resume_text, jd_key, jd_text):
+    """
+    JD-dependent part of the analysis, stored by resume hash and the JD's
+    canonical key so a reposted job reuses the result computed for the original,
+    across sessions too.
+    """
+    def compute():
+        found_skills, missing_skills = match_skills(resume_text)
+        sim = semantic_similarity(resume_text, jd_text)
+        top_keywords = extract_top_keywords(jd_text, top_k=15)
+        kw_rows = []
+        for kw in top_keywords:
+            present = bool(re.search(r"\b" + re.escape(kw) + r"\b", resume_text, flags=re.I))
+            kw_rows.append({"Keyword": kw, "Found": "✅" if present else "❌"})
+        recs = generate_recommendations(resume_text, jd_text, top_keywords, found_skills, missing_skills, sim)
+        return sim, top_keywords, kw_rows, recs
+
+    return analysis_store.get_or_compute("jd_match", JD_MATCH_VERSION, analysis_store.resume_key(resume_text),
+                                         compute, jd_hash=jd_key)
+
+
 # Check session state
 if 'resume_text' not in st.session_state or not st.session_state.resume_text:
     st.warning("⚠️ Please upload a resume on the Home page first.")
@@ -47,16 +75,11 @@ if st.button("Run Full Analysis", type="primary"):
         recs = []
         
         if jd_input:
-            sim = semantic_similarity(resume_text, jd_input)
+            dup = jd_dedup.register(jd_input, "pasted")
+            if dup["is_duplicate"]:
+                st.caption(f"♻️ Matches a JD analyzed before ({dup['similarity']:.0%} similar); reusing that analysis.")
+            sim, top_keywords, kw_rows, recs = compare_with_jd(resume_text, dup["canonical_hash"], jd_input)
             sim_percent = round(sim * 100, 1)
-            top_keywords = extract_top_keywords(jd_input, top_k=15)
-            
-            # Check keywords
-            for kw in top_keywords:
-                present = bool(re.search(r"\b" + re.escape(kw) + r"\b", resume_text, flags=re.I))
-                kw_rows.append({"Keyword": kw, "Found": "✅" if present else "❌"})
-                
-            recs = generate_recommendations(resume_text, jd_input, top_keywords, found_skills, missing_skills, sim)
         else:
             recs = ["Add a Job Description to get targeted recommendations."]
 
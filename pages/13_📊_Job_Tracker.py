@@ -2,16 +2,53 @@
 Job Application Tracker Module
 """
 
+import os
+import tempfile
 import streamlit as st
 import pandas as pd
-from datetime import datetime, timedelta
+import plotly.express as px
+from datetime import datetime
+from config import Settings
 from database.db_manager import db_manager
+from modules.application_io import application_io
 from app_utils.ui import setup_page_styling, get_lottie
 from streamlit_lottie import st_lottie
 
 st.set_page_config(page_title="Job Tracker", page_icon="📊", layout="wide")
 setup_page_styling()
 
+
+# Reads are cached until a write bumps the table's data_version (from any process)
+@st.cache_data(show_spinner=False, max_entries=20)
+def load_alerts(data_version, days, today):
+    # today is only part of the key: "stale" moves with the date, not just with writes
+    return db_manager.count_stale_applications(days), db_manager.get_stale_applications(days, limit=10)
+
+
+@st.cache_data(show_spinner=False, max_entries=100)
+def count_applications(data_version, status, search):
+    return db_manager.count_applications(status=status, search=search)
+
+
+@st.cache_data(show_spinner=False, max_entries=100)
+def load_applications(data_version, status, search, sort, descending, limit, offset):
+    return db_manager.query_applications(status=status, search=search, sort=sort, descending=descending,
+                                         limit=limit, offset=offset)
+
+
+@st.cache_data(show_spinner=False, max_entries=5)
+def load_analytics(data_version):
+    # Trigger-maintained summary tables: a few dozen rows however many applications are tracked
+    return db_manager.application_funnel(), db_manager.weekly_status_counts(12), db_manager.score_outcomes()
+
+
+@st.cache_data(show_spinner=False, max_entries=5)
+def load_jd_choices(data_version):
+    return db_manager.list_jds(limit=50)
+
+
+apps_version = db_manager.data_version("job_applications")
+
 c1, c2 = st.columns([1, 6])
 with c1:
     lottie = get_lottie("rocket")
@@ -25,27 +62,65 @@ with c2:
 
 # --- Notifications / Alerts ---
 st.subheader("🔔 Alerts")
-df = db_manager.get_applications()
+follow_up_days = Settings.JOB_TRACKER_FOLLOW_UP_DAYS
+stale_count, stale = load_alerts(apps_version, follow_up_days, datetime.now().date())
 
-alerts = []
-if not df.empty:
-    for index, row in df.iterrows():
-        # Check if applied > 14 days ago and no update
-        if row['status'] == 'Applied':
-            try:
-                # Basic date parsing
-                applied_date = datetime.strptime(row['date_applied'], "%Y-%m-%d")
-                if datetime.now() - applied_date > timedelta(days=14):
-                    alerts.append(f"Follow up with **{row['company']}** ({row['role']}) - Applied 14+ days ago.")
-            except:
-                pass
-
-if alerts:
-    for a in alerts:
-        st.warning(a)
+if stale:
+    for row in stale:
+        st.warning(f"Follow up with **{row['company']}** ({row['role']}) - Applied {follow_up_days}+ days ago.")
+    if stale_count > len(stale):
+        st.caption(f"...and {stale_count - len(stale)} more applications waiting {follow_up_days}+ days.")
 else:
     st.success("✅ No pending follow-ups.")
 
+# --- Funnel Analytics ---
+with st.expander("📈 Funnel Analytics", expanded=False):
+    funnel, weekly, score_rows = load_analytics(apps_version)
+    if not funnel["total"]:
+        st.info("Track some applications to see your funnel.")
+    else:
+        reached = {s["stage"]: s["reached"] for s in funnel["stages"]}
+        m1, m2, m3, m4 = st.columns(4)
+        m1.metric("Tracked", f"{funnel['total']:,}")
+        m2.metric("Response Rate", f"{funnel['response_rate']:.0%}")
+        m3.metric("Interview Rate", f"{reached.get('Interview', 0) / funnel['total']:.0%}")
+        m4.metric("Offers", f"{funnel['by_status'].get('Offer', 0):,}")
+
+        tab_funnel, tab_weekly, tab_scores = st.tabs(["Funnel", "Weekly", "ATS Score vs Outcome"])
+        with tab_funnel:
+            df_funnel = pd.DataFrame(funnel["stages"])
+            fig = px.funnel(df_funnel, x="reached", y="stage")
+            st.plotly_chart(fig, width='stretch', key="funnel_chart")
+            df_funnel["conversion"] = df_funnel["conversion"].map(lambda c: "" if pd.isna(c) else f"{c:.0%}")
+            df_funnel["avg ATS score"] = df_funnel["stage"].map(
+                lambda s: round(funnel["avg_score"][s], 1) if s in funnel["avg_score"] else None)
+            st.dataframe(df_funnel, hide_index=True, width='stretch')
+            st.caption("Stages count applications currently at that stage or further along; "
+                       f"{funnel['by_status'].get('Rejected', 0):,} rejected applications count as responses only.")
+            if funnel["other"]:
+                st.caption("Not counted (status outside the pipeline): "
+                           + ", ".join(f"{s} ({n:,})" for s, n in funnel["other"].items()))
+        with tab_weekly:
+            if weekly:
+                fig = px.bar(pd.DataFrame(weekly), x="week", y="count", color="status",
+                             category_orders={"status": Settings.JOB_STATUSES},
+                             labels={"week": "Week of", "count": "Applications"})
+                st.plotly_chart(fig, width='stretch', key="weekly_chart")
+            else:
+                st.info("No dated applications yet.")
+        with tab_scores:
+            df_scores = pd.DataFrame(score_rows)
+            df_scores = df_scores[df_scores["bucket"] >= 0]
+            if df_scores.empty:
+                st.info("No applications with an ATS score yet.")
+            else:
+                df_scores["score"] = df_scores["bucket"].map(lambda b: f"{b * 10}-{b * 10 + 9 if b < 9 else 100}")
+                fig = px.bar(df_scores, x="score", y="count", color="status",
+                             category_orders={"status": Settings.JOB_STATUSES},
+                             labels={"score": "ATS Score", "count": "Share of applications (%)"})
+                fig.update_layout(barnorm="percent")
+                st.plotly_chart(fig, width='stretch', key="score_chart")
+
 st.divider()
 
 # --- Add New Application ---
@@ -56,7 +131,7 @@ with st.expander("➕ Add New Application", expanded=False):
     with c2:
         role = st.text_input("Role Title")
     with c3:
-        status = st.selectbox("Status", ["Applied", "Screening", "Interview", "Offer", "Rejected"])
+        status = st.selectbox("Status", Settings.JOB_STATUSES)
         
     c4, c5 = st.columns(2)
     with c4:
@@ -65,18 +140,92 @@ with st.expander("➕ Add New Application", expanded=False):
         score = st.number_input("ATS Score (Optional)", 0, 100, 0)
         
     notes = st.text_area("Notes")
+
+    # Link one of the saved JDs (JD Fetcher -> JD Library)
+    saved_jds = load_jd_choices(db_manager.data_version("job_descriptions"))
+    jd_options = [None] + [j["id"] for j in saved_jds]
+    jd_labels = {j["id"]: f"#{j['id']} {j['title'] or j['source_url']}"[:90] for j in saved_jds}
+    current_jd = st.session_state.get('jd_id')
+    jd_id = st.selectbox(
+        "Job Description (optional)", jd_options,
+        index=jd_options.index(current_jd) if current_jd in jd_options else 0,
+        format_func=lambda i: "None" if i is None else jd_labels[i],
+    )
     
     if st.button("Save Application", type="primary"):
         if company and role:
-            db_manager.add_application(company, role, status, str(date), score, notes)
+            db_manager.add_application(company, role, status, str(date), score, notes, jd_id)
             st.success("Tracked!")
             st.rerun()
         else:
             st.error("Company and Role are required.")
 
+# --- Bulk Import / Export ---
+with st.expander("📥 Import / 📤 Export", expanded=False):
+    tab_in, tab_out = st.tabs(["Import", "Export"])
+    with tab_in:
+        st.caption("CSV with a header row, or JSONL with one object per line. Columns: company, role, status, "
+                   "date_applied, ats_score, notes (spreadsheet names such as 'Company Name' or 'Date' work too).")
+        upload = st.file_uploader("Applications file", type=["csv", "jsonl"])
+        if upload is not None and st.button("Import Applications", type="primary"):
+            fmt = "jsonl" if upload.name.lower().endswith(".jsonl") else "csv"
+            progress_line = st.empty()
+            st.session_state.import_report = application_io.import_file(
+                upload, fmt, progress=lambda n: progress_line.caption(f"Imported {n:,} rows..."))
+            # Rerun so every list below picks up the new data version
+            st.rerun()
+
+        report = st.session_state.get("import_report")
+        if report:
+            st.success(f"Imported {report['imported']:,} applications.")
+            if not report["complete"]:
+                st.error(f"Import stopped at line {report['errors'][-1][0]}; the rows before it were imported.")
+            if report["rejected"]:
+                st.warning(f"Skipped {report['rejected']:,} invalid rows.")
+            if report["errors"]:
+                st.dataframe(pd.DataFrame(report["errors"], columns=["Line", "Problem"]), hide_index=True)
+
+    with tab_out:
+        export_fmt = st.radio("Format", ["CSV", "JSONL"], horizontal=True)
+        if st.button("Prepare Export"):
+            # Written row by row to a temporary file instead of building a DataFrame
+            with tempfile.TemporaryDirectory() as tmp:
+                path = os.path.join(tmp, "applications")
+                with open(path, "w", encoding="utf-8", newline="") as out:
+                    count = application_io.export(out, export_fmt.lower())
+                with open(path, "rb") as f:
+                    st.download_button(
+                        f"⬇️ Download {count:,} applications",
+                        data=f,
+                        file_name=f"applications_{datetime.now():%Y%m%d}.{export_fmt.lower()}",
+                        mime="text/csv" if export_fmt == "CSV" else "application/x-ndjson",
+                    )
+
 # --- View / Edit Applications ---
 st.subheader("YOUR APPLICATIONS")
 
+# Filters and sorting run in SQL; only the current page is loaded
+f1, f2, f3, f4 = st.columns([2, 2, 1, 1])
+with f1:
+    status_filter = st.multiselect("Status", Settings.JOB_STATUSES)
+with f2:
+    search = st.text_input("Search company or role")
+with f3:
+    sort_labels = {"Date": "date_applied", "Company": "company", "Role": "role", "Status": "status", "Score": "ats_score"}
+    sort = sort_labels[st.selectbox("Sort by", list(sort_labels))]
+with f4:
+    descending = st.selectbox("Order", ["Descending", "Ascending"]) == "Descending"
+
+total = count_applications(apps_version, status_filter, search.strip() or None)
+page_size = Settings.JOB_TRACKER_PAGE_SIZE
+pages = max(1, -(-total // page_size))
+page = st.number_input(f"Page (of {pages})", min_value=1, max_value=pages, value=1) if pages > 1 else 1
+df = load_applications(apps_version, status_filter, search.strip() or None, sort, descending,
+                       page_size, (page - 1) * page_size)
+st.caption(f"Showing {len(df)} of {total} applications.")
+# Dates are stored as text; DateColumn needs real dates
+df["date_applied"] = pd.to_datetime(df["date_applied"], errors="coerce").dt.date
+
 if not df.empty:
     # Editable Dataframe
     edited_df = st.data_editor(
@@ -84,7 +233,7 @@ if not df.empty:
         column_config={
             "status": st.column_config.SelectboxColumn(
                 "Status",
-                options=["Applied", "Screening", "Interview", "Offer", "Rejected"],
+                options=Settings.JOB_STATUSES,
                 required=True,
             ),
             "date_applied": st.column_config.DateColumn("Date"),
@@ -101,25 +250,24 @@ if not df.empty:
     
     st.info("💡 To update status permanently or delete, use the controls below.")
     
+    labels = {int(r.id): f"#{r.id} {r.company} - {r.role}" for r in df.itertuples()}
     c_act1, c_act2 = st.columns([2, 1])
     with c_act1:
-        app_to_edit = st.selectbox("Select Application to Update", df['company'] + " - " + df['role'])
-        new_stat = st.selectbox("New Status", ["Applied", "Screening", "Interview", "Offer", "Rejected"], key="new_s")
+        app_to_edit = st.selectbox("Select Application to Update", list(labels), format_func=labels.get)
+        new_stat = st.selectbox("New Status", Settings.JOB_STATUSES, key="new_s")
         if st.button("Update Status"):
-            # Find ID
-            # This is a bit Hacky, relies on string match. Better to select by ID in real app.
-            row = df[df['company'] + " - " + df['role'] == app_to_edit].iloc[0]
-            db_manager.update_status(int(row['id']), new_stat)
+            db_manager.update_status(app_to_edit, new_stat)
             st.success("Updated!")
             st.rerun()
             
     with c_act2:
         st.write("Danger Zone")
         if st.button("Delete Selected App"):
-             row = df[df['company'] + " - " + df['role'] == app_to_edit].iloc[0]
-             db_manager.delete_application(int(row['id']))
+             db_manager.delete_application(app_to_edit)
              st.success("Deleted.")
              st.rerun()
 
-else:
+elif total == 0 and not (status_filter or search.strip()):
     st.info("No applications tracked yet.")
+else:
+    st.info("No applications match these filters.")
@@ -3,12 +3,30 @@ Resume Version Control Page
 """
 
 import streamlit as st
+import html
 from database.db_manager import db_manager
+from modules.version_diff import version_diff
+from config import Settings
 from app_utils.ui import setup_page_styling
 
 st.set_page_config(page_title="Resume Versions", page_icon="📝")
 setup_page_styling()
 
+
+# Reads are cached until a write bumps the vault's data_version (from any process)
+@st.cache_data(show_spinner=False, max_entries=50)
+def load_versions(data_version, limit, offset=0):
+    return db_manager.get_versions(limit=limit, offset=offset)
+
+
+@st.cache_data(show_spinner=False, max_entries=5)
+def load_vault_stats(data_version):
+    return db_manager.count_versions(), db_manager.version_storage_stats()
+
+
+vault_version = db_manager.data_version("resume_versions")
+total, storage = load_vault_stats(vault_version)
+
 st.title("📝 Resume Version Vault")
 st.markdown("### Track, Compare, and Switch between resume versions.")
 
@@ -24,7 +42,9 @@ if 'resume_text' in st.session_state and st.session_state.resume_text:
     with c2:
         if st.button("💾 Save to Vault"):
             if v_name:
-                db_manager.save_version(v_name, st.session_state.resume_text)
+                # A version loaded from the vault is the parent of what gets saved next
+                st.session_state.resume_version_id = db_manager.save_version(
+                    v_name, st.session_state.resume_text, parent_id=st.session_state.get('resume_version_id'))
                 st.success("Saved!")
                 st.rerun()
             else:
@@ -34,34 +54,116 @@ else:
 
 st.divider()
 
-# Vault List
+# Vault List: metadata only; a version's text is fetched when it is opened, loaded or downloaded
 st.subheader("📜 Version History")
-df = db_manager.get_versions()
+page_size = Settings.VERSION_PAGE_SIZE
+pages = max(1, -(-total // page_size))
+page = st.number_input(f"Page (of {pages})", min_value=1, max_value=pages, value=1) if pages > 1 else 1
+df = load_versions(vault_version, page_size, (page - 1) * page_size)
 
 if not df.empty:
     for index, row in df.iterrows():
+        v_id = int(row['id'])
         with st.expander(f"📌 {row['version_name']} ({row['created_at']})"):
-            st.text_area("Content", row['content'], height=150, key=f"v_{row['id']}")
+            st.caption(f"{int(row['size'] or 0):,} characters · {str(row['content_hash'] or '')[:12]}")
+            show = st.toggle("Show content", key=f"show_{v_id}")
+            if show:
+                content = db_manager.get_version_content(v_id)
+                st.text_area("Content", content, height=150, key=f"v_{v_id}")
             
             c_act1, c_act2, c_act3 = st.columns(3)
             with c_act1:
-                if st.button("📂 Load / Rollback", key=f"load_{row['id']}"):
-                    st.session_state.resume_text = row['content']
+                if st.button("📂 Load / Rollback", key=f"load_{v_id}"):
+                    st.session_state.resume_text = db_manager.get_version_content(v_id)
                     st.session_state.resume_name = row['version_name']
+                    st.session_state.resume_version_id = v_id
                     st.success(f"Loaded '{row['version_name']}' into active session!")
             
             with c_act2:
-                st.download_button(
-                    label="⬇️ Download TXT",
-                    data=row['content'],
-                    file_name=f"{row['version_name']}.txt",
-                    mime="text/plain",
-                    key=f"dl_{row['id']}"
-                )
+                if show:
+                    st.download_button(
+                        label="⬇️ Download TXT",
+                        data=content,
+                        file_name=f"{row['version_name']}.txt",
+                        mime="text/plain",
+                        key=f"dl_{v_id}"
+                    )
+                else:
+                    # Fetches the text, then the real download button appears
+                    st.button("⬇️ Prepare Download", key=f"prep_{v_id}",
+                              on_click=st.session_state.__setitem__, args=(f"show_{v_id}", True))
                 
             with c_act3:
-                if st.button("🗑️ Delete", key=f"del_{row['id']}"):
-                    db_manager.delete_version(row['id'])
+                if st.button("🗑️ Delete", key=f"del_{v_id}"):
+                    db_manager.delete_version(v_id)
                     st.rerun()
 else:
     st.info("Vault is empty. Save your first version above.")
+
+# Compare any two versions
+versions = load_versions(vault_version, 200)
+if len(versions) >= 2:
+    st.divider()
+    st.subheader("🔀 Compare Versions")
+    labels = {int(r.id): f"{r.version_name} ({r.created_at})" for r in versions.itertuples()}
+    ids = list(labels)
+    c_old, c_new = st.columns(2)
+    old_id = c_old.selectbox("From", ids, index=1, format_func=labels.get, key="cmp_old")
+    new_id = c_new.selectbox("To", ids, index=0, format_func=labels.get, key="cmp_new")
+
+    diff = version_diff.diff(old_id, new_id) if old_id != new_id else None
+    if diff is None:
+        st.info("Pick two different versions.")
+    elif "error" in diff:
+        st.warning("One of these versions was deleted. Pick another one.")
+    else:
+        stats = diff["stats"]
+        m1, m2, m3, m4 = st.columns(4)
+        m1.metric("Similarity", f"{diff['similarity'] * 100:.1f}%")
+        m2.metric("Lines Added", stats["added"])
+        m3.metric("Lines Removed", stats["removed"])
+        m4.metric("Lines Changed", stats["changed"])
+
+        if not diff["hunks"]:
+            st.success("Both versions have the same text.")
+        else:
+            tab_changes, tab_unified = st.tabs(["Changes", "Unified Diff"])
+            with tab_changes:
+                for hunk in diff["hunks"][:50]:
+                    if hunk["words"] is not None:
+                        parts = []
+                        for op, text in hunk["words"]:
+                            text = html.escape(text).replace("\n", "<br>")
+                            if op == "-":
+                                parts.append(f"<del style='color:#e06c75'>{text}</del>")
+                            elif op == "+":
+                                parts.append(f"<ins style='color:#98c379'>{text}</ins>")
+                            else:
+                                parts.append(text)
+                        body = "".join(parts)
+                    else:
+                        body = "<br>".join(
+                            [f"<del style='color:#e06c75'>{html.escape(l)}</del>" for l in hunk["removed"]] +
+                            [f"<ins style='color:#98c379'>{html.escape(l)}</ins>" for l in hunk["added"]])
+                    st.caption(f"Line {hunk['old_start']} → {hunk['new_start']}")
+                    st.markdown(body, unsafe_allow_html=True)
+                if len(diff["hunks"]) > 50:
+                    st.caption(f"… {len(diff['hunks']) - 50} more changes in the unified diff.")
+            with tab_unified:
+                st.code(diff["unified"], language="diff")
+
+        # Scores are cached per version text, so only versions never scored before are analyzed
+        if st.toggle("📈 What changed in scores", key="cmp_scores"):
+            with st.spinner("Scoring versions..."):
+                rows = version_diff.score_delta(old_id, new_id)
+            if not rows or any(r["delta"] is None for r in rows):
+                st.warning("Scores unavailable: a version was deleted while scoring.")
+            if rows:
+                st.dataframe(
+                    [{"Metric": r["metric"], "From": r["old"], "To": r["new"],
+                      "Change": "unavailable" if r["delta"] is None else f"{r['delta']:+g}"} for r in rows],
+                    hide_index=True, width='stretch')
+
+if storage["versions"]:
+    st.caption(f"{storage['versions']} versions ({storage['text_bytes'] / 1024:.1f} KB of text) "
+               f"stored in {storage['stored_bytes'] / 1024:.1f} KB")
@@ -4,7 +4,11 @@ JD Auto-Fetcher Page
 
 import streamlit as st
 from modules.jd_fetcher import jd_fetcher
+from modules.jd_dedup import jd_dedup
+from modules.jd_library import jd_library
+from database.db_manager import db_manager
 from app_utils.ui import setup_page_styling
+from config import Settings
 
 st.set_page_config(page_title="JD Auto-Fetcher", page_icon="🔍")
 setup_page_styling()
@@ -12,22 +16,118 @@ setup_page_styling()
 st.markdown("# 🔍 Job Description Auto-Fetcher")
 st.markdown("### Extract JD effortlessly from LinkedIn, Indeed, and more.")
 
-url = st.text_input("🔗 Paste Job Post URL:", placeholder="https://www.linkedin.com/jobs/view/...")
-
-if st.button("Fetch Job Description", type="primary"):
-    if not url:
-        st.error("Please enter a URL.")
-    else:
-        with st.spinner("Fetching job details..."):
-            jd_text = jd_fetcher.fetch_from_url(url)
-            
-            if jd_text:
-                st.success("✅ Job Description Extracted!")
-                st.text_area("Extracted Text", jd_text, height=400)
-                
-                # Option to save to session state to use in other pages
-                if st.button("Use this JD for Analysis"):
-                    st.session_state['jd_text'] = jd_text
-                    st.success("JD saved to session! Go to Resume Analyzer.")
+tab_single, tab_bulk, tab_library = st.tabs(["🔗 Single URL", "📚 Bulk Fetch", "🗂️ JD Library"])
+
+with tab_single:
+    url = st.text_input("🔗 Paste Job Post URL:", placeholder="https://www.linkedin.com/jobs/view/...")
+
+    if st.button("Fetch Job Description", type="primary"):
+        if not url:
+            st.error("Please enter a URL.")
+        else:
+            with st.spinner("Fetching job details..."):
+                jd_text = jd_fetcher.fetch_from_url(url)
+
+                if jd_text:
+                    st.success("✅ Job Description Extracted!")
+                    dup = jd_dedup.register(jd_text, url)
+                    if dup["is_duplicate"]:
+                        st.info(f"♻️ This posting matches a JD seen before ({dup['similarity']:.0%} similar); its earlier analysis will be reused.")
+                    jd_library.save(jd_text, url, jd_fetcher.identify_platform(url))
+                    st.text_area("Extracted Text", jd_text, height=400)
+
+                    # Option to save to session state to use in other pages
+                    if st.button("Use this JD for Analysis"):
+                        st.session_state['jd_text'] = jd_text
+                        st.success("JD saved to session! Go to Resume Analyzer.")
+                else:
+                    st.error("Could not extract text. The site might be blocking scripts or the format is unsupported.")
+
+with tab_bulk:
+    urls_input = st.text_area(
+        "Paste job URLs (one per line):",
+        height=200,
+        placeholder="https://www.linkedin.com/jobs/view/...\nhttps://www.indeed.com/viewjob?jk=...",
+    )
+    st.caption(
+        f"Up to {Settings.JD_BULK_MAX_URLS} URLs, {Settings.JD_BULK_CONCURRENCY} at a time. "
+        "Requests to the same job board are spaced out to avoid getting blocked."
+    )
+
+    if st.button("Fetch All", type="primary"):
+        urls = [u.strip() for u in urls_input.splitlines() if u.strip()]
+        if not urls:
+            st.error("Please enter at least one URL.")
+        else:
+            if len(urls) > Settings.JD_BULK_MAX_URLS:
+                st.warning(f"Only the first {Settings.JD_BULK_MAX_URLS} URLs will be fetched.")
+                urls = urls[:Settings.JD_BULK_MAX_URLS]
+
+            # Stream results into the table as each fetch completes
+            progress = st.progress(0.0, text="Fetching...")
+            table = st.empty()
+            results = []
+            for result in jd_fetcher.fetch_many(urls):
+                if not result["error"]:
+                    result["duplicate"] = jd_dedup.register(result["text"], result["url"])["is_duplicate"]
+                    jd_library.save(result["text"], result["url"], result["platform"])
+                results.append(result)
+                progress.progress(len(results) / len(urls), text=f"Fetched {len(results)} of {len(urls)}")
+                table.dataframe(
+                    [{
+                        "Status": "✅" if not r["error"] else "❌",
+                        "Platform": r["platform"],
+                        "URL": r["url"],
+                        "Words": len(r["text"].split()),
+                        "Duplicate": "♻️" if r.get("duplicate") else "",
+                        "Error": r["error"] or "",
+                    } for r in results],
+                    hide_index=True,
+                    width='stretch',
+                )
+            progress.empty()
+            st.session_state['bulk_jd_results'] = results
+
+    # Results survive reruns so the per-posting buttons keep working
+    results = st.session_state.get('bulk_jd_results', [])
+    ok = [r for r in results if not r["error"]]
+    if results:
+        st.success(f"✅ {len(ok)} of {len(results)} postings extracted.")
+        duplicates = sum(1 for r in ok if r.get("duplicate"))
+        if duplicates:
+            st.info(f"♻️ {duplicates} of them are reposts of JDs seen before.")
+    for i, r in enumerate(ok):
+        with st.expander(f"📄 {r['platform']}: {r['url']}"):
+            st.text_area("Extracted Text", r["text"], height=250, key=f"bulk_text_{i}")
+            if st.button("Use this JD for Analysis", key=f"bulk_use_{i}"):
+                st.session_state['jd_text'] = r["text"]
+                st.success("JD saved to session! Go to Resume Analyzer.")
+
+with tab_library:
+    st.caption(f"{db_manager.count_jds()} job descriptions saved. Every fetched posting is added automatically.")
+    with st.expander("➕ Save a pasted JD"):
+        pasted = st.text_area("Job description text", height=200, key="library_paste")
+        if st.button("Save to Library"):
+            if pasted.strip():
+                jd_library.save(pasted)
+                st.success("Saved!")
             else:
-                st.error("Could not extract text. The site might be blocking scripts or the format is unsupported.")
+                st.error("Paste a job description first.")
+
+    query = st.text_input("🔎 Search saved JDs", placeholder="e.g. python django remote")
+    entries = jd_library.search(query) if query.strip() else db_manager.list_jds(limit=20)
+    if query.strip() and not entries:
+        st.info("No saved JD matches that search.")
+    for entry in entries:
+        label = entry["title"] or entry["source_url"] or f"JD #{entry['id']}"
+        with st.expander(f"📄 {label} · {entry['platform'] or 'Unknown'} · {entry['fetched_at']}"):
+            if entry.get("snippet"):
+                st.markdown(entry["snippet"])
+            if entry["keywords"]:
+                st.caption(f"Keywords: {entry['keywords']}")
+            if entry["source_url"]:
+                st.caption(entry["source_url"])
+            if st.button("Use this JD for Analysis", key=f"library_use_{entry['id']}"):
+                st.session_state['jd_text'] = jd_library.get(entry["id"])["content"]
+                st.session_state['jd_id'] = entry["id"]
+                st.success("JD saved to session! Go to Resume Analyzer.")
@@ -4,6 +4,7 @@ Resume Rewriter Page
 
 import streamlit as st
 from modules.resume_rewriter import resume_rewriter
+from modules.jd_dedup import jd_dedup
 from app_utils.ui import setup_page_styling
 
 st.set_page_config(page_title="Resume Optimizer", page_icon="✍️")
@@ -42,7 +43,8 @@ with tab2:
     
     if st.button("Generate Summary"):
         with st.spinner("Drafting perfect summary..."):
-            summary = resume_rewriter.generate_tailored_summary(st.session_state.resume_text, jd_context)
+            jd_key = jd_dedup.canonical_key(jd_context, "pasted") if jd_context.strip() else ""
+            summary = resume_rewriter.generate_tailored_summary(st.session_state.resume_text, jd_context, jd_key)
             st.success("✨ AI Generated Summary:")
             st.write(summary)
             st.code(summary, language="text")
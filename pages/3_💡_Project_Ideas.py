@@ -38,16 +38,17 @@ else:
             # Use top missing skills + user input
             target_gaps = missing_skills[:5] if missing_skills else ["Python", "React"] # Fallbacks
             
-            recommendations = project_recommender.get_recommendations(target_gaps)
+            # Render each project as soon as it has streamed in
+            shown = 0
+            for proj in project_recommender.stream_recommendations(target_gaps):
+                shown += 1
+                with st.expander(f"🚀 {proj['name']} ({proj['difficulty']})", expanded=True):
+                    st.markdown(f"**Description:** {proj['description']}")
+                    st.markdown(f"**Tech Stack:** `{', '.join(proj['skills'])}`")
+                    if 'reason' in proj:
+                        st.info(f"💡 Why: {proj['reason']}")
             
-            if recommendations:
-                for proj in recommendations:
-                    with st.expander(f"🚀 {proj['name']} ({proj['difficulty']})", expanded=True):
-                        st.markdown(f"**Description:** {proj['description']}")
-                        st.markdown(f"**Tech Stack:** `{', '.join(proj['skills'])}`")
-                        if 'reason' in proj:
-                            st.info(f"💡 Why: {proj['reason']}")
-            else:
+            if not shown:
                 st.info("No specific matches found. Try adding more target skills.")
 
     st.markdown("---")
@@ -26,11 +26,10 @@ selected_skills = st.multiselect("Select skills to learn:", options=missing + fo
 
 if st.button("Generate Roadmap", type="primary"):
     with st.spinner("Curating free courses..."):
-        roadmap = course_aggregator.get_learning_path(selected_skills)
-        
         st.subheader("2. Your Roadmap")
         
-        for skill, resources in roadmap.items():
+        # Each skill renders as soon as its entry has streamed in
+        for skill, resources in course_aggregator.stream_learning_path(selected_skills):
             st.markdown(f"#### 📘 {skill}")
             cols = st.columns(len(resources))
             for i, res in enumerate(resources):
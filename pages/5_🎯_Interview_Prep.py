@@ -40,9 +40,15 @@ else:
         level = st.selectbox("Difficulty", ["Entry Level", "Intermediate", "Senior", "Expert"])
         
     if st.button("Generate Questions", type="primary"):
+        # Show each question as soon as it has streamed in
+        preview = st.empty()
+        questions = []
         with st.spinner("interviewer is thinking..."):
-            questions = interview_coach.generate_questions(role, found[:5], level)
-            st.session_state['interview_questions'] = questions
+            for q in interview_coach.stream_questions(role, found[:5], level):
+                questions.append(q)
+                preview.markdown("\n".join(f"{i+1}. {item}" for i, item in enumerate(questions)))
+        preview.empty()
+        st.session_state['interview_questions'] = questions
             
     # Display Questions
     if 'interview_questions' in st.session_state:
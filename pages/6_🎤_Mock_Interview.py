@@ -3,7 +3,7 @@ Mock Interview Page
 """
 
 import streamlit as st
-from modules.mock_interview import mock_interviewer
+from modules.mock_interview import mock_interviewer, InterviewContext
 from app_utils.ui import setup_page_styling
 
 st.set_page_config(page_title="Mock Interview", page_icon="🎤")
@@ -18,6 +18,10 @@ if "messages" not in st.session_state:
     # Initial greeting
     st.session_state.messages.append({"role": "assistant", "content": "Hello! I'm your AI interviewer today. Ideally, we can start by you telling me a little about yourself?"})
 
+# Running summary of older turns, kept per chat
+if "interview_context" not in st.session_state:
+    st.session_state.interview_context = InterviewContext()
+
 # Display Chat
 for msg in st.session_state.messages:
     with st.chat_message(msg["role"]):
@@ -33,8 +37,10 @@ if prompt := st.chat_input("Type your answer here..."):
     # Get AI Response
     with st.chat_message("assistant"):
         with st.spinner("Interviewer is listening..."):
-            # Pass recent history
-            response = mock_interviewer.get_response(st.session_state.messages[:-1], prompt)
+            # Pass history; the context keeps the prompt within its token budget
+            response = mock_interviewer.get_response(
+                st.session_state.messages[:-1], prompt, st.session_state.interview_context
+            )
             st.write(response)
             
     # Add AI message to history
@@ -44,5 +50,6 @@ if prompt := st.chat_input("Type your answer here..."):
 with st.sidebar:
     if st.button("Reset Interview"):
         st.session_state.messages = []
+        st.session_state.interview_context = InterviewContext()
         st.rerun()
     st.info("Tip: Speak clearly and use the STAR method for behavioral questions.")
@@ -43,60 +43,81 @@ with c2:
 # Input
 username = st.text_input("Enter GitHub Username:", placeholder="e.g. nfsprogramming")
 
+def render_profile(data, n):
+    """Draw one (possibly partial) analysis; `n` keeps chart keys unique across redraws."""
+    stats = data["stats"]
+    langs = data["languages"]
+    projects = data["top_projects"]
+    progress = data.get("progress", {})
+
+    if not data.get("complete"):
+        st.progress(
+            min(1.0, progress.get("languages_measured", 0) / max(1, progress.get("own_repos", 1))),
+            text=f"Loaded {progress.get('repos_loaded', 0)} of {progress.get('repos_total', 0)} repositories, "
+                 f"measured languages for {progress.get('languages_measured', 0)}...",
+        )
+
+    # Header
+    c1, c2 = st.columns([1, 4])
+    with c1:
+        st.image(stats["avatar"], width=100)
+    with c2:
+        st.markdown(f"## {stats['name']}")
+        st.markdown(f"_{stats['bio']}_")
+        st.markdown(f"🔗 [{stats['url']}]({stats['url']})")
+
+    # Metrics
+    m1, m2, m3, m4 = st.columns(4)
+    m1.metric("Repositories", stats["repos"])
+    m2.metric("Followers", stats["followers"])
+    m3.metric("Years Active", f"{2026 - stats['created_at']}+") # 2026 is current year
+    m4.metric("Top Language", list(langs.keys())[0] if langs else "N/A")
+
+    st.divider()
+
+    # Charts & Projects
+    col_chart, col_proj = st.columns([1, 1])
+
+    with col_chart:
+        st.subheader("🛠 Technical Base")
+        if langs:
+            # Pie chart (share of code bytes)
+            df_lang = pd.DataFrame(list(langs.items()), columns=['Language', 'Percentage'])
+            fig = px.pie(df_lang, values='Percentage', names='Language', hole=0.4)
+            st.plotly_chart(fig, width='stretch', key=f"lang_chart_{n}")
+        else:
+            st.info("No language data found.")
+
+        st.subheader("🏷️ Top Topics")
+        topics = data["topics"]
+        if topics:
+            st.write(", ".join([f"`{t[0]}`" for t in topics]))
+
+    with col_proj:
+        st.subheader("🏆 Top Projects")
+        for p in projects:
+            with st.expander(f"⭐ {p['stars']}: {p['name']}", expanded=True):
+                st.write(p['desc'])
+                st.markdown(f"**Language:** {p['language']}")
+                st.markdown(f"[View Repo]({p['url']})")
+
+
 if st.button("Analyze Profile", type="primary"):
     if not username:
         st.warning("Please enter a username.")
     else:
-        with st.spinner(f"Fetching data for @{username}..."):
-            data = github_analyzer.analyze_profile(username)
-            
+        # Redraw as repository pages and language data arrive
+        status = st.empty()
+        view = st.empty()
+        status.info(f"Fetching data for @{username}...")
+        for n, data in enumerate(github_analyzer.stream_profile(username)):
             if data.get("error"):
-                st.error(f"Error: {data['error']}")
-            else:
-                stats = data["stats"]
-                langs = data["languages"]
-                projects = data["top_projects"]
-                
-                # Header
-                c1, c2 = st.columns([1, 4])
-                with c1:
-                    st.image(stats["avatar"], width=100)
-                with c2:
-                    st.markdown(f"## {stats['name']}")
-                    st.markdown(f"_{stats['bio']}_")
-                    st.markdown(f"🔗 [{stats['url']}]({stats['url']})")
-                
-                # Metrics
-                m1, m2, m3, m4 = st.columns(4)
-                m1.metric("Repositories", stats["repos"])
-                m2.metric("Followers", stats["followers"])
-                m3.metric("Years Active", f"{2026 - stats['created_at']}+") # 2026 is current year
-                m4.metric("Top Language", list(langs.keys())[0] if langs else "N/A")
-                
-                st.divider()
-                
-                # Charts & Projects
-                col_chart, col_proj = st.columns([1, 1])
-                
-                with col_chart:
-                    st.subheader("🛠 Technical Base")
-                    if langs:
-                        # Pie chart
-                        df_lang = pd.DataFrame(list(langs.items()), columns=['Language', 'Percentage'])
-                        fig = px.pie(df_lang, values='Percentage', names='Language', hole=0.4)
-                        st.plotly_chart(fig, width='stretch')
-                    else:
-                        st.info("No language data found.")
-                        
-                    st.subheader("🏷️ Top Topics")
-                    topics = data["topics"]
-                    if topics:
-                        st.write(", ".join([f"`{t[0]}`" for t in topics]))
-                
-                with col_proj:
-                    st.subheader("🏆 Top Projects")
-                    for p in projects:
-                        with st.expander(f"⭐ {p['stars']}: {p['name']}", expanded=True):
-                            st.write(p['desc'])
-                            st.markdown(f"**Language:** {p['language']}")
-                            st.markdown(f"[View Repo]({p['url']})")
+                view.error(f"Error: {data['error']}")
+                break
+            with view.container():
+                render_profile(data, n)
+        status.empty()
+
+        quota = github_analyzer.rate_limit().get("core")
+        if quota:
+            st.caption(f"GitHub API quota: {quota['remaining']}/{quota['limit']} requests left this hour.")
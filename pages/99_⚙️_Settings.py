@@ -5,6 +5,7 @@ Settings & Admin Page
 import streamlit as st
 import os
 from app_utils.ui import setup_page_styling
+from app_utils.llm_wrapper import get_backend_health, get_hedge_stats, get_coalescing_stats
 
 st.set_page_config(page_title="Settings", page_icon="⚙️")
 setup_page_styling()
@@ -21,6 +22,15 @@ if openai_key:
     os.environ["OPENAI_API_KEY"] = openai_key
     st.success("Key updated for this session!")
 
+# AI Backend Health
+with st.expander("🩺 AI Backend Status", expanded=False):
+    st.caption("Backends with an open circuit are skipped until their cool-down ends.")
+    st.dataframe(get_backend_health(), hide_index=True, width='stretch')
+    st.caption("Hedged requests (Mock Interview duplicates slow calls to the next backend):")
+    st.json(get_hedge_stats())
+    st.caption("Identical prompts in flight at the same time share one upstream call:")
+    st.json(get_coalescing_stats())
+
 # 2. Database Management
 st.subheader("💾 Data Management")
 
@@ -0,0 +1,79 @@
+"""
+Shared pytest fixtures.
+Every test session gets its own database and cache directories, so the app's
+own files are never touched.
+"""
+
+import os
+import sys
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from config import Settings  # noqa: E402
+
+_TMP = tempfile.mkdtemp(prefix="tests_")
+Settings.DB_PATH = os.path.join(_TMP, "test.db")
+Settings.HTTP_CACHE_DIR = os.path.join(_TMP, "http")
+Settings.JD_TEXT_CACHE_DIR = os.path.join(_TMP, "jd_text")
+Settings.GITHUB_CACHE_DIR = os.path.join(_TMP, "github")
+
+
+class FixtureServer(ThreadingHTTPServer):
+    """
+    Local HTTP server for fetch tests. `routes` maps a path to a handler
+    function(request) -> (status, headers, body); every request is recorded.
+    """
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _FixtureHandler)
+        self.routes = {}
+        self.requests = []  # (path, headers) in arrival order
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def hits(self, path: str) -> int:
+        return sum(1 for p, _ in self.requests if p == path)
+
+
+class _FixtureHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        path = self.path.split("?")[0]
+        self.server.requests.append((self.path, dict(self.headers)))
+        route = self.server.routes.get(path)
+        status, headers, body = route(self) if route else (404, {}, b"not found")
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        try:
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            if status != 304:
+                self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            # The client gave up first (timeout or max_bytes tests)
+            pass
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def http_server():
+    server = FixtureServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
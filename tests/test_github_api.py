@@ -0,0 +1,137 @@
+"""
+GitHubClient and GitHubAnalyzer against tools/stub_github_server.py:
+Link-header pagination, X-RateLimit tracking and exhaustion, and ETag
+conditional requests.
+"""
+
+import time
+
+import pytest
+
+from app_utils.github_api import GitHubClient, RateLimitExceeded
+from config import APIKeys, Settings
+from tools.stub_github_server import start_in_thread
+
+
+@pytest.fixture
+def stub_factory():
+    servers = []
+
+    def start(**kwargs):
+        server = start_in_thread(**kwargs)
+        servers.append(server)
+        return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def analyzer_factory(tmp_path, monkeypatch):
+    monkeypatch.setattr(APIKeys, "GITHUB_TOKEN", "")
+    monkeypatch.setattr(Settings, "GITHUB_CACHE_DIR", str(tmp_path / "github"))
+
+    def make(base_url):
+        monkeypatch.setattr(Settings, "GITHUB_API_URL", base_url)
+        from modules.github_analyzer import GitHubAnalyzer
+        return GitHubAnalyzer()
+
+    return make
+
+
+def test_all_repository_pages_are_crawled(stub_factory, analyzer_factory):
+    server, url = stub_factory(repos=250, rate_limit=1000)
+    result = analyzer_factory(url).analyze_profile("octo")
+
+    assert result["error"] is None and result["complete"]
+    assert result["progress"]["repos_loaded"] == 250
+    stats = server.state.snapshot()
+    assert stats["by_path"]["/users/*/repos"] == 3  # 100 + 100 + 50
+    # Every own repo's languages were measured, one request each
+    assert stats["by_path"]["/repos/*/languages"] == result["progress"]["own_repos"]
+    assert result["progress"]["languages_measured"] == result["progress"]["own_repos"]
+
+
+def test_crawl_stops_at_max_repos(stub_factory, analyzer_factory, monkeypatch):
+    monkeypatch.setattr(Settings, "GITHUB_MAX_REPOS", 150)
+    server, url = stub_factory(repos=250, rate_limit=1000)
+    result = analyzer_factory(url).analyze_profile("octo")
+
+    assert result["progress"]["repos_loaded"] == 150
+    assert server.state.snapshot()["by_path"]["/users/*/repos"] == 2
+
+
+def test_rate_limit_headers_are_tracked(stub_factory, tmp_path):
+    server, url = stub_factory(repos=10, rate_limit=50)
+    client = GitHubClient(url, cache_dir=str(tmp_path / "cache"))
+    client.get("/users/octo")
+    client.get("/users/octo/repos", {"per_page": 100, "page": 1})
+
+    core = client.rate.snapshot()["core"]
+    assert core["limit"] == 50
+    assert core["remaining"] == server.state.snapshot()["remaining"] == 48
+    assert core["reset"] > time.time()
+
+
+def test_conditional_requests_reuse_cached_bodies(stub_factory, tmp_path):
+    server, url = stub_factory(repos=10, rate_limit=50)
+    client = GitHubClient(url, cache_dir=str(tmp_path / "cache"))
+    first, _ = client.get("/users/octo")
+    again, _ = client.get("/users/octo")
+
+    assert again == first
+    assert client.stats == {"requests": 2, "not_modified": 1, "stale": 0}
+    stats = server.state.snapshot()
+    assert stats["not_modified"] == 1
+    assert stats["remaining"] == 49  # a 304 costs no quota
+
+
+def test_refresh_revalidates_and_skips_unchanged_languages(stub_factory, analyzer_factory):
+    server, url = stub_factory(repos=120, rate_limit=1000)
+    analyzer = analyzer_factory(url)
+    first = analyzer.analyze_profile("octo")
+    before = server.state.snapshot()
+
+    second = analyzer.analyze_profile("octo", refresh=True)
+    after = server.state.snapshot()
+    assert second["languages"] == first["languages"]
+    # Profile + 2 repo pages, all answered 304; languages come from the pushed_at cache
+    assert after["requests"] - before["requests"] == 3
+    assert after["not_modified"] - before["not_modified"] == 3
+    assert after["remaining"] == before["remaining"]
+
+
+def test_exhausted_quota_serves_cache_or_raises(stub_factory, tmp_path):
+    server, url = stub_factory(repos=10, rate_limit=2)
+    client = GitHubClient(url, cache_dir=str(tmp_path / "cache"), max_wait=1)
+    profile, _ = client.get("/users/octo")
+    client.get("/users/octo/repos")
+
+    # Quota gone and the reset an hour away: cached URLs are served stale, others fail fast
+    assert client.get("/users/octo")[0] == profile
+    assert client.stats["stale"] == 1
+    with pytest.raises(RateLimitExceeded) as error:
+        client.get("/users/other")
+    assert error.value.reset_at > time.time() + 60
+
+
+def test_server_rejection_marks_quota_exhausted(stub_factory, tmp_path):
+    server, url = stub_factory(repos=10, rate_limit=1)
+    client = GitHubClient(url, max_wait=1)
+    client.get("/users/octo")
+    client.rate._limits.clear()  # forget the headers, as if another process used the quota
+
+    with pytest.raises(RateLimitExceeded):
+        client.get("/users/other")
+    assert client.rate.wait_time() > 60
+    assert server.state.snapshot()["rejected"] == 1
+
+
+def test_analyzer_reports_missing_user_and_rate_limit(stub_factory, analyzer_factory):
+    server, url = stub_factory(repos=10, rate_limit=1)
+    analyzer = analyzer_factory(url)
+
+    assert analyzer.analyze_profile("ghost")["error"] == "User not found"
+    assert "Rate Limit" in analyzer.analyze_profile("octo")["error"]
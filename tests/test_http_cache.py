@@ -0,0 +1,180 @@
+"""
+CachedSession and JDFetcher against a local fixture server: fresh hits,
+ETag / 304 revalidation, truncated bodies, timeouts and the extracted-text cache.
+"""
+
+import time
+
+import pytest
+import requests
+
+from app_utils.http_cache import CachedSession
+from config import Settings
+
+JD_HTML = """<html><body><nav>Home Jobs About</nav>
+<div class="job-description"><h1>Backend Engineer</h1>
+<p>{}</p></div><footer>(c) Example</footer></body></html>""".format(
+    "Build and run Python services on Postgres and Kubernetes, and mentor the team. " * 6
+)
+
+
+LINKEDIN_HTML = """<html><body><header>Sign in Join now</header><main>
+<section class="top-card"><h1>Data Engineer</h1><span>Acme - Remote - 200 applicants</span></section>
+<div class="show-more-less-html__markup show-more-less-html__markup--clamp-after-5 relative overflow-hidden">
+<p>Design batch and streaming pipelines with Spark and Airflow.</p><ul><li>4+ years of Python</li></ul></div>
+<section class="similar-jobs">Similar jobs: Analytics Engineer</section></main></body></html>"""
+
+
+def etag_route(state):
+    """200 with the current ETag, or 304 when the client already has it."""
+    def route(request):
+        etag = f'"{state["version"]}"'
+        if request.headers.get("If-None-Match") == etag:
+            return 304, {"ETag": etag}, b""
+        return 200, {"ETag": etag, "Content-Type": "text/plain; charset=utf-8"}, f"body v{state['version']}"
+    return route
+
+
+def slow_route(request):
+    time.sleep(1.0)
+    return 200, {}, b"late"
+
+
+@pytest.fixture
+def session(tmp_path):
+    return CachedSession(str(tmp_path / "http"), timeout=(2, 0.3), max_age=600)
+
+
+def test_fresh_entry_is_served_without_network(http_server, session):
+    http_server.routes["/page"] = etag_route({"version": 1})
+    first = session.get(http_server.url + "/page")
+    second = session.get(http_server.url + "/page")
+
+    assert (first.from_cache, second.from_cache) == (False, True)
+    assert second.text == "body v1"
+    assert http_server.hits("/page") == 1
+    assert session.stats == {"hits": 1, "revalidated": 0, "misses": 1}
+
+
+def test_stale_entry_is_revalidated_with_etag(http_server, session):
+    state = {"version": 1}
+    http_server.routes["/page"] = etag_route(state)
+    session.get(http_server.url + "/page")
+
+    revalidated = session.get(http_server.url + "/page", max_age=0)
+    assert revalidated.status_code == 200
+    assert revalidated.from_cache
+    assert revalidated.text == "body v1"
+    assert http_server.requests[-1][1].get("If-None-Match") == '"1"'
+    assert session.stats["revalidated"] == 1
+
+    # A changed resource replaces the cached body
+    state["version"] = 2
+    changed = session.get(http_server.url + "/page", max_age=0)
+    assert (changed.from_cache, changed.text) == (False, "body v2")
+    assert session.get(http_server.url + "/page").text == "body v2"
+
+
+def test_errors_are_not_cached(http_server, session):
+    http_server.routes["/gone"] = lambda request: (500, {}, b"oops")
+    assert session.get(http_server.url + "/gone").status_code == 500
+    assert session.get(http_server.url + "/gone").status_code == 500
+    assert http_server.hits("/gone") == 2
+
+
+def test_truncated_body_is_flagged_and_not_cached(http_server, session):
+    http_server.routes["/big"] = lambda request: (200, {}, b"x" * 200_000)
+    truncated = session.get(http_server.url + "/big", max_bytes=1000)
+    assert truncated.truncated
+    assert len(truncated.content) == 1000
+
+    full = session.get(http_server.url + "/big")
+    assert not full.from_cache and not full.truncated
+    assert len(full.content) == 200_000
+    assert http_server.hits("/big") == 2
+
+    # A body that fits is complete and cached as usual
+    http_server.routes["/small"] = lambda request: (200, {}, b"y" * 500)
+    assert not session.get(http_server.url + "/small", max_bytes=1000).truncated
+    assert session.get(http_server.url + "/small").from_cache
+
+
+def test_read_timeout_raises(http_server, session):
+    http_server.routes["/slow"] = slow_route
+    with pytest.raises(requests.exceptions.Timeout):
+        session.get(http_server.url + "/slow")
+
+
+@pytest.fixture
+def fetcher(tmp_path, monkeypatch):
+    monkeypatch.setattr(Settings, "HTTP_CACHE_DIR", str(tmp_path / "http"))
+    monkeypatch.setattr(Settings, "JD_TEXT_CACHE_DIR", str(tmp_path / "jd_text"))
+    monkeypatch.setattr(Settings, "HTTP_CACHE_MAX_AGE", 0)  # every page fetch goes to the server
+    monkeypatch.setattr(Settings, "JD_FETCH_TIMEOUT", (2, 0.3))
+    from modules.jd_fetcher import JDFetcher
+    return JDFetcher()
+
+
+def test_extracted_text_cache_hit_skips_the_network(http_server, fetcher):
+    http_server.routes["/job"] = lambda request: (200, {"Content-Type": "text/html"}, JD_HTML)
+    url = http_server.url + "/job"
+
+    text = fetcher._fetch(url, "Generic")
+    assert text.startswith("Backend Engineer")
+    assert "Home Jobs" not in text and "(c) Example" not in text
+    assert fetcher._fetch(url, "Generic") == text
+    assert http_server.hits("/job") == 1
+
+
+@pytest.mark.parametrize("platform", ["Generic", "Indeed"])
+def test_error_pages_are_raised_and_never_cached(http_server, fetcher, platform):
+    http_server.routes["/job"] = lambda request: (503, {"Content-Type": "text/html"}, "<p>Service Unavailable</p>" * 20)
+    url = http_server.url + "/job"
+
+    for _ in range(2):
+        with pytest.raises(Exception, match="503"):
+            fetcher._fetch(url, platform)
+    assert http_server.hits("/job") == 2
+    assert fetcher.text_cache.get_text(url) is None
+
+
+def test_linkedin_description_with_several_classes(http_server, fetcher):
+    http_server.routes["/jobs/view/1"] = lambda request: (200, {"Content-Type": "text/html"}, LINKEDIN_HTML)
+
+    text = fetcher._scrape_linkedin(http_server.url + "/jobs/view/1")
+    assert text == "Design batch and streaming pipelines with Spark and Airflow.\n4+ years of Python"
+
+
+def test_fetch_many_reports_timeouts_per_url(http_server, fetcher):
+    http_server.routes["/job"] = lambda request: (200, {"Content-Type": "text/html"}, JD_HTML)
+    http_server.routes["/slow"] = slow_route
+
+    results = {r["url"]: r for r in fetcher.fetch_many([http_server.url + "/job", http_server.url + "/slow"])}
+    assert results[http_server.url + "/job"]["error"] is None
+    assert results[http_server.url + "/slow"]["text"] == ""
+    assert "timed out" in results[http_server.url + "/slow"]["error"].lower()
+
+
+def test_fetch_many_reports_error_pages(http_server, fetcher):
+    http_server.routes["/job"] = lambda request: (200, {"Content-Type": "text/html"}, JD_HTML)
+    http_server.routes["/blocked"] = lambda request: (503, {"Content-Type": "text/html"}, "<p>Try again later</p>" * 20)
+    blocked = http_server.url + "/blocked"
+
+    results = {r["url"]: r for r in fetcher.fetch_many([http_server.url + "/job", blocked])}
+    assert results[http_server.url + "/job"]["error"] is None
+    # The bulk tab saves only results without an error
+    assert results[blocked]["text"] == ""
+    assert "503" in results[blocked]["error"]
+    assert fetcher.text_cache.get_text(blocked) is None
+
+
+def test_fetch_many_stops_queued_fetches_when_closed(http_server, fetcher):
+    http_server.routes["/slow"] = slow_route
+    urls = [f"{http_server.url}/slow?n={n}" for n in range(6)]
+
+    results = fetcher.fetch_many(urls, max_workers=1)
+    started = time.monotonic()
+    next(results)  # one fetch times out, the other five are still queued
+    results.close()
+    assert time.monotonic() - started < 2
+    assert len(http_server.requests) <= 2
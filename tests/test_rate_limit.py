@@ -0,0 +1,21 @@
+"""HostRateLimiter bucket selection."""
+
+from app_utils.rate_limit import HostRateLimiter
+
+
+def test_hosts_under_a_configured_domain_share_one_bucket():
+    limiter = HostRateLimiter({"indeed.com": (0.5, 2)}, (2, 4))
+    bucket = limiter._bucket("www.indeed.com")
+
+    assert limiter._bucket("in.indeed.com") is bucket
+    assert limiter._bucket("indeed.com") is bucket
+    assert (bucket.rate, bucket.burst) == (0.5, 2)
+    assert limiter._bucket("notindeed.com") is not bucket
+
+
+def test_unconfigured_hosts_get_their_own_default_bucket():
+    limiter = HostRateLimiter({"indeed.com": (0.5, 2)}, (2, 4))
+    a, b = limiter._bucket("jobs.example.com"), limiter._bucket("careers.example.org")
+
+    assert a is not b
+    assert (a.rate, a.burst) == (2, 4)
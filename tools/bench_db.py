@@ -0,0 +1,171 @@
+"""
+Job Tracker Database Benchmark
+Simulates concurrent Streamlit sessions against the job tracker tables: writer
+sessions add applications and change their status, while reader sessions load
+the application list. Reports throughput, latency percentiles and
+"database is locked" errors.
+
+Usage:
+    python tools/bench_db.py --writers 8 --readers 16 --duration 10 --think 0.01
+    python tools/bench_db.py --legacy    # connect-per-call + rollback journal, for comparison
+
+Runs against a temporary database; the app's own database is never touched.
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+STATUSES = ["Applied", "Screening", "Interview", "Offer", "Rejected"]
+
+
+def percentile(samples, q):
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class LegacyDB:
+    """The previous access pattern: a fresh connection per call, default journal and timeout."""
+
+    def __init__(self, path: str):
+        self.db_path = path
+        conn = sqlite3.connect(path)
+        with open(os.path.join(ROOT, "database", "schema.sql"), "r") as f:
+            conn.executescript(f.read())
+        conn.execute("PRAGMA journal_mode=DELETE")
+        conn.commit()
+        conn.close()
+
+    def add_application(self, company, role, status, date, score, notes):
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("""
+            INSERT INTO job_applications (company, role, status, date_applied, ats_score, notes)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, (company, role, status, date, score, notes))
+        conn.commit()
+        conn.close()
+
+    def update_status(self, app_id, new_status):
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("UPDATE job_applications SET status = ? WHERE id = ?", (new_status, app_id))
+        conn.commit()
+        conn.close()
+
+    def get_applications(self):
+        conn = sqlite3.connect(self.db_path)
+        import pandas as pd
+        df = pd.read_sql_query("SELECT * FROM job_applications ORDER BY date_applied DESC", conn)
+        conn.close()
+        return df
+
+
+class Recorder:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies = {"write": [], "read": []}
+        self.errors = {"write": 0, "read": 0}
+        self.locked = 0
+
+    def record(self, kind, seconds, error=None):
+        with self.lock:
+            if error is None:
+                self.latencies[kind].append(seconds)
+            else:
+                self.errors[kind] += 1
+                if "locked" in str(error):
+                    self.locked += 1
+
+
+def writer(db, recorder, stop, rng, think):
+    ids = []
+    while not stop.wait(think):
+        started = time.perf_counter()
+        try:
+            if ids and rng.random() < 0.5:
+                db.update_status(rng.choice(ids), rng.choice(STATUSES))
+            else:
+                db.add_application(f"Company {rng.randint(1, 500)}", "Engineer", "Applied",
+                                   f"2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}", rng.randint(0, 100), "")
+                ids.append(rng.randint(1, max(1, len(ids) * 4)))
+            recorder.record("write", time.perf_counter() - started)
+        except sqlite3.Error as e:
+            recorder.record("write", 0, e)
+
+
+def reader(db, recorder, stop, think):
+    while not stop.wait(think):
+        started = time.perf_counter()
+        try:
+            db.get_applications()
+            recorder.record("read", time.perf_counter() - started)
+        except Exception as e:
+            recorder.record("read", 0, e)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent job tracker database benchmark")
+    parser.add_argument("--writers", type=int, default=8, help="writer sessions")
+    parser.add_argument("--readers", type=int, default=16, help="reader sessions")
+    parser.add_argument("--duration", type=float, default=10, help="seconds to run")
+    parser.add_argument("--think", type=float, default=0.01, help="seconds each session pauses between operations")
+    parser.add_argument("--seed-rows", type=int, default=2000, help="applications inserted before the run")
+    parser.add_argument("--legacy", action="store_true", help="benchmark the old connect-per-call access pattern")
+    args = parser.parse_args()
+
+    tmpdir = tempfile.mkdtemp(prefix="bench_db_")
+    path = os.path.join(tmpdir, "bench.db")
+
+    from config import Settings
+    Settings.DB_PATH = path
+    if args.legacy:
+        db = LegacyDB(path)
+    else:
+        from database.db_manager import DBManager
+        db = DBManager()
+
+    rng = random.Random(0)
+    conn = sqlite3.connect(path)
+    conn.executemany(
+        "INSERT INTO job_applications (company, role, status, date_applied, ats_score, notes) VALUES (?, ?, ?, ?, ?, ?)",
+        [(f"Company {i}", "Engineer", rng.choice(STATUSES), f"2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+          rng.randint(0, 100), "") for i in range(args.seed_rows)],
+    )
+    conn.commit()
+    conn.close()
+
+    recorder = Recorder()
+    stop = threading.Event()
+    threads = [threading.Thread(target=writer, args=(db, recorder, stop, random.Random(i), args.think)) for i in range(args.writers)]
+    threads += [threading.Thread(target=reader, args=(db, recorder, stop, args.think)) for _ in range(args.readers)]
+    started = time.perf_counter()
+    for t in threads:
+        t.start()
+    time.sleep(args.duration)
+    stop.set()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - started
+
+    mode = "legacy (connect per call, rollback journal)" if args.legacy else "DBManager (per-thread connection, WAL)"
+    print(f"\n{mode}: {args.writers} writers, {args.readers} readers, {elapsed:.1f}s\n")
+    print(f"{'op':<6} {'ok':>8} {'errors':>7} {'ops/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for kind in ("write", "read"):
+        samples = recorder.latencies[kind]
+        print(f"{kind:<6} {len(samples):>8} {recorder.errors[kind]:>7} {len(samples) / elapsed:>8.1f} "
+              f"{percentile(samples, 0.5) * 1000:>8.2f} {percentile(samples, 0.95) * 1000:>8.2f} "
+              f"{percentile(samples, 0.99) * 1000:>8.2f}")
+    print(f"\n'database is locked' errors: {recorder.locked}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Version Diff Benchmark
+Diffs pairs of generated resume-like documents (default 2,000 lines) with a
+growing share of edited lines and reports latency against the vault's target:
+a cold diff of two 2,000-line versions with 5% of lines edited must finish
+within TARGET_MS at p95. Plain difflib.unified_diff is timed alongside.
+
+Usage:
+    python tools/bench_diff.py --lines 2000 --runs 20
+
+Exits non-zero when the target is missed. Runs against a temporary database.
+"""
+
+import argparse
+import difflib
+import os
+import random
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+TARGET_MS = 100
+TARGET_EDIT_RATIO = 0.05
+
+WORDS = ("python sql docker kubernetes aws react led built designed improved reduced latency pipeline "
+         "team customers revenue migrated automated tested scaled api service platform data model").split()
+
+
+def percentile(samples, q):
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def sentence(rng):
+    return "- " + " ".join(rng.choice(WORDS) for _ in range(rng.randint(8, 18))).capitalize() + "."
+
+
+def edited(lines, rng, ratio):
+    """Copy of `lines` with about ratio * len(lines) lines replaced, inserted or deleted."""
+    lines = list(lines)
+    for _ in range(max(1, int(len(lines) * ratio))):
+        roll = rng.random()
+        i = rng.randrange(len(lines))
+        if roll < 0.5:
+            # Reword part of a line, the common case when tailoring
+            words = lines[i].split()
+            words[rng.randrange(len(words))] = rng.choice(WORDS)
+            lines[i] = " ".join(words)
+        elif roll < 0.8:
+            lines.insert(i, sentence(rng))
+        else:
+            del lines[i]
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Version diff benchmark")
+    parser.add_argument("--lines", type=int, default=2000, help="lines per document")
+    parser.add_argument("--runs", type=int, default=20, help="document pairs per edit ratio")
+    args = parser.parse_args()
+
+    from config import Settings
+    # The diff module imports the database singleton; keep it off the app's database
+    Settings.DB_PATH = os.path.join(tempfile.mkdtemp(prefix="bench_diff_"), "bench.db")
+    from modules.version_diff import VersionDiff
+    differ = VersionDiff()
+
+    print(f"\n{args.lines}-line documents, {args.runs} pairs per row (cold: no cache)\n")
+    print(f"{'edited':>7} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8} {'difflib p95':>12}")
+    target_p95 = None
+    for ratio in (0.01, 0.05, 0.2, 0.5):
+        rng = random.Random(int(ratio * 1000))
+        samples, baseline = [], []
+        for _ in range(args.runs):
+            old = [sentence(rng) for _ in range(args.lines)]
+            new = edited(old, rng, ratio)
+            old_text, new_text = "\n".join(old), "\n".join(new)
+
+            started = time.perf_counter()
+            differ.diff_texts(old_text, new_text)
+            samples.append(time.perf_counter() - started)
+
+            started = time.perf_counter()
+            list(difflib.unified_diff(old_text.splitlines(), new_text.splitlines(), lineterm=""))
+            baseline.append(time.perf_counter() - started)
+        p95 = percentile(samples, 0.95) * 1000
+        if ratio == TARGET_EDIT_RATIO:
+            target_p95 = p95
+        print(f"{ratio:>7.0%} {percentile(samples, 0.5) * 1000:>8.2f} {p95:>8.2f} {max(samples) * 1000:>8.2f} "
+              f"{percentile(baseline, 0.95) * 1000:>12.2f}")
+
+    passed = target_p95 is not None and target_p95 <= TARGET_MS
+    print(f"\nTarget: p95 <= {TARGET_MS} ms at {TARGET_EDIT_RATIO:.0%} edited -> "
+          f"{'PASS' if passed else 'FAIL'} ({target_p95:.2f} ms)")
+    sys.exit(0 if passed else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Job Application Import / Export Benchmark
+Writes a CSV (and JSONL) of generated applications, imports it through
+application_io, then exports the table back out, reporting rows per second
+and memory. The target is 100k rows in a few seconds with memory that does
+not grow with the row count.
+
+Usage:
+    python tools/bench_import.py --rows 100000
+    python tools/bench_import.py --rows 100000 --trace-memory   # exact peak Python allocations (slower)
+
+Runs against a temporary database; the app's own database is never touched.
+"""
+
+import argparse
+import csv
+import json
+import os
+import random
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+STATUSES = ["Applied", "Screening", "Interview", "Offer", "Rejected"]
+
+
+def generate(path, rows, fmt):
+    rng = random.Random(0)
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f) if fmt == "csv" else None
+        if writer:
+            writer.writerow(["Company Name", "Title", "Status", "Date", "Score", "Notes"])
+        for i in range(rows):
+            row = [f"Company {rng.randint(1, 5000)}", rng.choice(["Engineer", "Analyst", "PM", "Designer"]),
+                   rng.choice(STATUSES), f"2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+                   rng.randint(0, 100), "referral" if rng.random() < 0.1 else ""]
+            if writer:
+                writer.writerow(row)
+            else:
+                f.write(json.dumps(dict(zip(["company", "role", "status", "date_applied", "ats_score", "notes"], row))) + "\n")
+
+
+def max_rss_mb():
+    # KB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def measure(label, func, rows, trace):
+    if trace:
+        tracemalloc.start()
+    rss_before = max_rss_mb()
+    started = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - started
+    peak = ""
+    if trace:
+        peak = f"{tracemalloc.get_traced_memory()[1] / 1024 / 1024:>9.1f}"
+        tracemalloc.stop()
+    print(f"{label:<14} {elapsed:>8.2f} {rows / elapsed:>12,.0f} {max_rss_mb() - rss_before:>13.1f} {peak:>9}")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Job application import/export benchmark")
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--trace-memory", action="store_true", help="report peak traced allocations")
+    args = parser.parse_args()
+
+    tmpdir = tempfile.mkdtemp(prefix="bench_import_")
+    from config import Settings
+    Settings.DB_PATH = os.path.join(tmpdir, "bench.db")
+    from database.db_manager import db_manager
+    from modules.application_io import application_io
+
+    print(f"\n{args.rows:,} rows, {Settings.JOB_IMPORT_CHUNK_SIZE:,} per transaction\n")
+    print(f"{'step':<14} {'seconds':>8} {'rows/s':>12} {'RSS growth MB':>13} {'peak MB':>9}")
+    for fmt in ("csv", "jsonl"):
+        path = os.path.join(tmpdir, f"in.{fmt}")
+        generate(path, args.rows, fmt)
+        with open(path, "rb") as f:
+            report = measure(f"import {fmt}", lambda: application_io.import_file(f, fmt), args.rows, args.trace_memory)
+        assert report["imported"] == args.rows and not report["rejected"], report
+
+    total = db_manager.count_applications()
+    for fmt in ("csv", "jsonl"):
+        path = os.path.join(tmpdir, f"out.{fmt}")
+        with open(path, "w", encoding="utf-8", newline="") as out:
+            count = measure(f"export {fmt}", lambda: application_io.export(out, fmt), total, args.trace_memory)
+        assert count == total
+    print(f"\n{total:,} rows in the table, database file {os.path.getsize(Settings.DB_PATH) / 1024 / 1024:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Resume Version Storage Benchmark
+Saves a chain of resume versions, each a small edit of the previous one, then
+reports how much the database grew against the raw text size, and how long a
+version takes to rebuild from its blob chain (cold, with the in-memory cache
+cleared, and warm).
+
+Usage:
+    python tools/bench_versions.py --versions 500 --edits 3
+    python tools/bench_versions.py --snapshot-interval 0    # every version a full copy, for comparison
+
+Runs against a temporary database; the app's own database is never touched.
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+WORDS = ("python sql docker kubernetes aws react led built designed improved reduced latency pipeline "
+         "team customers revenue migrated automated tested scaled api service platform data model").split()
+
+
+def percentile(samples, q):
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def sentence(rng):
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(8, 18))).capitalize() + "."
+
+
+def edit(lines, rng, edits):
+    """A few line-level changes, like tailoring a resume for the next application."""
+    lines = list(lines)
+    for _ in range(edits):
+        roll = rng.random()
+        i = rng.randrange(len(lines))
+        if roll < 0.6:
+            lines[i] = "- " + sentence(rng)
+        elif roll < 0.8 or len(lines) < 20:
+            lines.insert(i, "- " + sentence(rng))
+        else:
+            del lines[i]
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Resume version storage benchmark")
+    parser.add_argument("--versions", type=int, default=500, help="versions to save")
+    parser.add_argument("--lines", type=int, default=80, help="lines in the first version")
+    parser.add_argument("--edits", type=int, default=3, help="line changes between consecutive versions")
+    parser.add_argument("--snapshot-interval", type=int, default=None, help="override VERSION_SNAPSHOT_INTERVAL")
+    parser.add_argument("--reads", type=int, default=200, help="random versions rebuilt")
+    args = parser.parse_args()
+
+    from config import Settings
+    Settings.DB_PATH = os.path.join(tempfile.mkdtemp(prefix="bench_versions_"), "bench.db")
+    if args.snapshot_interval is not None:
+        Settings.VERSION_SNAPSHOT_INTERVAL = args.snapshot_interval
+    from database.db_manager import DBManager
+    db = DBManager()
+
+    rng = random.Random(0)
+    lines = ["- " + sentence(rng) for _ in range(args.lines)]
+    texts = {}
+    started = time.perf_counter()
+    for n in range(args.versions):
+        text = "\n".join(lines) + "\n"
+        texts[db.save_version(f"v{n + 1}", text)] = text
+        lines = edit(lines, rng, args.edits)
+    write_seconds = time.perf_counter() - started
+
+    stats = db.version_storage_stats()
+    db.close()
+    db_bytes = os.path.getsize(Settings.DB_PATH)
+    ids = [rng.choice(list(texts)) for _ in range(args.reads)]
+
+    def rebuild(cold):
+        samples = []
+        for v_id in ids:
+            if cold:
+                db._content_cache.clear()
+            started = time.perf_counter()
+            content = db.get_version_content(v_id)
+            samples.append(time.perf_counter() - started)
+            assert content == texts[v_id], f"version {v_id} rebuilt incorrectly"
+        return samples
+
+    cold, warm = rebuild(True), rebuild(False)
+
+    print(f"\n{args.versions} versions, {args.edits} line edits each, "
+          f"snapshot every {Settings.VERSION_SNAPSHOT_INTERVAL} deltas\n")
+    print(f"text saved:      {stats['text_bytes'] / 1024:>10.1f} KB")
+    print(f"blobs stored:    {stats['stored_bytes'] / 1024:>10.1f} KB in {stats['blobs']} blobs "
+          f"({stats['stored_bytes'] / max(1, stats['text_bytes']):.1%} of text)")
+    print(f"database file:   {db_bytes / 1024:>10.1f} KB")
+    print(f"save:            {write_seconds / args.versions * 1000:>10.2f} ms per version\n")
+    print(f"{'rebuild':<8} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8}")
+    for name, samples in (("cold", cold), ("warm", warm)):
+        print(f"{name:<8} {percentile(samples, 0.5) * 1000:>8.3f} {percentile(samples, 0.95) * 1000:>8.3f} "
+              f"{max(samples) * 1000:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,22 @@
+"""
+Precompute Project Catalog Embeddings
+Encodes every catalog idea (config.PROJECT_IDEAS + Settings.PROJECT_CATALOG_PATH)
+and saves the matrix to Settings.PROJECT_CATALOG_EMBEDDINGS_PATH, which the
+catalog loads at startup to blend semantic similarity into its ranking.
+
+Usage:
+    python tools/build_project_embeddings.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import Settings
+from modules.project_catalog import project_catalog
+
+
+if __name__ == "__main__":
+    project_catalog.precompute_embeddings()
+    print(f"Saved {len(project_catalog.ideas)} embeddings to {Settings.PROJECT_CATALOG_EMBEDDINGS_PATH}")
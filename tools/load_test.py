@@ -0,0 +1,174 @@
+"""
+LLM Load-Test Harness
+Drives concurrent simulated users through Interview Prep, Mock Interview, Project Ideas
+and Learning Path against the stub LLM server and reports throughput and latency.
+
+Usage:
+    python tools/load_test.py --users 20 --iterations 10
+    python tools/load_test.py --target http://127.0.0.1:8765 --backend openai
+
+Without --target a stub server is started in-process with the given --latency / --error-rate.
+Runs against a temporary database; the app's own database is never touched.
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+ROLES = ["Software Engineer", "Data Scientist", "DevOps Engineer", "Frontend Developer"]
+LEVELS = ["Entry Level", "Intermediate", "Senior"]
+SKILLS = ["python", "react", "docker", "kubernetes", "sql", "aws", "go", "machine learning"]
+ANSWERS = [
+    "I led the migration of our monolith to services, which cut deploy time in half.",
+    "I usually start by reproducing the bug, then bisect recent changes.",
+    "In my last role I mentored two juniors and ran our weekly design reviews. " * 8,
+]
+
+
+def percentile(samples, q):
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class Scenarios:
+    """One simulated user action per method; imports happen after env is configured."""
+
+    def __init__(self, same_prompt: bool, use_bank: bool = False):
+        from modules.interview_prep import interview_coach
+        from modules.mock_interview import mock_interviewer, InterviewContext
+        from modules.project_recommender import project_recommender
+        from modules.course_aggregator import course_aggregator
+
+        self.interview_coach = interview_coach
+        self.mock_interviewer = mock_interviewer
+        self.context_cls = InterviewContext
+        self.project_recommender = project_recommender
+        self.course_aggregator = course_aggregator
+        self.same_prompt = same_prompt
+        self.use_bank = use_bank
+
+    def _pick(self, options, k=None):
+        if self.same_prompt:
+            return options[:k] if k else options[0]
+        return random.sample(options, k) if k else random.choice(options)
+
+    def interview_prep(self):
+        # The question bank answers repeated (and curated) prompts without the AI; bypass it unless asked
+        return self.interview_coach.generate_questions(self._pick(ROLES), self._pick(SKILLS, 3), self._pick(LEVELS),
+                                                       use_bank=self.use_bank)
+
+    def mock_interview(self, turns=4):
+        context = self.context_cls()
+        history = [{"role": "assistant", "content": "Tell me about yourself."}]
+        for _ in range(turns):
+            answer = random.choice(ANSWERS)
+            reply = self.mock_interviewer.get_response(history, answer, context)
+            history += [{"role": "user", "content": answer}, {"role": "assistant", "content": reply}]
+        return reply
+
+    def project_ideas(self):
+        return self.project_recommender.get_recommendations(self._pick(SKILLS, 3))
+
+    def learning_path(self):
+        return self.course_aggregator.get_learning_path(self._pick(SKILLS, 3))
+
+
+def run(args):
+    server = None
+    target = args.target
+    if not target:
+        from stub_llm_server import start_in_thread
+        server = start_in_thread(latency=args.latency, error_rate=args.error_rate)
+        target = f"http://127.0.0.1:{server.server_address[1]}"
+    target = target.rstrip("/")
+
+    # Must be set before config / llm_wrapper are imported
+    os.environ["POLLINATIONS_BASE_URL"] = target + "/"
+    if args.backend == "openai":
+        os.environ["OPENAI_API_KEY"] = "sk-stub"
+        os.environ["OPENAI_BASE_URL"] = target + "/v1"
+
+    from config import APIKeys, Settings
+    if args.backend == "pollinations":
+        APIKeys.OPENAI_API_KEY = ""
+    # Question bank and analysis results written by the scenarios stay out of the real database
+    Settings.DB_PATH = os.path.join(tempfile.mkdtemp(prefix="load_test_"), "load_test.db")
+    from app_utils import llm_wrapper
+
+    requests.post(target + "/stats/reset", timeout=5)
+    scenarios = Scenarios(args.same_prompt, args.question_bank)
+    names = [n for n in args.scenarios.split(",") if n]
+    latencies = {n: [] for n in names}
+    errors = {n: 0 for n in names}
+    lock = threading.Lock()
+
+    def user(uid):
+        for i in range(args.iterations):
+            name = names[(uid + i) % len(names)]
+            started = time.perf_counter()
+            try:
+                getattr(scenarios, name)()
+                ok = True
+            except Exception as e:
+                ok = False
+                print(f"[user {uid}] {name} failed: {e}")
+            elapsed = time.perf_counter() - started
+            with lock:
+                latencies[name].append(elapsed)
+                errors[name] += int(not ok)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.users) as pool:
+        list(pool.map(user, range(args.users)))
+    wall = time.perf_counter() - started
+
+    upstream = requests.get(target + "/stats", timeout=5).json()
+    total = sum(len(v) for v in latencies.values())
+
+    print(f"\n{args.users} users x {args.iterations} actions against {target} ({args.backend})")
+    print(f"{'scenario':<16}{'count':>7}{'errors':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for name in names:
+        samples = latencies[name]
+        print(f"{name:<16}{len(samples):>7}{errors[name]:>8}"
+              f"{percentile(samples, 0.50) * 1000:>10.0f}{percentile(samples, 0.95) * 1000:>10.0f}{percentile(samples, 0.99) * 1000:>10.0f}")
+    print(f"\nthroughput: {total / wall:.1f} actions/s over {wall:.1f}s")
+    print(f"upstream requests: {upstream['requests']} (errors {upstream['errors']}, streamed {upstream['streams']})")
+    print(f"coalescing: {llm_wrapper.get_coalescing_stats()}")
+    print(f"hedging: {llm_wrapper.get_hedge_stats()}")
+    for health in llm_wrapper.get_backend_health():
+        print(f"backend: {health}")
+
+    if server:
+        server.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent load test for the LLM-backed modules")
+    parser.add_argument("--target", help="base URL of a running stub server (default: start one in-process)")
+    parser.add_argument("--backend", choices=["pollinations", "openai"], default="pollinations")
+    parser.add_argument("--users", type=int, default=10)
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--scenarios", default="interview_prep,mock_interview,project_ideas,learning_path")
+    parser.add_argument("--same-prompt", action="store_true", help="all users send identical prompts (exercises coalescing)")
+    parser.add_argument("--question-bank", action="store_true",
+                        help="let interview_prep answer from the question bank (measures bank hits, not the AI)")
+    parser.add_argument("--latency", default="lognormal:-1.5,0.5", help="in-process stub latency distribution")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="in-process stub error rate")
+    run(parser.parse_args())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+"""
+Local Stub GitHub API Server
+Serves deterministic users, repositories and per-repo language byte counts
+in the GitHub REST shape, with ETag / If-None-Match (304) support, Link-header
+pagination and an X-RateLimit quota that answers 403 once exhausted, like
+api.github.com.
+
+Usage:
+    python tools/stub_github_server.py --port 8766 --repos 120 --rate-limit 60
+
+Then point the app at it:
+    GITHUB_API_URL=http://127.0.0.1:8766
+
+Any username exists except "ghost" (404). GET /stats returns request counters,
+POST /stats/reset clears them and refills the quota.
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+LANGUAGES = ["Python", "JavaScript", "TypeScript", "Go", "Rust", "Java", "C++", "Shell"]
+TOPICS = ["machine-learning", "web", "cli", "api", "devops", "data", "react", "django", "kubernetes", "automation"]
+
+
+def repo_languages(full_name: str) -> dict:
+    """Deterministic language byte counts for a repository."""
+    rng = random.Random(full_name)
+    return {lang: rng.randint(1000, 500000) for lang in rng.sample(LANGUAGES, rng.randint(1, 4))}
+
+
+def make_repos(username: str, count: int) -> list:
+    """Deterministic repositories for a user, most recently pushed first."""
+    rng = random.Random(username)
+    repos = []
+    for i in range(count):
+        name = f"{username}-project-{i + 1}"
+        language = rng.choice(LANGUAGES) if rng.random() > 0.1 else None
+        repos.append({
+            "id": rng.randint(1, 10 ** 9),
+            "name": name,
+            "full_name": f"{username}/{name}",
+            "html_url": f"https://github.com/{username}/{name}",
+            "description": f"A {language or 'misc'} project that does something useful for {username}." if rng.random() > 0.3 else None,
+            "fork": rng.random() < 0.15,
+            "language": language,
+            "topics": rng.sample(TOPICS, rng.randint(0, 3)),
+            "stargazers_count": int(rng.expovariate(0.2)),
+            "forks_count": int(rng.expovariate(0.5)),
+            "pushed_at": f"2026-{(i % 12) + 1:02d}-{(i % 27) + 1:02d}T12:00:00Z",
+            "size": rng.randint(10, 5000),  # KB
+        })
+    return repos
+
+
+class StubState:
+    def __init__(self, repo_count, rate_limit, window, latency):
+        self.repo_count = repo_count
+        self.rate_limit = rate_limit
+        self.window = window
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.remaining = self.rate_limit
+            self.reset_at = int(time.time() + self.window)
+            self.requests = 0
+            self.not_modified = 0
+            self.rejected = 0
+            self.by_path = {}
+
+    def take(self, path, conditional_hit):
+        """Charge one request against the quota; returns False when exhausted."""
+        with self.lock:
+            if time.time() >= self.reset_at:
+                self.remaining = self.rate_limit
+                self.reset_at = int(time.time() + self.window)
+            self.requests += 1
+            key = re.sub(r"/users/[^/]+|/repos/[^/]+/[^/]+", lambda m: "/" + m.group(0).split("/")[1] + "/*", path)
+            self.by_path[key] = self.by_path.get(key, 0) + 1
+            if conditional_hit:
+                # Like GitHub, a 304 does not use quota
+                self.not_modified += 1
+                return True
+            if self.remaining <= 0:
+                self.rejected += 1
+                return False
+            self.remaining -= 1
+            return True
+
+    def snapshot(self):
+        with self.lock:
+            return {"requests": self.requests, "not_modified": self.not_modified, "rejected": self.rejected,
+                    "remaining": self.remaining, "by_path": dict(self.by_path)}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    state: StubState = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        if self.path.rstrip("/") == "/stats/reset":
+            self.state.reset()
+            return self._send(200, {"ok": True})
+        self._send(404, {"message": "Not Found"})
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        path = parsed.path.rstrip("/")
+        query = {k: v[-1] for k, v in parse_qs(parsed.query).items()}
+        if path == "/stats":
+            return self._send(200, self.state.snapshot())
+
+        status, body, headers = self._route(path, query)
+        if status == 404:
+            return self._send(404, {"message": "Not Found"})
+        data = json.dumps(body).encode("utf-8")
+        etag = '"' + hashlib.sha1(data).hexdigest() + '"'
+        conditional_hit = self.headers.get("If-None-Match") == etag
+
+        if self.state.latency:
+            time.sleep(self.state.latency)
+        if not self.state.take(path, conditional_hit):
+            return self._send(403, {"message": "API rate limit exceeded for 127.0.0.1."})
+        if conditional_hit:
+            return self._send(304, None, {"ETag": etag})
+        self._send(200, body, dict(headers, ETag=etag))
+
+    def _route(self, path, query):
+        match = re.fullmatch(r"/repos/([^/]+)/([^/]+)/languages", path)
+        if match:
+            return 200, repo_languages(f"{match.group(1)}/{match.group(2)}"), {}
+        match = re.fullmatch(r"/users/([^/]+)(/repos)?", path)
+        if not match or match.group(1).lower() == "ghost":
+            return 404, None, {}
+        username = match.group(1)
+        repos = make_repos(username, self.state.repo_count)
+        if not match.group(2):
+            return 200, {
+                "login": username,
+                "name": username.title(),
+                "bio": "Stub profile",
+                "public_repos": len(repos),
+                "followers": len(username) * 7,
+                "avatar_url": "https://avatars.githubusercontent.com/u/0",
+                "html_url": f"https://github.com/{username}",
+                "created_at": "2018-05-01T00:00:00Z",
+            }, {}
+
+        per_page = min(100, int(query.get("per_page", 30)))
+        page = max(1, int(query.get("page", 1)))
+        last = max(1, -(-len(repos) // per_page))
+        headers = {}
+        if page < last:
+            base = f"http://{self.headers.get('Host')}/users/{username}/repos"
+            params = {k: v for k, v in query.items() if k != "page"}
+            make = lambda n: base + "?" + "&".join(f"{k}={v}" for k, v in dict(params, page=n).items())
+            headers["Link"] = f'<{make(page + 1)}>; rel="next", <{make(last)}>; rel="last"'
+        return 200, repos[(page - 1) * per_page:page * per_page], headers
+
+    def _send(self, status, payload, headers=None):
+        data = b"" if payload is None else json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        with self.state.lock:
+            self.send_header("X-RateLimit-Limit", str(self.state.rate_limit))
+            self.send_header("X-RateLimit-Remaining", str(self.state.remaining))
+            self.send_header("X-RateLimit-Reset", str(self.state.reset_at))
+            self.send_header("X-RateLimit-Used", str(self.state.rate_limit - self.state.remaining))
+        self.send_header("X-RateLimit-Resource", "core")
+        if payload is not None:
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def make_server(host="127.0.0.1", port=0, repos=45, rate_limit=60, window=3600, latency=0.0) -> ThreadingHTTPServer:
+    """Build (but do not start) a stub server; port=0 picks a free port."""
+    state = StubState(repos, rate_limit, window, latency)
+    handler = type("BoundStubHandler", (StubHandler,), {"state": state})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    server.state = state
+    return server
+
+
+def start_in_thread(**kwargs) -> ThreadingHTTPServer:
+    """Start a stub server on a background thread."""
+    server = make_server(**kwargs)
+    threading.Thread(target=server.serve_forever, daemon=True, name="stub-github").start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GitHub REST API stub server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--repos", type=int, default=45, help="repositories per user")
+    parser.add_argument("--rate-limit", type=int, default=60, help="requests per window (GitHub anonymous: 60/hour)")
+    parser.add_argument("--window", type=int, default=3600, help="rate-limit window in seconds")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    args = parser.parse_args()
+
+    server = make_server(args.host, args.port, args.repos, args.rate_limit, args.window, args.latency)
+    print(f"Stub GitHub API on http://{args.host}:{server.server_address[1]} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
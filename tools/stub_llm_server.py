@@ -0,0 +1,274 @@
+"""
+Local Stub LLM Server
+Speaks the Pollinations POST shape (POST /) and the OpenAI chat-completions shape
+(POST /v1/chat/completions), with configurable latency, error rate and streaming.
+Canned payloads match what the app's LLM-backed modules expect to parse.
+
+Usage:
+    python tools/stub_llm_server.py --port 8765 --latency lognormal:-1.2,0.5 --error-rate 0.02
+
+Then point the app at it:
+    POLLINATIONS_BASE_URL=http://127.0.0.1:8765/
+    OPENAI_BASE_URL=http://127.0.0.1:8765/v1   (with any OPENAI_API_KEY=sk-...)
+
+GET /stats returns request counters, POST /stats/reset clears them.
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def parse_latency(spec: str):
+    """
+    Latency distribution spec -> callable returning seconds.
+    fixed:0.2 | uniform:0.1,0.8 | normal:0.4,0.1 | lognormal:mu,sigma
+    """
+    kind, _, args = spec.partition(":")
+    values = [float(v) for v in args.split(",") if v] if args else []
+    if kind == "fixed":
+        return lambda: values[0] if values else 0.0
+    if kind == "uniform":
+        return lambda: random.uniform(values[0], values[1])
+    if kind == "normal":
+        return lambda: max(0.0, random.gauss(values[0], values[1]))
+    if kind == "lognormal":
+        return lambda: random.lognormvariate(values[0], values[1])
+    raise ValueError(f"Unknown latency distribution: {spec}")
+
+
+def canned_response(prompt: str, payloads: dict) -> str:
+    """Pick a response shaped like what the calling module expects."""
+    lowered = prompt.lower()
+    for keyword, response in payloads.items():
+        if keyword.lower() in lowered:
+            return response if isinstance(response, str) else json.dumps(response)
+
+    if "running summary of a job interview" in lowered:
+        return "The candidate described their background in backend development and a caching project that cut latency by 30%."
+
+    if "interview questions" in lowered and '"category"' in lowered:
+        skills = re.search(r"these skills: ([^\n]+?)\.\s*\n", prompt)
+        skill_list = [s.strip() for s in skills.group(1).split(",")] if skills else ["python"]
+        count = re.search(r"Generate (\d+) interview questions", prompt)
+        items = []
+        for i in range(int(count.group(1)) if count else 5):
+            skill = skill_list[i % len(skill_list)]
+            items.append({"question": f"How have you used {skill} in production? (variant {random.randint(1, 10 ** 6)})",
+                          "category": "Technical", "skill": skill})
+        return json.dumps(items)
+
+    if "interview questions" in lowered:
+        return json.dumps([
+            "Explain how you would design a rate limiter.",
+            "How does Python manage memory?",
+            "Tell me about a time you disagreed with a teammate.",
+            "Describe a project that failed and what you learned.",
+            "What kind of team culture helps you do your best work?",
+        ])
+
+    if "portfolio project ideas" in lowered:
+        skills = re.search(r"these specific skills: ([^\n.]+)", prompt)
+        skill_list = [s.strip() for s in skills.group(1).split(",")] if skills else ["Python"]
+        return json.dumps([
+            {
+                "name": f"{skill} Showcase Project {i + 1}",
+                "description": f"A non-trivial application built around {skill}.",
+                "difficulty": "Intermediate" if i % 2 else "Advanced",
+                "skills": [skill, "Docker"],
+            }
+            for i, skill in enumerate(skill_list[:5])
+        ])
+
+    if "learning resources for this skill:" in lowered:
+        skill = re.search(r"for this skill: (.+?)\.\s*\n", prompt)
+        skill = skill.group(1).strip() if skill else "Python"
+        return json.dumps([
+            {"title": f"Learn {skill}", "url": f"https://www.youtube.com/results?search_query=learn+{skill}", "platform": "YouTube", "type": "Video"},
+            {"title": f"{skill} Guide", "url": f"https://www.google.com/search?q={skill}+guide", "platform": "Google", "type": "Article"},
+        ])
+
+    if "learning resources" in lowered:
+        skills = re.search(r"For each of these skills: (.+?), provide", prompt)
+        skill_list = [s.strip() for s in skills.group(1).split(",")] if skills else ["Python"]
+        return json.dumps({
+            skill: [
+                {"title": f"Learn {skill}", "url": f"https://www.youtube.com/results?search_query=learn+{skill}", "platform": "YouTube", "type": "Video"},
+                {"title": f"{skill} Guide", "url": f"https://www.google.com/search?q={skill}+guide", "platform": "Google", "type": "Article"},
+            ]
+            for skill in skill_list
+        })
+
+    if "model answer" in lowered:
+        return "**Situation:** A slow deploy pipeline.\n**Task:** Speed it up.\n**Action:** Added caching.\n**Result:** 40% faster builds."
+
+    return "Thanks for sharing that. Can you walk me through a specific example and the impact it had?"
+
+
+class StubState:
+    def __init__(self, latency, error_rate, chunk_size, chunk_delay, payloads):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.chunk_size = chunk_size
+        self.chunk_delay = chunk_delay
+        self.payloads = payloads
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.requests = 0
+            self.errors = 0
+            self.streams = 0
+            self.by_path = {}
+
+    def count(self, path, error=False, stream=False):
+        with self.lock:
+            self.requests += 1
+            self.errors += int(error)
+            self.streams += int(stream)
+            self.by_path[path] = self.by_path.get(path, 0) + 1
+
+    def snapshot(self):
+        with self.lock:
+            return {"requests": self.requests, "errors": self.errors, "streams": self.streams, "by_path": dict(self.by_path)}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    state: StubState = None
+
+    def log_message(self, format, *args):
+        pass  # keep load-test output readable
+
+    def do_GET(self):
+        if self.path.rstrip("/") == "/stats":
+            return self._send_json(200, self.state.snapshot())
+        self._send_json(404, {"error": "not found"})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length) or b"{}")
+
+        if self.path.rstrip("/") == "/stats/reset":
+            self.state.reset()
+            return self._send_json(200, {"ok": True})
+
+        openai_shape = self.path.rstrip("/").endswith("/chat/completions")
+        if not openai_shape and self.path not in ("/", ""):
+            return self._send_json(404, {"error": "not found"})
+
+        stream = bool(body.get("stream"))
+        time.sleep(self.state.latency())
+
+        if random.random() < self.state.error_rate:
+            self.state.count(self.path, error=True)
+            return self._send_json(503, {"error": "stub: injected failure"})
+        self.state.count(self.path, stream=stream)
+
+        messages = body.get("messages") or []
+        prompt = messages[-1]["content"] if messages else ""
+        text = canned_response(prompt, self.state.payloads)
+
+        if stream:
+            return self._send_stream(text, body.get("model", "stub"))
+        if openai_shape:
+            return self._send_json(200, {
+                "id": "chatcmpl-stub",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": body.get("model", "stub"),
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": text}, "finish_reason": "stop"}],
+                "usage": {"prompt_tokens": len(prompt) // 4, "completion_tokens": len(text) // 4, "total_tokens": (len(prompt) + len(text)) // 4},
+            })
+
+        data = text.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_json(self, status, payload):
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_stream(self, text, model):
+        """OpenAI-style server-sent events, used by both shapes when stream=true."""
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+
+        size = self.state.chunk_size
+        for i in range(0, len(text), size):
+            event = {
+                "id": "chatcmpl-stub",
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [{"index": 0, "delta": {"content": text[i:i + size]}, "finish_reason": None}],
+            }
+            self.wfile.write(f"data: {json.dumps(event)}\n\n".encode("utf-8"))
+            self.wfile.flush()
+            if self.state.chunk_delay:
+                time.sleep(self.state.chunk_delay)
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.wfile.flush()
+
+
+def make_server(host="127.0.0.1", port=0, latency="fixed:0.05", error_rate=0.0,
+                chunk_size=16, chunk_delay=0.0, payloads=None) -> ThreadingHTTPServer:
+    """Build (but do not start) a stub server; port=0 picks a free port."""
+    state = StubState(parse_latency(latency), error_rate, chunk_size, chunk_delay, payloads or {})
+    handler = type("BoundStubHandler", (StubHandler,), {"state": state})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    server.state = state
+    return server
+
+
+def start_in_thread(**kwargs) -> ThreadingHTTPServer:
+    """Start a stub server on a background thread (used by the load-test harness)."""
+    server = make_server(**kwargs)
+    threading.Thread(target=server.serve_forever, daemon=True, name="stub-llm").start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OpenAI/Pollinations-compatible stub LLM server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", default="fixed:0.05", help="fixed:S | uniform:A,B | normal:MU,SD | lognormal:MU,SIGMA")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with 503")
+    parser.add_argument("--chunk-size", type=int, default=16, help="characters per streamed chunk")
+    parser.add_argument("--chunk-delay", type=float, default=0.0, help="seconds between streamed chunks")
+    parser.add_argument("--payloads", help="JSON file mapping prompt keyword -> canned response")
+    args = parser.parse_args()
+
+    payloads = {}
+    if args.payloads:
+        with open(args.payloads, "r", encoding="utf-8") as f:
+            payloads = json.load(f)
+
+    server = make_server(args.host, args.port, args.latency, args.error_rate,
+                         args.chunk_size, args.chunk_delay, payloads)
+    print(f"Stub LLM server on http://{args.host}:{server.server_address[1]}/ (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()